@@ -1,12 +1,22 @@
+import argparse
+import contextlib
+import contextvars
 import os
+import random
 import re
+import subprocess
 import sys
 import json
+import logging
+import queue
 import threading
 import time
 import traceback
 import tkinter as tk
-from dataclasses import dataclass
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from tkinter import filedialog, messagebox
 
@@ -42,6 +52,10 @@ def get_desktop_path() -> Path:
 
 
 ERROR_LOG_PATH = get_desktop_path() / "Burn_SQ_CT_Series_error.log"
+BURN_LOG_PATH = get_desktop_path() / "Burn_SQ_CT_Series_log.jsonl"
+LOG_POLL_MS = 100
+LOG_BATCH_SIZE = 500
+MAX_LOG_WIDGET_LINES = 5000
 
 
 @dataclass
@@ -52,6 +66,20 @@ class BurnJob:
     chip_types: list[str]
     burn_exe_path: Path
     ct_search_root: Path
+    targets: list[str] = field(default_factory=list)
+    max_retries: int = 1
+    max_target_failures: int = 2
+    config_path: Path | None = None
+    resume: bool = False
+
+    backend: str = "pywinauto"
+    backend_options: dict = field(default_factory=dict)
+    ct_match_rules: list[str] = field(default_factory=list)
+    ct_preferred_subdirs: list[str] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        if not self.targets:
+            self.targets = [self.ip_address]
 
 
 def _resolve_path(path_text: str, base_dir: Path) -> Path:
@@ -61,7 +89,12 @@ def _resolve_path(path_text: str, base_dir: Path) -> Path:
     return (base_dir / raw_path).resolve()
 
 
-def load_job_from_json(config_path: Path) -> BurnJob:
+def load_job_from_json(config_path: Path, base_dir: Path | None = None) -> BurnJob:
+    """Read and validate a burn config.
+
+    Relative paths in it resolve against ``base_dir``, by default the
+    directory of the config file.
+    """
     try:
         config_data = json.loads(config_path.read_text(encoding="utf-8"))
     except Exception as error:
@@ -79,8 +112,41 @@ def load_job_from_json(config_path: Path) -> BurnJob:
             raise RuntimeError(f"JSON key '{key}' cannot be empty.")
         return value_text
 
-    config_dir = config_path.parent
-    ip_address = require_text("ip_address")
+    def read_count(key: str, default: int) -> int:
+        try:
+            value = int(config_data.get(key, default))
+        except Exception as error:
+            raise RuntimeError(f"JSON key '{key}' must be an integer.") from error
+        if value < 0:
+            raise RuntimeError(f"JSON key '{key}' must be >= 0.")
+        return value
+
+    config_dir = config_path.parent if base_dir is None else base_dir
+
+    targets: list[str] = []
+    targets_value = config_data.get("targets")
+    if targets_value is not None:
+        if not isinstance(targets_value, list):
+            raise RuntimeError("JSON key 'targets' must be an array of IP addresses.")
+
+        for item in targets_value:
+            if isinstance(item, dict):
+                item = item.get("ip_address", "")
+            item_text = str(item).strip()
+            if item_text and item_text not in targets:
+                targets.append(item_text)
+
+        if not targets:
+            raise RuntimeError("JSON key 'targets' is present but empty.")
+        ip_address = targets[0]
+    else:
+        ip_address = require_text("ip_address")
+        targets = [ip_address]
+
+    max_retries = read_count("max_retries", 1)
+    max_target_failures = read_count("max_target_failures", 2)
+    if max_target_failures < 1:
+        raise RuntimeError("JSON key 'max_target_failures' must be >= 1.")
 
     try:
         starting_index = int(config_data.get("starting_index"))
@@ -96,6 +162,25 @@ def load_job_from_json(config_path: Path) -> BurnJob:
     burn_exe_path = _resolve_path(burn_exe_text, config_dir)
     ct_search_root = _resolve_path(ct_root_text, config_dir)
 
+    backend_name = str(config_data.get("backend", PywinautoBurnerBackend.name)).strip()
+    if backend_name not in BURNER_BACKENDS:
+        raise RuntimeError(f"JSON key 'backend' must be one of: {', '.join(BURNER_BACKENDS)}")
+    backend_options = config_data.get("backend_options", {})
+    if not isinstance(backend_options, dict):
+        raise RuntimeError("JSON key 'backend_options' must be an object.")
+
+    def read_text_list(key: str) -> list[str]:
+        value = config_data.get(key, [])
+        if not isinstance(value, list):
+            raise RuntimeError(f"JSON key '{key}' must be an array of strings.")
+        return [str(item).strip() for item in value if str(item).strip()]
+
+    ct_match_rules = read_text_list("ct_match_rules")
+    for rule in ct_match_rules:
+        if rule not in CT_MATCH_RULES:
+            raise RuntimeError(f"JSON key 'ct_match_rules' entries must be one of: {', '.join(CT_MATCH_RULES)}")
+    ct_preferred_subdirs = read_text_list("ct_preferred_subdirs")
+
     chip_types: list[str] = []
     list_file_path: Path | None = None
 
@@ -117,7 +202,7 @@ def load_job_from_json(config_path: Path) -> BurnJob:
             raise RuntimeError(f"chip_list_file not found: {list_file_path}")
         chip_types = parse_chip_types(list_file_path)
 
-    if not burn_exe_path.exists() or not burn_exe_path.is_file():
+    if backend_name == PywinautoBurnerBackend.name and (not burn_exe_path.exists() or not burn_exe_path.is_file()):
         raise RuntimeError(f"burn_exe_path not found: {burn_exe_path}")
     if not ct_search_root.exists() or not ct_search_root.is_dir():
         raise RuntimeError(f"ct_search_root not found: {ct_search_root}")
@@ -129,6 +214,14 @@ def load_job_from_json(config_path: Path) -> BurnJob:
         chip_types=chip_types,
         burn_exe_path=burn_exe_path,
         ct_search_root=ct_search_root,
+        targets=targets,
+        max_retries=max_retries,
+        max_target_failures=max_target_failures,
+        config_path=config_path,
+        backend=backend_name,
+        backend_options=backend_options,
+        ct_match_rules=ct_match_rules,
+        ct_preferred_subdirs=ct_preferred_subdirs,
     )
 
 
@@ -146,7 +239,7 @@ def relaunch_as_admin() -> None:
         raise RuntimeError("ctypes is unavailable; cannot elevate privileges.")
 
     script = str(Path(__file__).resolve())
-    params = f'"{script}"'
+    params = subprocess.list2cmdline([script, *sys.argv[1:]])
     result = ctypes.windll.shell32.ShellExecuteW(None, "runas", sys.executable, params, None, 1)
     if result <= 32:
         raise RuntimeError("Administrator elevation was denied or failed.")
@@ -169,186 +262,563 @@ def parse_chip_types(list_file_path: Path) -> list[str]:
     return chip_types
 
 
-def find_ct_file(chip_type: str, root_path: Path) -> Path:
-    if not root_path.exists():
-        raise FileNotFoundError(f"CT search root not found: {root_path}")
+CT_MATCH_RULES = ("preferred_subdir", "exact_length", "newest_mtime")
 
-    def normalize_token(value: str) -> str:
-        return re.sub(r"[^a-z0-9]", "", value.lower())
 
-    chip_raw = chip_type.strip().strip('"').strip("'")
-    chip_lower = chip_raw.lower()
-    chip_norm = normalize_token(chip_raw)
+def _normalize_token(value: str) -> str:
+    return re.sub(r"[^a-z0-9]", "", value.lower())
 
-    all_ct_files = [
-        path
-        for path in root_path.rglob("*")
-        if path.is_file() and path.suffix.lower() == ".ct"
-    ]
 
-    if not all_ct_files:
-        raise FileNotFoundError(f"No .ct files found under {root_path}")
+@dataclass
+class CtFileEntry:
+    path: Path
+    stem_lower: str
+    stem_norm: str
+    subdirs: tuple[str, ...]
+    mtime: float
+
+
+class CtFileIndex:
+    """Precomputed lookup table of the .ct files under a search root.
+
+    The tree is walked once. Exact stems are resolved through dictionaries and
+    fuzzy (substring) matches through a trigram index over normalized stems,
+    so a lookup no longer touches every file.
+    """
+
+    def __init__(self, root_path: Path, entries: list[CtFileEntry]) -> None:
+        self.root_path = root_path
+        self.entries = entries
+        self._by_lower: dict[str, list[int]] = {}
+        self._by_norm: dict[str, list[int]] = {}
+        self._trigrams: dict[str, set[int]] = {}
+
+        for entry_id, entry in enumerate(entries):
+            self._by_lower.setdefault(entry.stem_lower, []).append(entry_id)
+            self._by_norm.setdefault(entry.stem_norm, []).append(entry_id)
+            for start in range(len(entry.stem_norm) - 2):
+                self._trigrams.setdefault(entry.stem_norm[start:start + 3], set()).add(entry_id)
+
+    @classmethod
+    def build(cls, root_path: Path) -> "CtFileIndex":
+        if not root_path.exists():
+            raise FileNotFoundError(f"CT search root not found: {root_path}")
+
+        entries: list[CtFileEntry] = []
+        for path in root_path.rglob("*"):
+            if path.suffix.lower() != ".ct" or not path.is_file():
+                continue
+            try:
+                mtime = path.stat().st_mtime
+            except OSError:
+                mtime = 0.0
+            entries.append(
+                CtFileEntry(
+                    path=path,
+                    stem_lower=path.stem.lower(),
+                    stem_norm=_normalize_token(path.stem),
+                    subdirs=tuple(part.lower() for part in path.relative_to(root_path).parts[:-1]),
+                    mtime=mtime,
+                )
+            )
+        return cls(root_path, entries)
+
+    def _contains_ids(self, chip_norm: str) -> list[int]:
+        if len(chip_norm) < 3:
+            return [
+                entry_id
+                for entry_id, entry in enumerate(self.entries)
+                if chip_norm in entry.stem_norm
+            ]
+
+        postings = []
+        for start in range(len(chip_norm) - 2):
+            posting = self._trigrams.get(chip_norm[start:start + 3])
+            if not posting:
+                return []
+            postings.append(posting)
+        postings.sort(key=len)
+
+        candidate_ids = set(postings[0])
+        for posting in postings[1:]:
+            candidate_ids &= posting
+        return sorted(entry_id for entry_id in candidate_ids if chip_norm in self.entries[entry_id].stem_norm)
+
+    def ranked_candidates(self, chip_type: str) -> list[tuple[float, Path]]:
+        """Substring matches for a chip type, best first, with a 0..1 score."""
+        chip_norm = _normalize_token(chip_type.strip().strip('"').strip("'"))
+        ranked = []
+        for entry_id in self._contains_ids(chip_norm):
+            entry = self.entries[entry_id]
+            score = len(chip_norm) / len(entry.stem_norm) if entry.stem_norm else 0.0
+            if entry.stem_norm.startswith(chip_norm):
+                score = (score + 1.0) / 2.0
+            ranked.append((round(score, 4), entry.path))
+        ranked.sort(key=lambda item: (-item[0], str(item[1]).lower()))
+        return ranked
+
+    def _rule_key(self, entry: CtFileEntry, chip_norm: str, rules, preferred_subdirs) -> tuple:
+        key = []
+        for rule in rules:
+            if rule == "preferred_subdir":
+                ranks = [
+                    position
+                    for position, subdir in enumerate(preferred_subdirs)
+                    if subdir.lower() in entry.subdirs
+                ]
+                key.append(min(ranks) if ranks else len(preferred_subdirs))
+            elif rule == "exact_length":
+                key.append(abs(len(entry.stem_norm) - len(chip_norm)))
+            elif rule == "newest_mtime":
+                key.append(-entry.mtime)
+            else:
+                raise ValueError(f"Unknown CT match rule: {rule}")
+        return tuple(key)
+
+    def find(self, chip_type: str, rules=(), preferred_subdirs=()) -> Path:
+        chip_raw = chip_type.strip().strip('"').strip("'")
+        chip_lower = chip_raw.lower()
+        chip_norm = _normalize_token(chip_raw)
+
+        if not self.entries:
+            raise FileNotFoundError(f"No .ct files found under {self.root_path}")
+
+        exact_ids = list(dict.fromkeys(self._by_lower.get(chip_lower, []) + self._by_norm.get(chip_norm, [])))
+        if exact_ids:
+            exact_stem = sorted(
+                (self.entries[entry_id].path for entry_id in exact_ids),
+                key=lambda item: (len(item.name), str(item).lower()),
+            )
+            return exact_stem[0]
+
+        contains_ids = self._contains_ids(chip_norm)
+        if not contains_ids:
+            raise FileNotFoundError(f"No .ct file found for chip type '{chip_raw}' in {self.root_path}")
+
+        if len(contains_ids) == 1:
+            return self.entries[contains_ids[0]].path
+
+        if rules:
+            keyed = sorted(
+                (self._rule_key(self.entries[entry_id], chip_norm, rules, preferred_subdirs), entry_id)
+                for entry_id in contains_ids
+            )
+            if keyed[0][0] != keyed[1][0]:
+                return self.entries[keyed[0][1]].path
+            contains_ids = [entry_id for key, entry_id in keyed if key == keyed[0][0]]
+
+        preview = "\n".join(sorted(str(self.entries[entry_id].path) for entry_id in contains_ids)[:10])
+        raise RuntimeError(
+            "Ambiguous CT file match for chip type "
+            f"'{chip_raw}'. Multiple candidates found:\n{preview}\n"
+            "Please rename files for exact match (stem == chip type), make chip type more specific "
+            f"or set ct_match_rules ({', '.join(CT_MATCH_RULES)})."
+        )
 
-    exact_stem = [
-        path
-        for path in all_ct_files
-        if path.stem.lower() == chip_lower or normalize_token(path.stem) == chip_norm
-    ]
-    if len(exact_stem) == 1:
-        return exact_stem[0]
-    if len(exact_stem) > 1:
-        exact_stem_sorted = sorted(exact_stem, key=lambda item: (len(item.name), str(item).lower()))
-        return exact_stem_sorted[0]
-
-    contains_match = [
-        path
-        for path in all_ct_files
-        if chip_lower in path.stem.lower() or chip_norm in normalize_token(path.stem)
-    ]
 
-    if not contains_match:
-        raise FileNotFoundError(f"No .ct file found for chip type '{chip_raw}' in {root_path}")
+_CT_INDEX_LOCK = threading.Lock()
+_CT_INDEXES: dict[Path, CtFileIndex] = {}
 
-    if len(contains_match) == 1:
-        return contains_match[0]
 
-    preview = "\n".join(str(path) for path in sorted(contains_match)[:10])
-    raise RuntimeError(
-        "Ambiguous CT file match for chip type "
-        f"'{chip_raw}'. Multiple candidates found:\n{preview}\n"
-        "Please rename files for exact match (stem == chip type) or make chip type more specific."
-    )
+def get_ct_index(root_path: Path, refresh: bool = False) -> CtFileIndex:
+    with _CT_INDEX_LOCK:
+        index = _CT_INDEXES.get(root_path)
+        if index is None or refresh:
+            index = CtFileIndex.build(root_path)
+            _CT_INDEXES[root_path] = index
+        return index
 
 
-def _find_edit_for_label(window, label_pattern: str):
-    labels = window.descendants(control_type="Text")
-    for label in labels:
-        label_text = label.window_text().strip()
-        if not re.search(label_pattern, label_text, flags=re.IGNORECASE):
-            continue
+def find_ct_file(chip_type: str, root_path: Path, rules=(), preferred_subdirs=(), index: CtFileIndex | None = None) -> Path:
+    if index is None:
+        index = CtFileIndex.build(root_path)
+    return index.find(chip_type, rules, preferred_subdirs)
 
-        rect = label.rectangle()
-        edits = window.descendants(control_type="Edit")
-        nearest_edit = None
-        nearest_distance = None
-        for edit in edits:
-            edit_rect = edit.rectangle()
-            if edit_rect.left < rect.left - 30:
-                continue
-            if abs(edit_rect.top - rect.top) > 80:
-                continue
-            distance = abs(edit_rect.left - rect.right) + abs(edit_rect.top - rect.top)
-            if nearest_distance is None or distance < nearest_distance:
-                nearest_distance = distance
-                nearest_edit = edit
 
-        if nearest_edit is not None:
-            return nearest_edit
-    return None
+@dataclass
+class ProfileSpan:
+    name: str
+    thread_id: int
+    thread_name: str
+    start: float
+    duration: float
+    args: dict
+
+
+class BurnProfiler:
+    """Collects timing spans and counters for one burn series.
+
+    Spans are cheap enough to leave on in production; the result can be
+    printed as a summary table or exported in Chrome trace-event format
+    (open it in chrome://tracing or https://ui.perfetto.dev).
+    """
+
+    def __init__(self) -> None:
+        self.spans: list[ProfileSpan] = []
+        self.counters: dict[str, int] = {}
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def span(self, name: str, **args):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            thread = threading.current_thread()
+            with self._lock:
+                self.spans.append(ProfileSpan(name, thread.ident or 0, thread.name, start, duration, args))
+
+    def count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def summary_rows(self) -> list[tuple[str, int, float, float, float]]:
+        grouped: dict[str, list[float]] = {}
+        with self._lock:
+            for span in self.spans:
+                grouped.setdefault(span.name, []).append(span.duration)
+
+        rows = [
+            (name, len(durations), sum(durations), sum(durations) / len(durations), max(durations))
+            for name, durations in grouped.items()
+        ]
+        rows.sort(key=lambda row: row[2], reverse=True)
+        return rows
+
+    def format_summary(self) -> str:
+        rows = self.summary_rows()
+        name_width = max([len("Phase")] + [len(row[0]) for row in rows])
+        lines = [
+            f"{'Phase':<{name_width}}  {'Calls':>6}  {'Total s':>9}  {'Mean s':>8}  {'Max s':>8}",
+            "-" * (name_width + 41),
+        ]
+        for name, calls, total, mean, longest in rows:
+            lines.append(f"{name:<{name_width}}  {calls:>6}  {total:>9.3f}  {mean:>8.3f}  {longest:>8.3f}")
+
+        with self._lock:
+            counters = sorted(self.counters.items())
+        if counters:
+            lines.append("")
+            lines.extend(f"{name}: {value}" for name, value in counters)
+        return "\n".join(lines)
+
+    def chrome_trace(self) -> dict:
+        events: list[dict] = []
+        thread_names: dict[int, str] = {}
+        pid = os.getpid()
+
+        with self._lock:
+            spans = list(self.spans)
+            counters = dict(self.counters)
+
+        for span in spans:
+            thread_names[span.thread_id] = span.thread_name
+            events.append(
+                {
+                    "name": span.name,
+                    "ph": "X",
+                    "pid": pid,
+                    "tid": span.thread_id,
+                    "ts": round((span.start - self._origin) * 1_000_000),
+                    "dur": round(span.duration * 1_000_000),
+                    "args": span.args,
+                }
+            )
+        for thread_id, thread_name in thread_names.items():
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": thread_id, "args": {"name": thread_name}})
+
+        return {"traceEvents": events, "displayTimeUnit": "ms", "otherData": {"counters": counters}}
+
+    def write_chrome_trace(self, path: Path) -> None:
+        temp_path = path.with_name(path.name + ".tmp")
+        temp_path.write_text(json.dumps(self.chrome_trace()), encoding="utf-8")
+        os.replace(temp_path, path)
+
+
+# Per run, so overlapping series (daemon jobs, GUI runs) each time only
+# their own phases; scheduler workers start in a copy of the run's context.
+_ACTIVE_PROFILER: contextvars.ContextVar[BurnProfiler | None] = contextvars.ContextVar("burn_profiler", default=None)
+
+
+def _span(name: str, **args):
+    profiler = _ACTIVE_PROFILER.get()
+    if profiler is None:
+        return contextlib.nullcontext()
+    return profiler.span(name, **args)
+
+
+def _count(name: str, amount: int = 1) -> None:
+    profiler = _ACTIVE_PROFILER.get()
+    if profiler is not None:
+        profiler.count(name, amount)
 
 
-def _find_edit_for_file_name_field(window):
-    labels = window.descendants(control_type="Text")
-    preferred = []
-    fallback = []
+def _normalize_label(text: str) -> str:
+    return re.sub(r"\s+", " ", text.strip().rstrip(":" )).lower()
 
-    for label in labels:
-        label_text = label.window_text().strip()
-        normalized = re.sub(r"\s+", " ", label_text.lower())
 
-        if "file name" not in normalized:
-            continue
-        if "log" in normalized:
-            continue
+_CONTROL_MAP_TYPES = ("Text", "Edit", "ComboBox")
+_CONTROL_MAP_LOCK = threading.Lock()
+_CONTROL_MAPS: dict[int, tuple[object, "BurnControlMap"]] = {}
+_LAYOUT_RESOLUTIONS: dict[tuple, dict[tuple, object]] = {}
 
-        rect = label.rectangle()
-        edits = window.descendants(control_type="Edit")
-        nearest_edit = None
-        nearest_distance = None
-        for edit in edits:
-            edit_rect = edit.rectangle()
-            if edit_rect.left < rect.left - 30:
-                continue
-            if abs(edit_rect.top - rect.top) > 80:
-                continue
-            distance = abs(edit_rect.left - rect.right) + abs(edit_rect.top - rect.top)
-            if nearest_distance is None or distance < nearest_distance:
-                nearest_distance = distance
-                nearest_edit = edit
 
-        if nearest_edit is None:
-            continue
+@dataclass(frozen=True)
+class ControlRect:
+    left: int
+    top: int
+    right: int
+    bottom: int
 
-        if "full path for the file name" in normalized:
-            preferred.append((nearest_distance or 0, nearest_edit))
-        else:
-            fallback.append((nearest_distance or 0, nearest_edit))
+    @property
+    def mid_y(self) -> int:
+        return int(self.top + (self.bottom - self.top) / 2)
 
-    if preferred:
-        preferred.sort(key=lambda item: item[0])
-        return preferred[0][1]
-    if fallback:
-        fallback.sort(key=lambda item: item[0])
-        return fallback[0][1]
-    return None
+    def contains(self, other: "ControlRect") -> bool:
+        return (
+            self.left <= other.left
+            and self.top <= other.top
+            and other.right <= self.right
+            and other.bottom <= self.bottom
+        )
 
 
-def _normalize_label(text: str) -> str:
-    return re.sub(r"\s+", " ", text.strip().rstrip(":" )).lower()
+@dataclass
+class ControlSnapshot:
+    control: object
+    control_type: str
+    text: str
+    rect: ControlRect
 
 
-def _control_rect_key(control) -> tuple[int, int, int, int]:
+def _snapshot_rect(control) -> ControlRect:
     rect = control.rectangle()
-    return (rect.left, rect.top, rect.right, rect.bottom)
+    return ControlRect(rect.left, rect.top, rect.right, rect.bottom)
 
 
-def _find_edit_candidates_for_exact_label(window, exact_label: str) -> list[object]:
-    expected = _normalize_label(exact_label)
-    labels = window.descendants(control_type="Text")
-    collected: list[object] = []
+class BurnControlMap:
+    """One-shot snapshot of the Text/Edit/ComboBox controls of a BurnScc window.
 
-    for label in labels:
-        if _normalize_label(label.window_text()) != expected:
-            continue
+    The UIA tree is walked once; label to field resolution is then done
+    geometrically in memory and memoized per window layout.
+    """
+
+    def __init__(self, labels: list[ControlSnapshot], edits: list[ControlSnapshot], combos: list[ControlSnapshot]) -> None:
+        self.labels = labels
+        self.edits = edits
+        self.combos = combos
+        self.inputs = edits + combos
+        self._combo_edits: dict[int, ControlSnapshot | None] = {}
+        self.layout_key = self._build_layout_key()
 
-        rect = label.rectangle()
-        input_candidates = window.descendants(control_type="Edit") + window.descendants(control_type="ComboBox")
-        ranked: list[tuple[int, int, object]] = []
+    @classmethod
+    def from_window(cls, window) -> "BurnControlMap":
+        labels: list[ControlSnapshot] = []
+        edits: list[ControlSnapshot] = []
+        combos: list[ControlSnapshot] = []
 
-        for candidate in input_candidates:
-            candidate_rect = candidate.rectangle()
-            if candidate_rect.left < rect.left - 20:
+        for control in window.descendants():
+            control_type = control.element_info.control_type
+            if control_type not in _CONTROL_MAP_TYPES:
                 continue
 
-            row_distance = abs(candidate_rect.mid_point().y - rect.mid_point().y)
-            horizontal_gap = max(0, candidate_rect.left - rect.right)
-            ranked.append((row_distance, horizontal_gap, candidate))
+            text = control.window_text() if control_type == "Text" else ""
+            snapshot = ControlSnapshot(control, control_type, text, _snapshot_rect(control))
+            if control_type == "Text":
+                labels.append(snapshot)
+            elif control_type == "Edit":
+                edits.append(snapshot)
+            else:
+                combos.append(snapshot)
+
+        return cls(labels, edits, combos)
+
+    def _build_layout_key(self) -> tuple:
+        all_items = self.labels + self.inputs
+        if not all_items:
+            return ()
+
+        origin_left = min(item.rect.left for item in all_items)
+        origin_top = min(item.rect.top for item in all_items)
+        return tuple(
+            (
+                item.control_type,
+                item.text,
+                item.rect.left - origin_left,
+                item.rect.top - origin_top,
+                item.rect.right - origin_left,
+                item.rect.bottom - origin_top,
+            )
+            for item in all_items
+        )
 
-        if not ranked:
-            continue
+    def _resolve(self, query: tuple, resolver):
+        with _CONTROL_MAP_LOCK:
+            layout_cache = _LAYOUT_RESOLUTIONS.setdefault(self.layout_key, {})
+            if query in layout_cache:
+                return layout_cache[query]
 
-        strict_row = [item for item in ranked if item[0] <= 28]
-        target_pool = strict_row if strict_row else ranked
-        target_pool.sort(key=lambda item: (item[0], item[1]))
+        result = resolver()
+        with _CONTROL_MAP_LOCK:
+            _LAYOUT_RESOLUTIONS.setdefault(self.layout_key, {})[query] = result
+        return result
 
-        for _, _, chosen in target_pool:
-            if chosen.element_info.control_type == "ComboBox":
-                combo_edits = chosen.descendants(control_type="Edit")
-                if combo_edits:
-                    collected.append(combo_edits[0])
-            else:
-                collected.append(chosen)
+    def _nearest_edit_slot(self, label: ControlSnapshot) -> tuple[int | None, int | None]:
+        rect = label.rect
+        nearest_slot = None
+        nearest_distance = None
+        for slot, edit in enumerate(self.edits):
+            edit_rect = edit.rect
+            if edit_rect.left < rect.left - 30:
+                continue
+            if abs(edit_rect.top - rect.top) > 80:
+                continue
+            distance = abs(edit_rect.left - rect.right) + abs(edit_rect.top - rect.top)
+            if nearest_distance is None or distance < nearest_distance:
+                nearest_distance = distance
+                nearest_slot = slot
+        return nearest_slot, nearest_distance
+
+    def _combo_edit(self, combo_slot: int) -> ControlSnapshot | None:
+        if combo_slot in self._combo_edits:
+            return self._combo_edits[combo_slot]
+
+        combo = self.combos[combo_slot]
+        inner = next((edit for edit in self.edits if combo.rect.contains(edit.rect)), None)
+        if inner is None:
+            combo_edits = combo.control.descendants(control_type="Edit")
+            if combo_edits:
+                inner = ControlSnapshot(combo_edits[0], "Edit", "", _snapshot_rect(combo_edits[0]))
+
+        self._combo_edits[combo_slot] = inner
+        return inner
+
+    def _input_edit(self, slot: int) -> ControlSnapshot | None:
+        if slot < len(self.edits):
+            return self.edits[slot]
+        return self._combo_edit(slot - len(self.edits))
+
+    def find_edit_for_label(self, label_pattern: str):
+        def resolve() -> int | None:
+            for label in self.labels:
+                if not re.search(label_pattern, label.text.strip(), flags=re.IGNORECASE):
+                    continue
+                slot, _ = self._nearest_edit_slot(label)
+                if slot is not None:
+                    return slot
+            return None
+
+        slot = self._resolve(("label", label_pattern), resolve)
+        return None if slot is None else self.edits[slot].control
+
+    def find_edit_for_file_name_field(self):
+        def resolve() -> int | None:
+            preferred = []
+            fallback = []
+            for label in self.labels:
+                normalized = re.sub(r"\s+", " ", label.text.strip().lower())
+                if "file name" not in normalized:
+                    continue
+                if "log" in normalized:
+                    continue
+
+                slot, distance = self._nearest_edit_slot(label)
+                if slot is None:
+                    continue
+
+                if "full path for the file name" in normalized:
+                    preferred.append((distance or 0, slot))
+                else:
+                    fallback.append((distance or 0, slot))
+
+            if preferred:
+                preferred.sort(key=lambda item: item[0])
+                return preferred[0][1]
+            if fallback:
+                fallback.sort(key=lambda item: item[0])
+                return fallback[0][1]
+            return None
+
+        slot = self._resolve(("file_name",), resolve)
+        return None if slot is None else self.edits[slot].control
+
+    def find_edit_candidates_for_exact_label(self, exact_label: str) -> list[object]:
+        expected = _normalize_label(exact_label)
+
+        def resolve() -> list[int]:
+            slots: list[int] = []
+            for label in self.labels:
+                if _normalize_label(label.text) != expected:
+                    continue
+
+                rect = label.rect
+                ranked: list[tuple[int, int, int]] = []
+                for slot, candidate in enumerate(self.inputs):
+                    candidate_rect = candidate.rect
+                    if candidate_rect.left < rect.left - 20:
+                        continue
+
+                    row_distance = abs(candidate_rect.mid_y - rect.mid_y)
+                    horizontal_gap = max(0, candidate_rect.left - rect.right)
+                    ranked.append((row_distance, horizontal_gap, slot))
+
+                if not ranked:
+                    continue
+
+                strict_row = [item for item in ranked if item[0] <= 28]
+                target_pool = strict_row if strict_row else ranked
+                target_pool.sort(key=lambda item: (item[0], item[1]))
+                slots.extend(slot for _, _, slot in target_pool)
+            return slots
+
+        deduped: list[object] = []
+        seen: set[tuple[int, int, int, int]] = set()
+        for slot in self._resolve(("exact", expected), resolve):
+            candidate = self._input_edit(slot)
+            if candidate is None:
+                continue
+            key = (candidate.rect.left, candidate.rect.top, candidate.rect.right, candidate.rect.bottom)
+            if key in seen:
+                continue
+            seen.add(key)
+            deduped.append(candidate.control)
 
-    deduped: list[object] = []
-    seen: set[tuple[int, int, int, int]] = set()
-    for candidate in collected:
-        key = _control_rect_key(candidate)
-        if key in seen:
-            continue
-        seen.add(key)
-        deduped.append(candidate)
+        return deduped
+
+
+def _get_control_map(window, refresh: bool = False) -> BurnControlMap:
+    window_key = id(window)
+    with _CONTROL_MAP_LOCK:
+        cached = _CONTROL_MAPS.get(window_key)
+    if cached is not None and cached[0] is window and not refresh:
+        return cached[1]
 
-    return deduped
+    if refresh:
+        _count("control_map_refresh")
+    with _span("control_map_snapshot"):
+        control_map = BurnControlMap.from_window(window)
+    with _CONTROL_MAP_LOCK:
+        _CONTROL_MAPS[window_key] = (window, control_map)
+    return control_map
+
+
+def _release_control_map(window) -> None:
+    with _CONTROL_MAP_LOCK:
+        _CONTROL_MAPS.pop(id(window), None)
+
+
+def _find_edit_for_label(window, label_pattern: str):
+    return _get_control_map(window).find_edit_for_label(label_pattern)
+
+
+def _find_edit_for_file_name_field(window):
+    return _get_control_map(window).find_edit_for_file_name_field()
+
+
+def _find_edit_candidates_for_exact_label(window, exact_label: str) -> list[object]:
+    return _get_control_map(window).find_edit_candidates_for_exact_label(exact_label)
 
 
 def _find_edit_for_exact_label(window, exact_label: str):
@@ -357,10 +827,17 @@ def _find_edit_for_exact_label(window, exact_label: str):
 
 
 def _set_edit_value(window, label_pattern: str, value: str, exact_label: str | None = None) -> None:
-    if exact_label:
-        edit = _find_edit_for_exact_label(window, exact_label)
-    else:
-        edit = _find_edit_for_label(window, label_pattern)
+    edit = None
+    for refresh in (False, True):
+        # A miss may mean the window was still populating when it was snapshotted.
+        if refresh:
+            _get_control_map(window, refresh=True)
+        if exact_label:
+            edit = _find_edit_for_exact_label(window, exact_label)
+        else:
+            edit = _find_edit_for_label(window, label_pattern)
+        if edit is not None:
+            break
     if edit is None:
         if exact_label:
             raise RuntimeError(f"Could not find input field for exact label: {exact_label}")
@@ -394,7 +871,9 @@ def _get_edit_value(window, exact_label: str) -> str:
 
 def _set_exact_with_verify(window, exact_label: str, value: str, retries: int = 3):
     expected = str(Path(value)).rstrip("\\/").lower() if value else ""
-    for _ in range(retries):
+    for attempt in range(retries):
+        if attempt:
+            _count("file_name_verify_retry")
         _set_edit_value(window, r"", value, exact_label=exact_label)
 
         time.sleep(0.2)
@@ -405,29 +884,80 @@ def _set_exact_with_verify(window, exact_label: str, value: str, retries: int =
     raise RuntimeError(f"Failed to set '{exact_label}' to '{value}'.")
 
 
-def run_burn_sequence(job: BurnJob, log_callback) -> None:
-    if Application is None or Desktop is None:
-        raise RuntimeError("pywinauto is required. Install with: pip install pywinauto")
+class BurnerBackend(ABC):
+    """Drives one burner: launch it, fill in the fields, burn, wait, close.
 
-    chip_types = job.chip_types
-    log_callback(f"Loaded {len(chip_types)} chip type(s) from list.")
+    Every chip gets its own session object from ``launch``, so a backend can
+    serve several scheduler workers at once.
+    """
+
+    name = "base"
+
+    def input_guard(self):
+        return contextlib.nullcontext()
+
+    @abstractmethod
+    def launch(self, job: BurnJob):
+        """Start the burner for one chip and return its session."""
+
+    @abstractmethod
+    def set_fields(self, session, ip_address: str, ct_file: Path, range_index: int, log_callback) -> None:
+        """Fill in IP address, CT file and range index."""
+
+    @abstractmethod
+    def trigger(self, session) -> None:
+        """Start the burn."""
+
+    @abstractmethod
+    def await_result(self, session, isolate_popups: bool = False) -> None:
+        """Wait for the burn to finish and dismiss its result popups."""
 
-    range_index = job.starting_index
-    for chip_type in chip_types:
-        log_callback(f"Processing chip type: {chip_type}")
-        ct_file = find_ct_file(chip_type, job.ct_search_root)
-        log_callback(f"Found CT file: {ct_file}")
+    @abstractmethod
+    def close(self, session) -> None:
+        """Close the burner, also after a failed step."""
 
-        app = Application(backend="uia").start(f'"{job.burn_exe_path}"')
+
+# Focus, mouse and keyboard input are desktop-global, so concurrent workers
+# take turns driving BurnScc; only the burn itself runs in parallel.
+_UI_INPUT_LOCK = threading.Lock()
+
+
+@dataclass
+class _PywinautoSession:
+    app: object
+    window: object
+
+
+class PywinautoBurnerBackend(BurnerBackend):
+    name = "pywinauto"
+
+    def __init__(self, burn_wait_seconds: float = 5.0) -> None:
+        if Application is None or Desktop is None:
+            raise RuntimeError("pywinauto is required. Install with: pip install pywinauto")
+        self.burn_wait_seconds = float(burn_wait_seconds)
+
+    def input_guard(self):
+        return _UI_INPUT_LOCK
+
+    def launch(self, job: BurnJob) -> _PywinautoSession:
+        with _span("app_start"):
+            app = Application(backend="uia").start(f'"{job.burn_exe_path}"')
         window = app.window(title_re=r".*Burn.*")
-        window.wait("visible", timeout=30)
+        with _span("window_wait_visible"):
+            window.wait("visible", timeout=30)
         window.set_focus()
+        return _PywinautoSession(app, window)
 
-        _set_edit_value(window, r"IP\s*Address", job.ip_address)
+    def set_fields(self, session: _PywinautoSession, ip_address: str, ct_file: Path, range_index: int, log_callback) -> None:
+        window = session.window
+        with _span("set_ip_address"):
+            _set_edit_value(window, r"IP\s*Address", ip_address)
         try:
-            _set_exact_with_verify(window, "Full path for the File Name", str(ct_file))
+            with _span("set_file_name"):
+                _set_exact_with_verify(window, "Full path for the File Name", str(ct_file))
             log_callback(f"Set 'Full path for the File Name' to: {ct_file}")
         except RuntimeError:
+            _count("file_name_fallback")
             fallback_edit = _find_edit_for_file_name_field(window)
             if fallback_edit is None:
                 raise RuntimeError("Could not find File Name input field (non-log fallback).")
@@ -438,35 +968,591 @@ def run_burn_sequence(job: BurnJob, log_callback) -> None:
                 fallback_edit.type_keys("^a{BACKSPACE}", set_foreground=True)
                 fallback_edit.type_keys(str(ct_file), with_spaces=True, set_foreground=True)
             log_callback(f"Set File Name field (non-log fallback) to: {ct_file}")
-        _set_edit_value(window, r"Ranges?\s*of\s*chips", str(range_index))
+        with _span("set_range_index"):
+            _set_edit_value(window, r"Ranges?\s*of\s*chips", str(range_index))
 
-        burn_button = window.child_window(title_re=r"^Burn$", control_type="Button")
+    def trigger(self, session: _PywinautoSession) -> None:
+        burn_button = session.window.child_window(title_re=r"^Burn$", control_type="Button")
         if not burn_button.exists(timeout=5):
             raise RuntimeError("Could not find Burn button.")
-
         burn_button.click_input()
-        log_callback(f"Burn clicked for {chip_type}, range index {range_index}.")
-
-        time.sleep(5)
-        for popup in Desktop(backend="uia").windows(control_type="Window"):
-            popup_title = popup.window_text().strip().lower()
-            if "burn" in popup_title or "success" in popup_title or "complete" in popup_title:
-                for button in popup.descendants(control_type="Button"):
-                    button_text = button.window_text().strip().lower()
-                    if button_text == "ok":
-                        button.click_input()
-                        break
 
+    def await_result(self, session: _PywinautoSession, isolate_popups: bool = False) -> None:
+        with _span("burn_wait"):
+            time.sleep(self.burn_wait_seconds)
+
+        criteria = {"control_type": "Window"}
+        if isolate_popups:
+            criteria["process"] = session.app.process
+
+        with _UI_INPUT_LOCK, _span("popup_sweep"):
+            for popup in Desktop(backend="uia").windows(**criteria):
+                popup_title = popup.window_text().strip().lower()
+                if "burn" in popup_title or "success" in popup_title or "complete" in popup_title:
+                    for button in popup.descendants(control_type="Button"):
+                        button_text = button.window_text().strip().lower()
+                        if button_text == "ok":
+                            button.click_input()
+                            break
+
+    def close(self, session: _PywinautoSession) -> None:
+        with _UI_INPUT_LOCK:
+            try:
+                session.window.close()
+            except Exception:
+                pass
+        _release_control_map(session.window)
+
+
+@dataclass
+class _SimulatedSession:
+    ip_address: str = ""
+    ct_file: str = ""
+    range_index: int | None = None
+    triggered: bool = False
+
+
+class SimulatedBurnerBackend(BurnerBackend):
+    """Stand-in for BurnScc with configurable latencies (seconds) and failure rates.
+
+    Runs anywhere, so scheduling, CT lookup and resume logic can be
+    exercised headless with large chip plans.
+    """
+
+    name = "simulated"
+
+    def __init__(
+        self,
+        launch_latency: float = 0.0,
+        field_latency: float = 0.0,
+        burn_latency: float = 0.0,
+        close_latency: float = 0.0,
+        launch_failure_rate: float = 0.0,
+        burn_failure_rate: float = 0.0,
+        serialize_input: bool = True,
+        seed: int | None = None,
+    ) -> None:
+        self.launch_latency = float(launch_latency)
+        self.field_latency = float(field_latency)
+        self.burn_latency = float(burn_latency)
+        self.close_latency = float(close_latency)
+        self.launch_failure_rate = float(launch_failure_rate)
+        self.burn_failure_rate = float(burn_failure_rate)
+        self.serialize_input = bool(serialize_input)
+        self.burned: list[tuple[str, int, str]] = []
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._input_lock = threading.Lock()
+
+    def input_guard(self):
+        return self._input_lock if self.serialize_input else contextlib.nullcontext()
+
+    def _roll(self, rate: float) -> bool:
+        if rate <= 0:
+            return False
+        with self._lock:
+            return self._random.random() < rate
+
+    def launch(self, job: BurnJob) -> _SimulatedSession:
+        time.sleep(self.launch_latency)
+        if self._roll(self.launch_failure_rate):
+            raise RuntimeError("Simulated BurnScc failed to start.")
+        return _SimulatedSession()
+
+    def set_fields(self, session: _SimulatedSession, ip_address: str, ct_file: Path, range_index: int, log_callback) -> None:
+        time.sleep(self.field_latency)
+        session.ip_address = ip_address
+        session.ct_file = str(ct_file)
+        session.range_index = range_index
+        log_callback(f"Set 'Full path for the File Name' to: {ct_file}")
+
+    def trigger(self, session: _SimulatedSession) -> None:
+        if session.range_index is None:
+            raise RuntimeError("Burn triggered before fields were set.")
+        session.triggered = True
+
+    def await_result(self, session: _SimulatedSession, isolate_popups: bool = False) -> None:
+        time.sleep(self.burn_latency)
+        if self._roll(self.burn_failure_rate):
+            raise RuntimeError(f"Simulated burn failed on {session.ip_address} for range index {session.range_index}.")
+        with self._lock:
+            self.burned.append((session.ip_address, session.range_index, session.ct_file))
+
+    def close(self, session: _SimulatedSession) -> None:
+        time.sleep(self.close_latency)
+
+
+BURNER_BACKENDS = {
+    PywinautoBurnerBackend.name: PywinautoBurnerBackend,
+    SimulatedBurnerBackend.name: SimulatedBurnerBackend,
+}
+
+
+def create_backend(name: str, options: dict | None = None) -> BurnerBackend:
+    backend_class = BURNER_BACKENDS.get(name)
+    if backend_class is None:
+        raise RuntimeError(f"Unknown burner backend '{name}'. Choose from: {', '.join(BURNER_BACKENDS)}")
+    try:
+        return backend_class(**(options or {}))
+    except TypeError as error:
+        raise RuntimeError(f"Invalid options for burner backend '{name}': {error}") from error
+
+
+def _locate_ct_file(job: BurnJob, chip_type: str) -> Path:
+    index = get_ct_index(job.ct_search_root)
+    try:
+        return find_ct_file(chip_type, job.ct_search_root, job.ct_match_rules, job.ct_preferred_subdirs, index=index)
+    except FileNotFoundError:
+        # The CT file may have been generated after the index was built.
+        _count("ct_index_refresh")
+        index = get_ct_index(job.ct_search_root, refresh=True)
+        return find_ct_file(chip_type, job.ct_search_root, job.ct_match_rules, job.ct_preferred_subdirs, index=index)
+
+
+def _burn_chip(
+    job: BurnJob,
+    ip_address: str,
+    task: "BurnTask",
+    log_callback,
+    isolate_popups: bool = False,
+    journal: "BurnJournal | None" = None,
+    backend: BurnerBackend | None = None,
+) -> None:
+    if backend is None:
+        backend = PywinautoBurnerBackend()
+
+    chip_type = task.chip_type
+    range_index = task.range_index
+    log_callback(f"Processing chip type: {chip_type}")
+    with _span("find_ct_file", chip_type=chip_type):
+        ct_file = _locate_ct_file(job, chip_type)
+    log_callback(f"Found CT file: {ct_file}")
+    if journal is not None:
+        journal.update(task, save=False, ct_file=str(ct_file))
+
+    session = None
+    try:
+        with contextlib.ExitStack() as input_scope:
+            with _span("input_lock_wait"):
+                input_scope.enter_context(backend.input_guard())
+            with _span("launch"):
+                session = backend.launch(job)
+            with _span("set_fields"):
+                backend.set_fields(session, ip_address, ct_file, range_index, log_callback)
+            with _span("trigger"):
+                backend.trigger(session)
+            log_callback(f"Burn clicked for {chip_type}, range index {range_index}.")
+
+        with _span("await_result"):
+            backend.await_result(session, isolate_popups=isolate_popups)
+    finally:
+        if session is not None:
+            with _span("close"):
+                backend.close(session)
+
+
+@dataclass
+class BurnTask:
+    chip_type: str
+    range_index: int
+    attempts: int = 0
+    last_error: str = ""
+    status: str = "pending"
+    ct_file: str = ""
+    target: str = ""
+    started_at: str = ""
+    finished_at: str = ""
+
+
+def build_chip_plan(job: BurnJob) -> list[BurnTask]:
+    return [
+        BurnTask(chip_type=chip_type, range_index=job.starting_index + offset)
+        for offset, chip_type in enumerate(job.chip_types)
+    ]
+
+
+def _timestamp() -> str:
+    return datetime.now().isoformat(timespec="seconds")
+
+
+class BurnJournal:
+    """Per-chip progress record persisted next to the JSON config.
+
+    The file is rewritten atomically after every status change, so a series
+    that stops part way can be resumed from the first chip not marked done.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Path | None, job: BurnJob) -> None:
+        self.path = path
+        self.job = job
+        self.tasks: list[BurnTask] = []
+        self._lock = threading.Lock()
+        # Entries are re-encoded only when they change, so a save costs one
+        # string join rather than serializing every chip again.
+        self._encoded: list[str] = []
+        self._positions: dict[int, int] = {}
+
+    @staticmethod
+    def path_for(config_path: Path) -> Path:
+        return config_path.with_name(f"{config_path.stem}.journal.json")
+
+    @classmethod
+    def for_job(cls, job: BurnJob) -> "BurnJournal":
+        path = cls.path_for(job.config_path) if job.config_path is not None else None
+        return cls(path, job)
+
+    def _read_entries(self) -> list[dict] | None:
+        if self.path is None or not self.path.exists():
+            return None
         try:
-            window.close()
+            data = json.loads(self.path.read_text(encoding="utf-8"))
         except Exception:
-            pass
+            return None
+
+        if not isinstance(data, dict) or data.get("version") != self.VERSION:
+            return None
+        if data.get("starting_index") != self.job.starting_index:
+            return None
+        if data.get("chip_types") != self.job.chip_types:
+            return None
+        entries = data.get("entries")
+        if not isinstance(entries, list) or len(entries) != len(self.job.chip_types):
+            return None
+        return entries
+
+    def load_plan(self, resume: bool) -> list[BurnTask]:
+        self.tasks = build_chip_plan(self.job)
+        entries = self._read_entries() if resume else None
+        if entries is not None:
+            for task, entry in zip(self.tasks, entries):
+                if entry.get("status") == "done":
+                    task.status = "done"
+                elif entry.get("status") == "failed":
+                    task.status = "failed"
+                task.attempts = int(entry.get("attempts", 0))
+                task.last_error = str(entry.get("last_error", ""))
+                task.ct_file = str(entry.get("ct_file", ""))
+                task.target = str(entry.get("target", ""))
+                task.started_at = str(entry.get("started_at", ""))
+                task.finished_at = str(entry.get("finished_at", ""))
+        self._encoded = [json.dumps(asdict(task)) for task in self.tasks]
+        self._positions = {id(task): position for position, task in enumerate(self.tasks)}
+        self.save()
+        return self.tasks
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+
+        with self._lock, _span("journal_save"):
+            header = json.dumps(
+                {
+                    "version": self.VERSION,
+                    "starting_index": self.job.starting_index,
+                    "chip_types": self.job.chip_types,
+                    "updated_at": _timestamp(),
+                }
+            )
+            text = header[:-1] + ', "entries": [\n' + ",\n".join(self._encoded) + "\n]}\n"
+            temp_path = self.path.with_name(self.path.name + ".tmp")
+            temp_path.write_text(text, encoding="utf-8")
+            os.replace(temp_path, self.path)
+
+    def update(self, task: BurnTask, save: bool = True, **changes) -> None:
+        with self._lock:
+            for key, value in changes.items():
+                setattr(task, key, value)
+            position = self._positions.get(id(task))
+            if position is not None:
+                self._encoded[position] = json.dumps(asdict(task))
+        if save:
+            self.save()
+
+    def mark_running(self, task: BurnTask, ip_address: str) -> None:
+        self.update(
+            task,
+            status="running",
+            target=ip_address,
+            attempts=task.attempts + 1,
+            started_at=_timestamp(),
+            finished_at="",
+        )
 
-        range_index += 1
+    def mark_done(self, task: BurnTask) -> None:
+        self.update(task, status="done", last_error="", finished_at=_timestamp())
+
+    def mark_failed(self, task: BurnTask, error: Exception) -> None:
+        self.update(task, status="failed", last_error=str(error), finished_at=_timestamp())
+
+
+def _run_task(job: BurnJob, ip_address: str, task: BurnTask, log_callback, journal: BurnJournal, **kwargs) -> None:
+    journal.mark_running(task, ip_address)
+    try:
+        with _span("chip", chip_type=task.chip_type, range_index=task.range_index, target=ip_address):
+            _burn_chip(job, ip_address, task, log_callback, journal=journal, **kwargs)
+    except Exception as error:
+        _count("chips_failed")
+        journal.mark_failed(task, error)
+        raise
+    _count("chips_done")
+    journal.mark_done(task)
+
+
+class BurnScheduler:
+    """Spread a chip plan across burner stations with one worker thread per target.
+
+    Each task keeps the range index it was planned with, whichever station
+    burns it. A failed task is re-queued up to ``job.max_retries`` times, and a
+    station that fails ``job.max_target_failures`` chips in a row is retired.
+    """
+
+    def __init__(
+        self,
+        job: BurnJob,
+        log_callback,
+        plan: list[BurnTask] | None = None,
+        journal: BurnJournal | None = None,
+        run_task=None,
+        backend: BurnerBackend | None = None,
+    ) -> None:
+        self.job = job
+        self.log_callback = log_callback
+        self.run_task = run_task or _run_task
+        self.backend = backend
+        self.journal = journal or BurnJournal(None, job)
+        if plan is None:
+            plan = build_chip_plan(job)
+        self.pending = [task for task in plan if task.status != "done"]
+        self._attempts: dict[int, int] = {}
+        self.failed: list[BurnTask] = []
+        self.completed: list[BurnTask] = []
+        self._in_flight = 0
+        self._active_workers = 0
+        self._condition = threading.Condition()
+
+    def _next_task(self) -> BurnTask | None:
+        with self._condition:
+            while not self.pending and self._in_flight > 0:
+                self._condition.wait()
+            if not self.pending:
+                return None
+            task = self.pending.pop(0)
+            self._in_flight += 1
+            return task
+
+    def _finish_task(self, task: BurnTask, error: Exception | None) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            if error is None:
+                self.completed.append(task)
+            elif self._attempts[task.range_index] <= self.job.max_retries:
+                self.pending.append(task)
+                _count("chip_retry")
+            else:
+                self.failed.append(task)
+            self._condition.notify_all()
+
+    def _retire_worker(self) -> None:
+        with self._condition:
+            self._active_workers -= 1
+            if self._active_workers == 0:
+                self.failed.extend(self.pending)
+                self.pending.clear()
+            self._condition.notify_all()
+
+    def _worker(self, ip_address: str) -> None:
+        def log(message: str) -> None:
+            self.log_callback(f"[{ip_address}] {message}")
+
+        consecutive_failures = 0
+        try:
+            while True:
+                task = self._next_task()
+                if task is None:
+                    return
+
+                attempt = self._attempts.get(task.range_index, 0) + 1
+                self._attempts[task.range_index] = attempt
+                try:
+                    self.run_task(self.job, ip_address, task, log, self.journal, backend=self.backend, isolate_popups=True)
+                except Exception as error:
+                    consecutive_failures += 1
+                    log(f"ERROR on {task.chip_type} (range index {task.range_index}, attempt {attempt}): {error}")
+                    self._finish_task(task, error)
+                    if consecutive_failures >= self.job.max_target_failures:
+                        log(f"Retiring target after {consecutive_failures} consecutive failure(s).")
+                        _count("target_retired")
+                        return
+                    continue
+
+                consecutive_failures = 0
+                self._finish_task(task, None)
+        finally:
+            self._retire_worker()
+
+    def run(self) -> None:
+        targets = self.job.targets
+        self.log_callback(f"Scheduling {len(self.pending)} chip(s) across {len(targets)} target(s).")
+
+        self._active_workers = len(targets)
+        workers = [
+            threading.Thread(target=contextvars.copy_context().run, args=(self._worker, ip_address), daemon=True)
+            for ip_address in targets
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        if self.failed:
+            summary = "\n".join(
+                f"{task.chip_type} (range index {task.range_index}): "
+                + (f"{task.target}: {task.last_error}" if task.last_error else "not attempted")
+                for task in sorted(self.failed, key=lambda item: item.range_index)
+            )
+            raise RuntimeError(f"{len(self.failed)} chip(s) failed to burn:\n{summary}")
+
+
+def _report_profile(job: BurnJob, profiler: BurnProfiler, log_callback) -> None:
+    log_callback("Burn series timing summary:\n" + profiler.format_summary())
+    if job.config_path is None:
+        return
+
+    trace_path = job.config_path.with_name(f"{job.config_path.stem}.trace.json")
+    try:
+        profiler.write_chrome_trace(trace_path)
+    except Exception as error:
+        log_callback(f"Could not write timing trace: {error}")
+        return
+    log_callback(f"Timing trace (Chrome trace-event format): {trace_path}")
+
+
+def run_burn_sequence(job: BurnJob, log_callback, backend: BurnerBackend | None = None) -> None:
+    if backend is None:
+        backend = create_backend(job.backend, job.backend_options)
+
+    profiler = BurnProfiler()
+    token = _ACTIVE_PROFILER.set(profiler)
+    try:
+        with _span("series", chips=len(job.chip_types), targets=len(job.targets)):
+            _run_series(job, log_callback, backend)
+    finally:
+        _ACTIVE_PROFILER.reset(token)
+        _report_profile(job, profiler, log_callback)
+
+
+def _run_series(job: BurnJob, log_callback, backend: BurnerBackend) -> None:
+    chip_types = job.chip_types
+    log_callback(f"Loaded {len(chip_types)} chip type(s) from list.")
+
+    with _span("ct_index_build"):
+        ct_index = get_ct_index(job.ct_search_root, refresh=True)
+    log_callback(f"Indexed {len(ct_index.entries)} CT file(s) under {job.ct_search_root}.")
+
+    journal = BurnJournal.for_job(job)
+    plan = journal.load_plan(job.resume)
+    if journal.path is not None:
+        log_callback(f"Burn journal: {journal.path}")
+    done_count = sum(1 for task in plan if task.status == "done")
+    if done_count:
+        log_callback(f"Resuming: skipping {done_count} of {len(plan)} chip(s) already burned.")
+
+    if len(job.targets) > 1:
+        BurnScheduler(job, log_callback, plan=plan, journal=journal, backend=backend).run()
+    else:
+        for task in plan:
+            if task.status == "done":
+                continue
+            _run_task(job, job.ip_address, task, log_callback, journal, backend=backend)
 
     log_callback("All chip types processed.")
 
 
+class _JsonLineFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        entry.update(getattr(record, "fields", {}))
+        return json.dumps(entry)
+
+
+class BurnLogSink:
+    """Thread-safe ``log_callback`` for the burn sequence.
+
+    Messages are queued for the UI to drain in batches and, optionally,
+    appended as JSON lines to a rotating log file. Each record carries the
+    seconds elapsed since the previous message from the same thread.
+    """
+
+    def __init__(
+        self,
+        log_path: Path | None = BURN_LOG_PATH,
+        max_bytes: int = 5_000_000,
+        backup_count: int = 3,
+        enqueue: bool = True,
+        echo_stream=None,
+    ) -> None:
+        self._queue: queue.SimpleQueue[str] = queue.SimpleQueue()
+        self._enqueue = enqueue
+        self._echo_stream = echo_stream
+        self._echo_lock = threading.Lock()
+        self._last_times: dict[int, float] = {}
+        self._logger = logging.getLogger(f"{__name__}.BurnLogSink.{id(self)}")
+        self._logger.propagate = False
+        self._logger.setLevel(logging.INFO)
+        self._handler: logging.Handler | None = None
+
+        if log_path is not None:
+            try:
+                self._handler = RotatingFileHandler(
+                    log_path,
+                    maxBytes=max_bytes,
+                    backupCount=backup_count,
+                    encoding="utf-8",
+                    delay=True,
+                )
+            except Exception:
+                self._handler = None
+            else:
+                self._handler.setFormatter(_JsonLineFormatter())
+                self._logger.addHandler(self._handler)
+
+    def __call__(self, message: str, **fields) -> None:
+        now = time.monotonic()
+        thread_id = threading.get_ident()
+        previous = self._last_times.get(thread_id)
+        self._last_times[thread_id] = now
+
+        if self._enqueue:
+            self._queue.put(message)
+        if self._echo_stream is not None:
+            with self._echo_lock:
+                print(message, file=self._echo_stream, flush=True)
+        if self._handler is not None:
+            step_seconds = None if previous is None else round(now - previous, 3)
+            self._logger.info(message, extra={"fields": {"step_seconds": step_seconds, **fields}})
+
+    def drain(self, limit: int = LOG_BATCH_SIZE) -> list[str]:
+        messages: list[str] = []
+        while len(messages) < limit:
+            try:
+                messages.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return messages
+
+    def close(self) -> None:
+        if self._handler is not None:
+            self._logger.removeHandler(self._handler)
+            self._handler.close()
+            self._handler = None
+
+
 class BurnSeriesGUI:
     def __init__(self, root: tk.Tk) -> None:
         self.root = root
@@ -474,8 +1560,13 @@ class BurnSeriesGUI:
         self.root.geometry("760x500")
 
         self.config_file_var = tk.StringVar(value=str(Path(__file__).resolve().with_name("Burn_SQ_CT_Series_config.json")))
+        self.resume_var = tk.BooleanVar(value=False)
+        self.log_sink = BurnLogSink()
+        self._ui_calls: queue.SimpleQueue = queue.SimpleQueue()
 
         self._build_ui()
+        self.root.bind("<Destroy>", self._on_destroy, add="+")
+        self._poll_log()
 
     def _build_ui(self) -> None:
         frm = tk.Frame(self.root)
@@ -488,20 +1579,34 @@ class BurnSeriesGUI:
         tk.Label(
             frm,
             text=(
-                "Config keys: ip_address, starting_index, chip_type_list (preferred) or "
-                "chip_list_file, burn_exe_path (optional), ct_search_root (optional)"
+                "Config keys: ip_address or targets, starting_index, chip_type_list (preferred) or "
+                "chip_list_file, burn_exe_path (optional), ct_search_root (optional), "
+                "max_retries (optional), max_target_failures (optional), "
+                "backend + backend_options (optional, 'pywinauto' or 'simulated'), "
+                "ct_match_rules + ct_preferred_subdirs (optional)"
             ),
             anchor="w",
             justify="left",
         ).grid(row=1, column=0, columnspan=3, sticky="w", pady=(0, 10))
 
-        tk.Button(frm, text="Start Burn Series", command=self._start).grid(row=2, column=0, columnspan=3, sticky="we")
+        tk.Checkbutton(
+            frm,
+            text="Resume from burn journal (skip chips already burned)",
+            variable=self.resume_var,
+        ).grid(row=2, column=0, columnspan=3, sticky="w", pady=(0, 6))
+
+        tk.Button(frm, text="Start Burn Series", command=self._start).grid(row=3, column=0, columnspan=3, sticky="we")
 
         self.log_text = tk.Text(frm, height=18, state="disabled")
-        self.log_text.grid(row=3, column=0, columnspan=3, sticky="nsew", pady=(10, 0))
+        self.log_text.grid(row=4, column=0, columnspan=3, sticky="nsew", pady=(10, 0))
 
         frm.columnconfigure(1, weight=1)
-        frm.rowconfigure(3, weight=1)
+        frm.rowconfigure(4, weight=1)
+
+    def _on_destroy(self, event) -> None:
+        # <Destroy> also fires for every child widget.
+        if event.widget is self.root:
+            self.log_sink.close()
 
     def _browse_config_file(self) -> None:
         file_path = filedialog.askopenfilename(
@@ -512,11 +1617,35 @@ class BurnSeriesGUI:
             self.config_file_var.set(file_path)
 
     def _log(self, message: str) -> None:
-        self.log_text.configure(state="normal")
-        self.log_text.insert("end", message + "\n")
-        self.log_text.see("end")
-        self.log_text.configure(state="disabled")
-        self.root.update_idletasks()
+        self.log_sink(message)
+
+    def _call_on_ui(self, callback) -> None:
+        self._ui_calls.put(callback)
+
+    def _poll_log(self) -> None:
+        while True:
+            try:
+                callback = self._ui_calls.get_nowait()
+            except queue.Empty:
+                break
+            callback()
+
+        messages = self.log_sink.drain(LOG_BATCH_SIZE)
+        if messages:
+            self.log_text.configure(state="normal")
+            self.log_text.insert("end", "\n".join(messages) + "\n")
+
+            line_count = int(self.log_text.index("end-1c").split(".")[0])
+            excess = line_count - MAX_LOG_WIDGET_LINES
+            if excess > 0:
+                self.log_text.delete("1.0", f"{excess + 1}.0")
+
+            self.log_text.see("end")
+            self.log_text.configure(state="disabled")
+
+        # Come straight back while a backlog is still queued.
+        delay = 1 if len(messages) == LOG_BATCH_SIZE else LOG_POLL_MS
+        self.root.after(delay, self._poll_log)
 
     def _start(self) -> None:
         config_path = Path(self.config_file_var.get().strip())
@@ -529,9 +1658,13 @@ class BurnSeriesGUI:
         except Exception as error:
             messagebox.showerror("Config error", str(error))
             return
+        job.resume = self.resume_var.get()
 
         self._log(f"Config loaded: {config_path}")
-        self._log(f"IP address: {job.ip_address}")
+        if len(job.targets) > 1:
+            self._log(f"Targets: {', '.join(job.targets)}")
+        else:
+            self._log(f"IP address: {job.ip_address}")
         self._log(f"Starting index: {job.starting_index}")
         if job.list_file_path is not None:
             self._log(f"Chip source file: {job.list_file_path}")
@@ -561,11 +1694,209 @@ class BurnSeriesGUI:
             except Exception:
                 pass
 
-            messagebox.showerror("Burn failed", f"{error}\n\nDetails saved to:\n{ERROR_LOG_PATH}")
+            message = (
+                f"{error}\n\nDetails saved to:\n{ERROR_LOG_PATH}\n\n"
+                "Tick 'Resume from burn journal' to continue from the failed chip."
+            )
+            self._call_on_ui(lambda: messagebox.showerror("Burn failed", message))
+
+
+def _write_error_report(config_path: Path, error: Exception, trace: str = "") -> None:
+    try:
+        report_path = config_path.with_name(f"{config_path.stem}.error.txt")
+        report_path.write_text(f"{error}\n\n{trace}", encoding="utf-8")
+    except Exception:
+        pass
+
+
+def _move_job_files(config_path: Path, destination_dir: Path) -> Path:
+    """Move a spooled config together with its journal, trace and error report."""
+    destination_dir.mkdir(parents=True, exist_ok=True)
+    stem = config_path.stem
+    target_stem = stem
+    if (destination_dir / f"{stem}{config_path.suffix}").exists():
+        target_stem = f"{stem}-{datetime.now():%Y%m%d-%H%M%S}"
+
+    for suffix in ("", ".journal", ".trace", ".error"):
+        extension = ".txt" if suffix == ".error" else config_path.suffix
+        source = config_path.with_name(f"{stem}{suffix}{extension}")
+        if source.exists():
+            os.replace(source, destination_dir / f"{target_stem}{suffix}{extension}")
+    return destination_dir / f"{target_stem}{config_path.suffix}"
+
+
+class BurnBackendPool:
+    """Reuses one backend instance per configuration across jobs.
 
+    This only saves creating and validating the backend for each job: the
+    pywinauto backend still starts and closes BurnScc for every chip.
+    """
 
-def main() -> None:
-    if not is_admin():
+    def __init__(self) -> None:
+        self._backends: dict[tuple[str, str], BurnerBackend] = {}
+
+    def get(self, job: BurnJob) -> BurnerBackend:
+        key = (job.backend, json.dumps(job.backend_options, sort_keys=True))
+        backend = self._backends.get(key)
+        if backend is None:
+            backend = create_backend(job.backend, job.backend_options)
+            self._backends[key] = backend
+        return backend
+
+
+def _run_job_headless(job: BurnJob, log_callback, backends: BurnBackendPool) -> bool:
+    log_callback(f"Starting burn sequence for {job.config_path}...")
+    try:
+        run_burn_sequence(job, log_callback, backends.get(job))
+    except Exception as error:
+        trace = traceback.format_exc()
+        log_callback(f"ERROR: {error}")
+        log_callback(trace)
+        if job.config_path is not None:
+            _write_error_report(job.config_path, error, trace)
+        return False
+    log_callback("Burn sequence completed.")
+    return True
+
+
+def run_headless(config_paths: list[Path], log_callback, resume: bool = False) -> int:
+    """Run each JSON config back to back without UI. Returns the number of failed jobs."""
+    backends = BurnBackendPool()
+    failures = 0
+    for config_path in config_paths:
+        try:
+            job = load_job_from_json(config_path)
+        except Exception as error:
+            log_callback(f"Config error in {config_path}: {error}")
+            failures += 1
+            continue
+
+        job.resume = resume
+        if not _run_job_headless(job, log_callback, backends):
+            failures += 1
+    return failures
+
+
+class BurnSpoolDaemon:
+    """Watches a spool directory and burns the JSON configs dropped into it.
+
+    A watcher thread validates new ``*.json`` files and moves them to
+    ``queued/`` while the current job is still burning, so the next series
+    starts as soon as the previous one ends. Finished configs are moved to
+    ``done/`` or ``failed/`` together with their journal and trace.
+    """
+
+    def __init__(self, spool_dir: Path, log_callback, poll_seconds: float = 2.0, resume: bool = False) -> None:
+        self.spool_dir = spool_dir
+        self.queued_dir = spool_dir / "queued"
+        self.done_dir = spool_dir / "done"
+        self.failed_dir = spool_dir / "failed"
+        self.log_callback = log_callback
+        self.poll_seconds = poll_seconds
+        self.resume = resume
+        self.backends = BurnBackendPool()
+        self.stop_event = threading.Event()
+        self._jobs: queue.Queue[BurnJob] = queue.Queue()
+
+    def _claim_new_configs(self) -> None:
+        candidates = sorted(self.spool_dir.glob("*.json"), key=lambda path: path.stat().st_mtime)
+        for config_path in candidates:
+            if time.time() - config_path.stat().st_mtime < 1.0:
+                continue  # may still be being written
+            try:
+                job = load_job_from_json(config_path)
+            except Exception as error:
+                self.log_callback(f"Rejected {config_path.name}: {error}")
+                _write_error_report(config_path, error)
+                _move_job_files(config_path, self.failed_dir)
+                continue
+
+            job.config_path = _move_job_files(config_path, self.queued_dir)
+            job.resume = self.resume
+            self._jobs.put(job)
+            self.log_callback(f"Queued {job.config_path.name} ({len(job.chip_types)} chip(s)).")
+
+    def _requeue_interrupted(self) -> None:
+        # Configs left in queued/ by a previous daemon run are picked up again
+        # and resume from their journals. They were submitted to the spool
+        # directory, so that is where their relative paths point.
+        if not self.queued_dir.exists():
+            return
+        for config_path in sorted(self.queued_dir.glob("*.json")):
+            if config_path.stem.endswith((".journal", ".trace")):
+                continue
+            try:
+                job = load_job_from_json(config_path, base_dir=self.spool_dir)
+            except Exception as error:
+                self.log_callback(f"Rejected {config_path.name}: {error}")
+                _write_error_report(config_path, error)
+                _move_job_files(config_path, self.failed_dir)
+                continue
+            job.resume = True
+            self._jobs.put(job)
+            self.log_callback(f"Re-queued interrupted job {config_path.name}.")
+
+    def _watch(self) -> None:
+        while not self.stop_event.is_set():
+            try:
+                self._claim_new_configs()
+            except Exception as error:
+                self.log_callback(f"Spool scan failed: {error}")
+            self.stop_event.wait(self.poll_seconds)
+
+    def run_forever(self) -> None:
+        self.spool_dir.mkdir(parents=True, exist_ok=True)
+        self.log_callback(f"Watching spool directory: {self.spool_dir}")
+        self._requeue_interrupted()
+
+        watcher = threading.Thread(target=self._watch, name="spool-watcher", daemon=True)
+        watcher.start()
+        try:
+            while not self.stop_event.is_set():
+                try:
+                    job = self._jobs.get(timeout=self.poll_seconds)
+                except queue.Empty:
+                    continue
+
+                succeeded = _run_job_headless(job, self.log_callback, self.backends)
+                destination = self.done_dir if succeeded else self.failed_dir
+                _move_job_files(job.config_path, destination)
+        finally:
+            self.stop_event.set()
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Burn a series of SQ CT files through BurnScc.")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--headless", nargs="+", type=Path, metavar="CONFIG", help="run these JSON configs back to back without UI")
+    mode.add_argument("--daemon", type=Path, metavar="SPOOL_DIR", help="watch SPOOL_DIR for JSON configs and burn them as they arrive")
+    parser.add_argument("--resume", action="store_true", help="skip chips the burn journal already records as done")
+    parser.add_argument("--poll-seconds", type=float, default=2.0, help="spool directory scan interval (daemon mode)")
+    parser.add_argument("--no-elevate", action="store_true", help="do not relaunch as administrator")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+
+    if args.headless or args.daemon:
+        if os.name == "nt" and not args.no_elevate and not is_admin():
+            relaunch_as_admin()
+
+        log_sink = BurnLogSink(enqueue=False, echo_stream=sys.stdout)
+        try:
+            if args.daemon:
+                try:
+                    BurnSpoolDaemon(args.daemon, log_sink, args.poll_seconds, args.resume).run_forever()
+                except KeyboardInterrupt:
+                    log_sink("Daemon stopped.")
+                return
+            failures = run_headless(args.headless, log_sink, resume=args.resume)
+        finally:
+            log_sink.close()
+        sys.exit(1 if failures else 0)
+
+    if not args.no_elevate and not is_admin():
         relaunch_as_admin()
 
     root = tk.Tk()
@@ -0,0 +1,236 @@
+import argparse
+import itertools
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Render off-screen, this has to happen before pyplot is imported anywhere
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+from circle import plot_circles
+from circle_geometry import four_circle_layout
+from circle_raster import render_circles_png
+from line import plot_envelope
+from line_geometry import parse_values, predict_line_count
+from line_raster import render_envelope_png
+from render_cache import DEFAULT_MAX_BYTES, FIGURE_INCHES, RenderCache, pattern_key
+
+# Patterns that can be swept. The '-raster' variants draw with the NumPy
+# rasterizer instead of matplotlib.
+PATTERNS = ('line', 'circle', 'line-raster', 'circle-raster')
+
+# Patterns whose results report a line count
+LINE_PATTERNS = ('line', 'line-raster')
+
+# The worker's figure, cleared and reused for every job it renders
+_FIGURE = None
+
+# The worker's render caches by directory
+_CACHES = {}
+
+
+def _format_value(value):
+    """Short, filename friendly form of a number (10.0 -> 10, 0.25 -> 0.25)"""
+    text = repr(float(value))
+    if text.endswith('.0'):
+        text = text[:-2]
+    return text
+
+
+def build_jobs(pattern, sizes, increments, out_dir, dpi=150, cache_dir=None, cache_max_bytes=DEFAULT_MAX_BYTES):
+    """
+    Create one render job per (size, increment) combination.
+
+    Every job gets its own output file named after the pattern and its
+    parameters. Repeated combinations get a numeric suffix instead of
+    overwriting each other.
+
+    Returns:
+        list: (pattern, size, increment, path, dpi, cache_dir, cache_max_bytes) tuples
+    """
+    jobs = []
+    used_names = set()
+    for size, increment in itertools.product(sizes, increments):
+        base = f'{pattern}_size-{_format_value(size)}_inc-{_format_value(increment)}'
+        name = base
+        suffix = 2
+        while name in used_names:
+            name = f'{base}_{suffix}'
+            suffix += 1
+        used_names.add(name)
+        jobs.append((pattern, size, increment, os.path.join(out_dir, name + '.png'), dpi,
+                     cache_dir, cache_max_bytes))
+    return jobs
+
+
+def _worker_figure():
+    """The figure owned by this process, created on first use"""
+    global _FIGURE
+    if _FIGURE is None:
+        _FIGURE = plt.figure(figsize=(8, 8))
+    else:
+        _FIGURE.clf()
+    return _FIGURE
+
+
+def _worker_cache(directory, max_bytes):
+    cache = _CACHES.get(directory)
+    if cache is None:
+        cache = _CACHES[directory] = RenderCache(directory, max_bytes)
+    return cache
+
+
+def render_pattern(pattern, size, increment, path, dpi=150):
+    """
+    Render one image to path.
+
+    Returns:
+        int: Number of lines drawn, None for patterns without lines
+    """
+    if pattern == 'line-raster':
+        return sum(render_envelope_png(size, increment, path, pixels=FIGURE_INCHES * dpi))
+    if pattern == 'circle-raster':
+        render_circles_png(*four_circle_layout(increment), size, path, pixels=FIGURE_INCHES * dpi)
+        return None
+
+    fig = _worker_figure()
+    ax = fig.add_subplot(1, 1, 1)
+    lines = None
+    if pattern == 'line':
+        lines = sum(plot_envelope(ax, size, increment))
+    elif pattern == 'circle':
+        plot_circles(ax, size, increment)
+    else:
+        raise ValueError(f"Unknown pattern: {pattern}")
+    fig.tight_layout()
+    fig.savefig(path, dpi=dpi, bbox_inches='tight')
+    return lines
+
+
+def render_job(job):
+    """
+    Render a single job, through the render cache when one is configured.
+    Errors are returned rather than raised so one bad combination does not
+    stop the whole sweep.
+
+    Returns:
+        dict: Job parameters with 'lines', 'cached', 'seconds' and 'error'
+    """
+    pattern, size, increment, path, dpi, cache_dir, cache_max_bytes = job
+    result = {'pattern': pattern, 'size': size, 'increment': increment, 'path': path,
+              'lines': None, 'cached': False, 'seconds': 0.0, 'error': None}
+    started = time.perf_counter()
+    try:
+        if cache_dir is None:
+            result['lines'] = render_pattern(pattern, size, increment, path, dpi)
+        else:
+            cache = _worker_cache(cache_dir, cache_max_bytes)
+            key = pattern_key(pattern, size, increment, dpi=dpi)
+            result['cached'], result['lines'] = cache.get_or_render(
+                key, path, lambda target: render_pattern(pattern, size, increment, target, dpi))
+            if result['cached'] and pattern in LINE_PATTERNS:
+                result['lines'] = predict_line_count(size, increment)
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+    result['seconds'] = time.perf_counter() - started
+    return result
+
+
+def render_grid(pattern, sizes, increments, out_dir='renders', workers=None, dpi=150, progress=None,
+                cache_dir=None, cache_max_bytes=DEFAULT_MAX_BYTES):
+    """
+    Render every (size, increment) combination of a pattern headlessly.
+
+    Jobs are spread over a process pool; each worker keeps one figure and
+    reuses it for all the jobs it gets.
+
+    Args:
+        pattern (str): One of PATTERNS
+        sizes (list): Axis sizes to sweep
+        increments (list): Increments (radii for 'circle') to sweep
+        out_dir (str): Directory the PNG files are written to
+        workers (int): Number of processes, defaults to the CPU count.
+            1 renders in the current process.
+        dpi (int): Output resolution
+        progress (callable): Called with each result as it completes
+        cache_dir (str): Render cache directory, None renders everything
+        cache_max_bytes (int): Size limit of the render cache
+
+    Returns:
+        list: Result dicts from render_job, in job order
+    """
+    if pattern not in PATTERNS:
+        raise ValueError(f"Unknown pattern '{pattern}', expected one of {', '.join(PATTERNS)}")
+
+    os.makedirs(out_dir, exist_ok=True)
+    jobs = build_jobs(pattern, sizes, increments, out_dir, dpi, cache_dir, cache_max_bytes)
+    workers = min(workers or os.cpu_count() or 1, max(len(jobs), 1))
+
+    if workers == 1:
+        return _collect(map(render_job, jobs), progress)
+
+    # Larger chunks cut down on inter-process traffic for big sweeps
+    chunksize = max(1, len(jobs) // (workers * 8))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return _collect(pool.map(render_job, jobs, chunksize=chunksize), progress)
+
+
+def _collect(outcomes, progress):
+    results = []
+    for result in outcomes:
+        results.append(result)
+        if progress:
+            progress(result)
+    return results
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Render line/circle patterns for every size and increment combination.")
+    parser.add_argument('--pattern', choices=PATTERNS, default='line')
+    parser.add_argument('--sizes', required=True, type=parse_values,
+                        help="e.g. 10,20,50 or 10:100:10 (inclusive range)")
+    parser.add_argument('--increments', required=True, type=parse_values,
+                        help="e.g. 0.1,0.5 or 0.1:1:0.1 (inclusive range)")
+    parser.add_argument('--out-dir', default='renders', help="Directory for the PNG files")
+    parser.add_argument('--workers', type=int, default=None, help="Processes to use (default: CPU count)")
+    parser.add_argument('--dpi', type=int, default=150)
+    parser.add_argument('--cache-dir', default=None,
+                        help="Serve repeated renders from this cache directory")
+    parser.add_argument('--cache-max-mb', type=float, default=DEFAULT_MAX_BYTES / (1024 * 1024),
+                        help="Size limit of the render cache in MB")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    def report(result):
+        status = result['error'] or result['path']
+        lines = f" ({result['lines']} lines)" if result['lines'] is not None else ''
+        cached = ' (cached)' if result['cached'] else ''
+        print(f"size={result['size']} increment={result['increment']}: {status}{lines}{cached} "
+              f"[{result['seconds']:.2f}s]")
+
+    started = time.perf_counter()
+    cache_max_bytes = int(args.cache_max_mb * 1024 * 1024)
+    results = render_grid(args.pattern, args.sizes, args.increments, args.out_dir,
+                          args.workers, args.dpi, progress=report,
+                          cache_dir=args.cache_dir, cache_max_bytes=cache_max_bytes)
+    failed = sum(1 for result in results if result['error'])
+
+    print(f"\nRendered {len(results) - failed} of {len(results)} images to {args.out_dir} "
+          f"in {time.perf_counter() - started:.1f}s")
+    if args.cache_dir:
+        # Workers keep their own counters, so count hits from the results
+        hits = sum(1 for result in results if result['cached'])
+        stats = RenderCache(args.cache_dir, cache_max_bytes).stats()
+        print(f"Cache: {hits} hits, {len(results) - failed - hits} misses, "
+              f"{stats['entries']} files / {stats['bytes'] / (1024 * 1024):.1f} MB in {args.cache_dir}")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,293 @@
+import itertools
+import math
+import operator
+import re
+from dataclasses import dataclass
+from functools import cached_property
+
+from calc_numbers import BASES, DIGIT_BITS, PREFIXES, NumberError, whole_number
+from calc_parser import ExpressionError, compile_expression
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Array dtypes by word size
+WORD_DTYPES = {8: 'uint8', 16: 'uint16', 32: 'uint32', 64: 'uint64'}
+
+# Name of the pasted values in array expressions, e.g. "VALUES AND 0xff"
+VALUES = 'VALUES'
+
+# Rows formatted at a time, bounds the size of the digit matrices
+CHUNK_ROWS = 1 << 16
+
+_DIGIT_CHARS = b'0123456789abcdef'
+
+# A 0b prefix at the start of a value
+_BINARY_PREFIX = re.compile(r'(?<![0-9A-Za-z_])0b')
+
+
+def _require_numpy():
+    if np is None:
+        raise RuntimeError("NumPy is required for array mode (pip install numpy)")
+
+
+def _digit_table():
+    # Digit value of every byte, 255 for bytes that are not digits
+    table = np.full(256, 255, dtype=np.uint8)
+    for value, char in enumerate(_DIGIT_CHARS):
+        table[char] = value
+        table[ord(chr(char).upper())] = value
+    return table
+
+
+def word_dtype(word_size):
+    """NumPy dtype of a word size, which must be 8, 16, 32 or 64"""
+    _require_numpy()
+    if word_size not in WORD_DTYPES:
+        raise ValueError(f"Array mode supports word sizes {sorted(WORD_DTYPES)}, got {word_size}")
+    return np.dtype(WORD_DTYPES[word_size])
+
+
+def _safe_divisor(right):
+    if np.any(np.asarray(right) == 0):
+        raise ZeroDivisionError("division by zero in array")
+    return right
+
+
+@dataclass(frozen=True)
+class ArrayNumbers:
+    """
+    Stand-in for NumberSystem that compiles expressions to whole-array
+    NumPy operations on unsigned words.
+
+    Numbers become scalars of the word's dtype, so every operation wraps
+    to the word size like the calculator's two's complement words do.
+    Division truncates like int mode.
+    """
+
+    word_size: int = 32
+
+    def __post_init__(self):
+        word_dtype(self.word_size)
+
+    def __reduce__(self):
+        # Like NumberSystem, without the cached operator tables
+        return (ArrayNumbers, (self.word_size,))
+
+    @property
+    def dtype(self):
+        return word_dtype(self.word_size)
+
+    @property
+    def mask(self):
+        return (1 << self.word_size) - 1
+
+    def literal(self, value):
+        return self.dtype.type(whole_number(value) & self.mask)
+
+    @cached_property
+    def operations(self):
+        """Binary operator functions keyed by parser symbol"""
+        return {
+            'AND': np.bitwise_and,
+            'OR': np.bitwise_or,
+            'XOR': np.bitwise_xor,
+            '+': np.add,
+            '-': np.subtract,
+            '*': np.multiply,
+            '/': lambda left, right: np.floor_divide(left, _safe_divisor(right)),
+            '%': lambda left, right: np.remainder(left, _safe_divisor(right)),
+        }
+
+    @cached_property
+    def unary_operations(self):
+        """Unary operator functions keyed by parser symbol"""
+        return {'-': np.negative, '+': operator.pos}
+
+
+def evaluate_array(text, values, base_mode="HEX", word_size=32):
+    """
+    Evaluate an expression over a whole array of words at once.
+
+    Args:
+        text (str): Expression using VALUES for the array, e.g. "VALUES AND FF00"
+        values: NumPy array, Python array.array or sequence of ints
+        base_mode (str): Base of numbers without a prefix in text
+        word_size (int): 8, 16, 32 or 64
+
+    Returns:
+        numpy.ndarray: One result per value, of the word's unsigned dtype
+    """
+    numbers = ArrayNumbers(word_size)
+    values = np.asarray(values)
+    if values.dtype != numbers.dtype:
+        values = (values.astype(np.uint64) & np.uint64(numbers.mask)).astype(numbers.dtype)
+    with np.errstate(over='ignore'):
+        result = compile_expression(text, base_mode, numbers).evaluate({VALUES: values})
+    return np.broadcast_to(np.asarray(result, dtype=numbers.dtype), values.shape).copy()
+
+
+def _parse_fixed_width(text, base, word_size):
+    # Register dumps usually have one value per line, all of the same
+    # width: then the text is a byte matrix and no string is split.
+    # None when the text is not like that (or has anything unusual).
+    try:
+        data = text.rstrip().encode('ascii') + b'\n'
+    except UnicodeEncodeError:
+        return None
+    line = data.find(b'\n') + 1
+    if line < 2 or len(data) % line:
+        return None
+    matrix = np.frombuffer(data, dtype=np.uint8).reshape(-1, line)
+    if (matrix[:, -1] != ord('\n')).any():
+        return None
+
+    start, end = 0, line - 1
+    if (matrix[:, end - 1] == ord('\r')).all():
+        end -= 1
+    prefix = bytes(matrix[0, :2])
+    if prefix in (b'0x', b'0b', b'0o') and (matrix[:, :2] == matrix[0, :2]).all():
+        base = {b'0x': 16, b'0b': 2, b'0o': 8}[prefix]
+        start = 2
+    # Only when no value can overflow a uint64 on the way
+    if end <= start or (end - start) * math.log2(base) > 64:
+        return None
+
+    digits = _digit_table()[matrix[:, start:end]]
+    if digits.max() >= base:
+        return None
+    values = np.zeros(len(matrix), dtype=np.uint64)
+    for column in digits.T:
+        values = values * np.uint64(base) + column
+    return values
+
+
+def _parse_token(token, base, maximum):
+    negative = token.startswith('-')
+    body = token[1:] if negative else token
+    try:
+        value = int(body, 0) if body[:2] in ('0x', '0b', '0o') else int(body, base)
+    except ValueError:
+        raise ExpressionError(f"{token!r} is not a valid number") from None
+    if value > maximum:
+        raise NumberError(f"{token} does not fit in {maximum.bit_length()} bits")
+    return (-value) & maximum if negative else value
+
+
+def parse_values(text, base_mode="HEX", word_size=32):
+    """
+    Parse a column of numbers, as pasted from a register dump.
+
+    Values are separated by whitespace, newlines or commas. Numbers without
+    a prefix are read in base_mode; 0x/0b/0o prefixes, a leading minus
+    (two's complement) and _ digit separators work like in the calculator.
+    A column of equal width lines is converted as one byte matrix, other
+    text through int() per value.
+
+    Returns:
+        numpy.ndarray: The values, unsigned dtype of word_size
+
+    Raises:
+        ExpressionError: For a token that is not a number
+        NumberError: For a value wider than word_size
+    """
+    dtype = word_dtype(word_size)
+    base = BASES[base_mode]
+    maximum = (1 << word_size) - 1
+
+    values = _parse_fixed_width(text, base, word_size)
+    if values is None:
+        tokens = text.replace(',', ' ').split()
+        try:
+            # int() would read a 0b prefix as hex digits in HEX mode
+            if base == 16 and _BINARY_PREFIX.search(text):
+                raise ValueError
+            values = np.fromiter(map(int, tokens, itertools.repeat(base)), dtype=np.uint64, count=len(tokens))
+        except (ValueError, OverflowError):
+            values = np.fromiter((_parse_token(token, base, maximum) for token in tokens),
+                                 dtype=np.uint64, count=len(tokens))
+
+    too_wide = values > np.uint64(maximum)
+    if too_wide.any():
+        raise NumberError(f"Value {int(values[np.argmax(too_wide)])} does not fit in {word_size} bits")
+    return values.astype(dtype)
+
+
+def _format_chunk(values, base_mode, word_size, prefix, pad, signed, separator):
+    count = len(values)
+    magnitude = values.astype(np.uint64)
+    mask = np.uint64((1 << word_size) - 1)
+    negative = np.zeros(count, dtype=bool)
+    if base_mode == "DEC" and signed:
+        negative = (magnitude >> np.uint64(word_size - 1)) & np.uint64(1) == 1
+        magnitude = np.where(negative, (np.uint64(0) - magnitude) & mask, magnitude)
+
+    if base_mode == "DEC":
+        width = len(str((1 << word_size) - 1))
+        digits = np.empty((count, width), dtype=np.uint8)
+        for column in range(width - 1, -1, -1):
+            digits[:, column] = magnitude % np.uint64(10)
+            magnitude //= np.uint64(10)
+    else:
+        bits = DIGIT_BITS[base_mode]
+        width = -(-word_size // bits)
+        shifts = np.arange(width - 1, -1, -1, dtype=np.uint64) * np.uint64(bits)
+        digits = ((magnitude[:, None] >> shifts) & np.uint64((1 << bits) - 1)).astype(np.uint8)
+
+    chars = np.frombuffer(_DIGIT_CHARS, dtype=np.uint8)[digits]
+    if pad:
+        keep = np.ones(digits.shape, dtype=bool)
+    else:
+        # Drop leading zeros, but keep the last digit of zero
+        keep = np.maximum.accumulate(digits != 0, axis=1)
+        keep[:, -1] = True
+
+    head = '-' + (PREFIXES[base_mode] if prefix else '')
+    head_chars = np.frombuffer(head.encode(), dtype=np.uint8)
+    head_keep = np.ones((count, len(head)), dtype=bool)
+    head_keep[:, 0] = negative
+
+    matrix = np.hstack([np.broadcast_to(head_chars, (count, len(head))), chars,
+                        np.full((count, 1), ord(separator), dtype=np.uint8)])
+    kept = np.hstack([head_keep, keep, np.ones((count, 1), dtype=bool)])
+    return matrix[kept].tobytes().decode('ascii')
+
+
+def format_text(values, base_mode="HEX", prefix=True, pad=False, signed=False, separator='\n'):
+    """
+    Format a whole array of words as text in one go, one value per line.
+
+    The digits of all values are computed as a matrix, so no Python string
+    is built per value.
+
+    Args:
+        values: Unsigned NumPy array (or array.array) of 8 to 64 bit words
+        base_mode (str): DEC, HEX, BIN or OCT
+        prefix (bool): Add 0x/0b/0o like hex(), bin() and oct()
+        pad (bool): Keep leading zeros, so every value has the word's width
+        signed (bool): Show DEC values as two's complement signed numbers
+        separator (str): Single character between values
+
+    Returns:
+        str: The values, separated by separator
+    """
+    _require_numpy()
+    values = np.asarray(values)
+    if values.dtype.kind == 'i':
+        values = values.view(values.dtype.str.replace('i', 'u'))
+    word_size = values.dtype.itemsize * 8
+    word_dtype(word_size)
+    values = values.ravel()
+
+    text = ''.join(_format_chunk(values[start:start + CHUNK_ROWS], base_mode, word_size,
+                                 prefix, pad, signed, separator)
+                   for start in range(0, len(values), CHUNK_ROWS))
+    return text[:-1]
+
+
+def format_values(values, base_mode="HEX", prefix=True, pad=False, signed=False):
+    """Like format_text, as a list of strings"""
+    text = format_text(values, base_mode, prefix, pad, signed)
+    return text.split('\n') if text else []
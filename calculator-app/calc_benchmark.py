@@ -0,0 +1,71 @@
+import argparse
+import os
+import random
+import time
+
+from calc_engine import CHUNK_SIZE, evaluate_many
+from calc_numbers import NumberSystem
+from calc_parser import compile_expression
+
+
+def register_expressions(count, distinct, seed=0):
+    """
+    Register mask style HEX expressions, e.g. "0x1f00 AND FF0F XOR 0x8",
+    drawn from a pool of distinct ones so that repeats hit the compile cache.
+    """
+    rng = random.Random(seed)
+    pool = []
+    for _ in range(distinct):
+        terms = [f'0x{rng.getrandbits(32):x}' if rng.random() < 0.5 else f'{rng.getrandbits(16):X}'
+                 for _ in range(rng.randint(2, 5))]
+        operators = [rng.choice(('AND', 'OR', 'XOR', '+', '-')) for _ in terms[1:]]
+        pool.append(' '.join(term for pair in zip(terms, operators + ['']) for term in pair).strip())
+    return (rng.choice(pool) for _ in range(count))
+
+
+def measure(expressions, workers, numbers, as_text, chunk_size=CHUNK_SIZE):
+    """
+    Expressions per second of evaluate_many on a fresh cache, and the CPU
+    time this process spends per expression. With workers > 1 the latter
+    bounds the speedup: the pool goes no faster than this process hands
+    out chunks and collects their results.
+
+    Returns:
+        tuple: (throughput, microseconds of this process per expression)
+    """
+    compile_expression.cache_clear()
+    started = time.perf_counter()
+    started_cpu = time.process_time()
+    evaluated = 0
+    for _ in evaluate_many(expressions, "HEX", numbers, workers, as_text, chunk_size):
+        evaluated += 1
+    cpu = time.process_time() - started_cpu
+    return evaluated / (time.perf_counter() - started), cpu / evaluated * 1e6
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Measure expression throughput of the calculator engine.")
+    parser.add_argument('--count', type=int, default=200_000, help="Expressions per run")
+    parser.add_argument('--distinct', type=int, nargs='+', default=[100, 200_000],
+                        help="Distinct expressions per run; fewer means more compile cache hits")
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--word-size', type=int, default=32)
+    parser.add_argument('--as-text', action='store_true', help="Also format every result as HEX text")
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help="Expressions per worker chunk")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    numbers = NumberSystem('int', args.word_size)
+    print(f"{args.count} HEX expressions, {args.word_size}-bit int mode, {os.cpu_count()} CPUs")
+    for distinct in args.distinct:
+        # Generated up front, so the timings are of evaluate_many alone
+        expressions = list(register_expressions(args.count, distinct))
+        for workers in args.workers:
+            rate, cpu = measure(expressions, workers, numbers, args.as_text, args.chunk_size)
+            print(f"  distinct={distinct:<8} workers={workers:<3} {rate:12,.0f} expressions/s"
+                  f"  {cpu:6.2f} µs/expression in this process")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,455 @@
+import argparse
+import itertools
+import sys
+from collections import deque
+
+from calc_numbers import BASES, DEFAULT_NUMBERS, NUMBER_MODES, BaseStrings, NumberError, NumberSystem, whole_number
+from calc_parser import NAMES, ExpressionError, compile_expression
+
+# Expressions handed to a worker process at a time by evaluate_many; large
+# enough that pickling and the pool's bookkeeping stay a small part of the
+# main process's work per expression
+CHUNK_SIZE = 10000
+
+# Evaluations kept in CalculatorEngine.history, the oldest are dropped
+HISTORY_SIZE = 100
+
+
+def _digit_value(char):
+    """Value of a 0-9/A-F digit character, None for anything else"""
+    try:
+        return int(char, 16) if len(char) == 1 else None
+    except ValueError:
+        return None
+
+
+def format_value(value, base_mode="DEC", numbers=DEFAULT_NUMBERS):
+    """Text of a value as the calculator shows it: whole numbers in base_mode"""
+    if type(value) is int:
+        return BaseStrings(value, numbers).text(base_mode)
+    return str(value)
+
+
+def preview(text, base_mode="DEC", numbers=DEFAULT_NUMBERS):
+    """
+    The result = would show for text, for live evaluation while typing.
+
+    Touches no engine state, so it can run on another thread.
+
+    Returns:
+        str: The formatted result, None while the text is incomplete or
+            invalid, or uses names like VALUES
+    """
+    try:
+        value = compile_expression(text, base_mode, numbers).evaluate()
+    except (ExpressionError, ArithmeticError):
+        return None
+    return format_value(value, base_mode, numbers)
+
+
+class CalculatorEngine:
+    """
+    The calculator without any widgets.
+
+    Holds the expression being typed, the base mode and the number system,
+    and gives the buttons the same meaning as Calculator does, which only
+    shows display and status after each press.
+
+    Args:
+        base_mode (str): DEC, HEX, BIN or OCT
+        numbers (NumberSystem): Number mode and word size
+    """
+
+    def __init__(self, base_mode="DEC", numbers=DEFAULT_NUMBERS):
+        if base_mode not in BASES:
+            raise ValueError(f"Unknown base mode {base_mode!r}")
+        self.expression = ""
+        self.display = ""
+        self.base_mode = base_mode
+        self.status = base_mode
+        self.numbers = numbers
+        # The number on display while it is the whole expression, with its
+        # text in each base cached
+        self.operand = None
+        # Array mode: the pasted column the expression calls VALUES
+        self.values = None
+        # (expression, result) of the latest evaluations, newest last
+        self.history = deque(maxlen=HISTORY_SIZE)
+
+    def _set_expression(self, expression):
+        self.expression = expression
+        self.display = expression
+
+    def _error(self):
+        self.expression = ""
+        self.display = "Error"
+        self.operand = None
+        self.values = None
+        self._reset_status()
+
+    def _reset_status(self):
+        self.status = self.base_mode
+        if self.values is not None:
+            self.status += f" ({len(self.values)} values)"
+
+    @property
+    def array_word_size(self):
+        """Word size of array mode: the calculator's if NumPy has it, else 64"""
+        word_size = self.numbers.word_size
+        return word_size if word_size in (8, 16, 32, 64) else 64
+
+    def _show_values(self):
+        # numpy is only imported once array mode is used
+        from calc_arrays import VALUES
+        self.operand = None
+        self._set_expression(VALUES)
+        self._reset_status()
+
+    def paste(self, text):
+        """
+        Paste text. A single value is typed as it is, a column of values
+        (one per line, or separated by spaces or commas) switches to array
+        mode: the expression then calls the column VALUES, and = applies it
+        to all of them at once.
+        """
+        text = text.strip()
+        if len(text.replace(',', ' ').split()) <= 1:
+            self.operand = None
+            self._set_expression(self.expression + text)
+            return
+
+        from calc_arrays import parse_values
+        try:
+            self.values = parse_values(text, self.base_mode, self.array_word_size)
+        except (ExpressionError, ArithmeticError, RuntimeError) as e:
+            self.status = f"{self.base_mode} (paste failed: {e})"
+            return
+        self._show_values()
+
+    def evaluate_values(self):
+        """Apply the expression to every pasted value, the results become the new VALUES"""
+        from calc_arrays import evaluate_array
+        self.values = evaluate_array(self.expression, self.values, self.base_mode, self.array_word_size)
+        self._show_values()
+
+    def values_text(self):
+        """The values of array mode in the current base, one per line"""
+        from calc_arrays import format_text
+        return format_text(self.values, self.base_mode, signed=self.numbers.signed)
+
+    def evaluate(self, text=None):
+        """
+        Value of text (by default the current expression) in the current base.
+
+        Raises:
+            ExpressionError: For invalid text
+            ArithmeticError: For division by zero or values the number mode
+                cannot represent
+        """
+        return compile_expression(self.expression if text is None else text,
+                                  self.base_mode, self.numbers).evaluate()
+
+    def value(self):
+        """Value of the current expression, None if it has none"""
+        try:
+            return self.evaluate()
+        except (ExpressionError, ArithmeticError):
+            return None
+
+    def format(self, value):
+        """A value as text in the current base"""
+        return format_value(value, self.base_mode, self.numbers)
+
+    def load(self, expression):
+        """Replace the expression, e.g. with one from the history"""
+        self.operand = None
+        self._set_expression(expression)
+
+    def set_numbers(self, numbers):
+        """Switch number mode or word size"""
+        self.numbers = numbers
+        # Cached texts depend on the word size
+        self.operand = None
+        if self.values is not None:
+            self.values = self.values.astype(f'uint{self.array_word_size}')
+        self._reset_status()
+
+    def change_base(self, mode):
+        """
+        Change the number base mode, converting the number on display.
+
+        Returns:
+            bool: False if the value has a fractional part, which only has a
+                DEC form; the base is then left unchanged
+        """
+        if mode not in BASES:
+            raise ValueError(f"Unknown base mode {mode!r}")
+        if self.expression and self.expression not in ['+', '-', '*', '/', '%']:
+            if self.operand is None:
+                value = self.value()
+                if value is not None:
+                    try:
+                        self.operand = BaseStrings(whole_number(value), self.numbers)
+                    except NumberError:
+                        # Never truncate
+                        self.status = f"{self.base_mode} ({value} is not a whole number)"
+                        return False
+
+            # Formatted once per base, switching back reuses the cached text
+            if self.operand is not None:
+                self._set_expression(self.operand.text(mode))
+
+        self.base_mode = mode
+        self._reset_status()
+        return True
+
+    def show_result(self, result):
+        """Put a result on the display, in the current base if it is a whole number"""
+        if type(result) is int:
+            self.operand = BaseStrings(result, self.numbers)
+            self._set_expression(self.operand.text(self.base_mode))
+        else:
+            self.operand = None
+            self._set_expression(str(result))
+
+    def type_digit(self, button):
+        """Append a digit, keeping the cached texts of the number up to date"""
+        digit = _digit_value(button)
+        if self.operand is None and not self.expression:
+            self.operand = BaseStrings(0, self.numbers)
+
+        if digit >= BASES[self.base_mode]:
+            # Not valid in this base, = reports the error
+            self.operand = None
+        elif self.operand is not None:
+            try:
+                self.operand.push_digit(self.base_mode, digit)
+            except NumberError:
+                return  # Would not fit the word size
+
+        self._set_expression(self.expression + button)
+
+    def press_digit(self, char):
+        """
+        Handle a typed 0-9/A-F digit like its button, except that C is the
+        hex digit rather than clear.
+
+        Returns:
+            str: The display text afterwards
+        """
+        self._reset_status()
+        # Hex digits only in HEX mode, like the buttons
+        if char in '0123456789' or self.base_mode == 'HEX':
+            self.type_digit(char)
+        return self.display
+
+    def backspace(self):
+        """Remove the last character"""
+        # Names go as a whole
+        name = next((name for name in NAMES if self.expression.endswith(name)), None)
+        if name:
+            self.operand = None
+            self._set_expression(self.expression[:-len(name)])
+            return
+
+        removed = self.expression[-1:]
+        expression = self.expression[:-1]
+        if self.operand is not None:
+            last = _digit_value(expression[-1:])
+            if _digit_value(removed) is not None and last is not None and last < BASES[self.base_mode]:
+                self.operand.pop_digit(self.base_mode)
+            else:
+                self.operand = None
+        self._set_expression(expression)
+
+    def press(self, button):
+        """
+        Handle one calculator button.
+
+        Returns:
+            str: The display text afterwards
+        """
+        self._reset_status()
+        if button == 'C':
+            self.operand = None
+            self.values = None
+            self._set_expression("")
+            self._reset_status()
+        elif button == 'CE':
+            self.backspace()
+        elif button == '=':
+            try:
+                expression = self.expression
+                if self.values is not None:
+                    self.evaluate_values()
+                    self.history.append((expression, f"{len(self.values)} values"))
+                else:
+                    self.show_result(self.evaluate())
+                    self.history.append((expression, self.display))
+            except (ExpressionError, ArithmeticError):
+                self._error()
+        elif button == '√':
+            try:
+                value = self.value()
+                if value is None:
+                    raise NumberError("Nothing to take the square root of")
+                self.show_result(self.numbers.sqrt(value))
+            except ArithmeticError:
+                self._error()
+        elif button in ['AND', 'OR', 'XOR']:
+            self.operand = None
+            self._set_expression(self.expression + button)
+        elif button in ['A', 'B', 'C', 'D', 'E', 'F']:
+            # Hex digits only available in HEX mode
+            if self.base_mode == 'HEX':
+                self.type_digit(button)
+        elif _digit_value(button) is not None:
+            self.type_digit(button)
+        elif button != '':
+            self.operand = None
+            self._set_expression(self.expression + button)
+        return self.display
+
+
+def _evaluate_one(text, base_mode, numbers, as_text):
+    try:
+        value = compile_expression(text, base_mode, numbers).evaluate()
+    except (ExpressionError, ArithmeticError) as e:
+        return (text, None, str(e) or type(e).__name__)
+    if as_text:
+        value = format_value(value, base_mode, numbers)
+    return (text, value, None)
+
+
+# Settings of an evaluate_many worker process
+_WORKER_SETTINGS = None
+
+
+def _init_worker(settings):
+    global _WORKER_SETTINGS
+    _WORKER_SETTINGS = settings
+
+
+def _evaluate_chunk(chunk):
+    # Only values and the errors by position go back, the caller still has
+    # the expressions; a flat list pickles several times faster than tuples
+    values = []
+    errors = {}
+    for text in chunk:
+        _, value, error = _evaluate_one(text, *_WORKER_SETTINGS)
+        if error is not None:
+            errors[len(values)] = error
+        values.append(value)
+    return values, errors
+
+
+def _chunk_results(chunk, values, errors):
+    if not errors:
+        return zip(chunk, values, itertools.repeat(None))
+    return ((text, value, errors.get(position))
+            for position, (text, value) in enumerate(zip(chunk, values)))
+
+
+def read_expressions(lines):
+    """Expressions of a file or iterable of lines, skipping blank lines and # comments"""
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith('#'):
+            yield line
+
+
+def evaluate_many(expressions, base_mode="DEC", numbers=DEFAULT_NUMBERS, workers=1,
+                  as_text=False, chunk_size=CHUNK_SIZE):
+    """
+    Evaluate a stream of expressions, yielding results in input order.
+
+    Expressions are consumed lazily, so a file of any length streams
+    through in bounded memory. Compiled forms are cached, so repeated
+    expressions (and repeated register masks) are parsed once per process.
+    With workers > 1 chunks are evaluated in a process pool with only a
+    few chunks in flight at a time.
+
+    Args:
+        expressions (iterable or str): Expression strings, or the path of a
+            file with one expression per line (blank lines and # comments
+            are skipped)
+        base_mode (str): DEC, HEX, BIN or OCT
+        numbers (NumberSystem): Number mode and word size
+        workers (int): Processes to evaluate in
+        as_text (bool): Yield values formatted like the calculator display
+            (formatted in the workers) instead of numbers
+        chunk_size (int): Expressions sent to a worker at a time
+
+    Yields:
+        tuple: (expression, value, error), value is None and error a
+            message when the expression could not be evaluated
+    """
+    if base_mode not in BASES:
+        raise ValueError(f"Unknown base mode {base_mode!r}")
+    if isinstance(expressions, str):
+        with open(expressions) as f:
+            yield from evaluate_many(read_expressions(f), base_mode, numbers, workers, as_text, chunk_size)
+        return
+
+    settings = (base_mode, numbers, as_text)
+    if workers <= 1:
+        for text in expressions:
+            yield _evaluate_one(text, *settings)
+        return
+
+    # Only here: multiprocessing would add to the calculator's startup time
+    from concurrent.futures import ProcessPoolExecutor
+
+    iterator = iter(expressions)
+    chunks = iter(lambda: list(itertools.islice(iterator, chunk_size)), [])
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(settings,)) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append((chunk, pool.submit(_evaluate_chunk, chunk)))
+            if len(pending) >= 2 * workers:
+                chunk, future = pending.popleft()
+                yield from _chunk_results(chunk, *future.result())
+        while pending:
+            chunk, future = pending.popleft()
+            yield from _chunk_results(chunk, *future.result())
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Evaluate calculator expressions from a file, one per line.")
+    parser.add_argument('input', help="File of expressions, - for stdin")
+    parser.add_argument('-o', '--output', help="Write results here instead of stdout")
+    parser.add_argument('--base', choices=list(BASES), default="DEC", help="Base of numbers without a prefix")
+    parser.add_argument('--mode', choices=NUMBER_MODES, default='int', help="Number mode (default: int)")
+    parser.add_argument('--word-size', type=int, help="Wrap results to this many bits")
+    parser.add_argument('--unsigned', action='store_true', help="Wrap to 0..2**bits-1 instead of signed")
+    parser.add_argument('--workers', type=int, default=1, help="Processes to evaluate in")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    numbers = NumberSystem(args.mode, args.word_size, not args.unsigned)
+    source = sys.stdin if args.input == '-' else open(args.input)
+    target = open(args.output, 'w') if args.output else sys.stdout
+
+    failed = 0
+    try:
+        for text, value, error in evaluate_many(read_expressions(source), args.base, numbers,
+                                                args.workers, as_text=True):
+            if error is None:
+                target.write(f"{text} = {value}\n")
+            else:
+                target.write(f"{text} = Error: {error}\n")
+                failed += 1
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+
+    if failed:
+        print(f"Failed expressions: {failed}", file=sys.stderr)
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,283 @@
+import functools
+import math
+import operator
+from dataclasses import dataclass
+from decimal import Context, Decimal
+from fractions import Fraction
+
+BASES = {"DEC": 10, "HEX": 16, "BIN": 2, "OCT": 8}
+PREFIXES = {"DEC": '', "HEX": '0x', "BIN": '0b', "OCT": '0o'}
+FORMAT_CODES = {"DEC": 'd', "HEX": 'x', "BIN": 'b', "OCT": 'o'}
+
+# Bits per digit of the power of two bases
+DIGIT_BITS = {"HEX": 4, "OCT": 3, "BIN": 1}
+
+# float keeps the old eval behaviour (7/2 = 3.5, 8/2 = 4.0); the others are exact
+NUMBER_MODES = ('float', 'int', 'fraction', 'decimal')
+WORD_SIZES = (None, 8, 16, 32, 64, 128, 256, 512, 1024, 2048, 4096)
+
+
+class NumberError(ArithmeticError):
+    """Raised when a value has no meaning in the current number mode"""
+
+
+def whole_number(value):
+    """The int equal to value, or NumberError if value has a fractional part"""
+    if type(value) is int:
+        return value
+    try:
+        integral = int(value)
+    except (OverflowError, ValueError):
+        raise NumberError(f"{value} is not a whole number") from None
+    if integral != value:
+        raise NumberError(f"{value} is not a whole number")
+    return integral
+
+
+def _truncating_divide(left, right):
+    # C style, like programmer calculators: -7 / 2 = -3
+    quotient = abs(left) // abs(right)
+    return -quotient if (left < 0) != (right < 0) else quotient
+
+
+def _truncating_remainder(left, right):
+    return left - right * _truncating_divide(left, right)
+
+
+def _exact_divide(left, right):
+    return Fraction(left) / right
+
+
+@dataclass(frozen=True)
+class NumberSystem:
+    """
+    The arithmetic the calculator does: number mode, word size and sign.
+
+    With a word size every whole number result wraps to that many bits in
+    two's complement, after each operation like on the hardware. Instances
+    are hashable, compiled expressions are cached per NumberSystem.
+
+    Args:
+        mode (str): One of NUMBER_MODES
+        word_size (int): Bits per word, None for unbounded integers
+        signed (bool): Wrap to -2**(bits-1)..2**(bits-1)-1 instead of 0..2**bits-1
+        precision (int): Significant digits in decimal mode
+    """
+
+    mode: str = 'float'
+    word_size: int = None
+    signed: bool = True
+    precision: int = 60
+
+    def __post_init__(self):
+        if self.mode not in NUMBER_MODES:
+            raise ValueError(f"Unknown number mode {self.mode!r}, expected one of {NUMBER_MODES}")
+        if self.word_size is not None and self.word_size < 1:
+            raise ValueError(f"Word size must be positive, got {self.word_size}")
+
+    def __reduce__(self):
+        # Only the fields: the cached operator tables hold lambdas, which
+        # cannot be pickled (e.g. to send to an evaluate_many worker)
+        return (NumberSystem, (self.mode, self.word_size, self.signed, self.precision))
+
+    @property
+    def mask(self):
+        return (1 << self.word_size) - 1
+
+    @functools.cached_property
+    def decimal_context(self):
+        return Context(prec=self.precision)
+
+    def wrap(self, value):
+        """Wrap a whole number to the word size (two's complement)"""
+        if self.word_size is None or type(value) is not int:
+            return value
+        value &= self.mask
+        if self.signed and value >> (self.word_size - 1):
+            value -= 1 << self.word_size
+        return value
+
+    def fits(self, value):
+        """Whether value is representable in the word, as signed or as a bit pattern"""
+        return self.word_size is None or value.bit_length() <= self.word_size
+
+    def _finish(self, value):
+        # Whole results become ints, so they can be wrapped and shown in any base
+        kind = type(value)
+        if kind is Fraction and value.denominator == 1:
+            value = value.numerator
+        elif kind is Decimal and value.is_finite() and value == value.to_integral_value():
+            value = int(value)
+        return self.wrap(value)
+
+    def literal(self, value):
+        """
+        Convert a parsed number to this mode.
+
+        Args:
+            value (int or Fraction): Whole numbers are ints, decimal
+                literals such as 0.1 arrive as exact Fractions
+        """
+        if type(value) is int:
+            return self.wrap(value)
+        if self.mode == 'float':
+            return float(value)
+        if self.mode == 'fraction':
+            return self._finish(value)
+        if self.mode == 'decimal':
+            context = self.decimal_context
+            return self._finish(context.divide(Decimal(value.numerator), Decimal(value.denominator)))
+        raise NumberError(f"{value} is not a whole number, int mode takes whole numbers only")
+
+    @functools.cached_property
+    def operations(self):
+        """Binary operator functions keyed by parser symbol"""
+        if self.mode == 'float':
+            arithmetic = {'+': operator.add, '-': operator.sub, '*': operator.mul,
+                          '/': operator.truediv, '%': operator.mod}
+        elif self.mode == 'int':
+            arithmetic = {'+': operator.add, '-': operator.sub, '*': operator.mul,
+                          '/': _truncating_divide, '%': _truncating_remainder}
+        elif self.mode == 'fraction':
+            arithmetic = {'+': operator.add, '-': operator.sub, '*': operator.mul,
+                          '/': _exact_divide, '%': operator.mod}
+        else:
+            context = self.decimal_context
+            arithmetic = {'+': context.add, '-': context.subtract, '*': context.multiply,
+                          '/': context.divide, '%': context.remainder}
+
+        def bitwise(function):
+            return lambda left, right: function(whole_number(left), whole_number(right))
+
+        functions = dict(arithmetic)
+        functions.update({
+            'AND': bitwise(operator.and_),
+            'OR': bitwise(operator.or_),
+            'XOR': bitwise(operator.xor),
+        })
+        if self.mode == 'float' and self.word_size is None:
+            return functions
+
+        finish = self._finish
+        return {symbol: (lambda function: lambda left, right: finish(function(left, right)))(function)
+                for symbol, function in functions.items()}
+
+    @functools.cached_property
+    def unary_operations(self):
+        """Unary operator functions keyed by parser symbol"""
+        finish = self._finish
+        return {'-': lambda value: finish(-value), '+': operator.pos}
+
+    def sqrt(self, value):
+        """Square root in this mode; int mode rounds down, fraction mode must be exact"""
+        if value < 0:
+            raise NumberError("Square root of a negative number")
+        if self.mode == 'float':
+            return math.sqrt(value)
+        if self.mode == 'int':
+            return math.isqrt(whole_number(value))
+        if self.mode == 'decimal':
+            return self._finish(self.decimal_context.sqrt(Decimal(value)))
+
+        value = Fraction(value)
+        numerator = math.isqrt(value.numerator)
+        denominator = math.isqrt(value.denominator)
+        if numerator * numerator != value.numerator or denominator * denominator != value.denominator:
+            raise NumberError(f"√{value} is not a fraction")
+        return self._finish(Fraction(numerator, denominator))
+
+
+DEFAULT_NUMBERS = NumberSystem()
+
+
+class BaseStrings:
+    """
+    A whole number with its text in each base, built on demand and cached.
+
+    Switching bases back and forth formats a wide value once per base. When
+    a digit is typed the value is updated in place: the text in the typed
+    base gets one more digit, BIN text gets the 4 (HEX) or 3 (OCT) bits of
+    the digit appended, and only the other bases are formatted again, the
+    next time they are asked for.
+
+    Negative values show a minus sign, or with a word size their two's
+    complement bit pattern in HEX, BIN and OCT (like hex(value & mask)).
+    """
+
+    def __init__(self, value=0, numbers=DEFAULT_NUMBERS):
+        self.value = value
+        self.numbers = numbers
+        self._digits = {}
+
+    def _pattern(self, base_mode):
+        # Whether base_mode shows the bit pattern instead of sign and magnitude
+        return base_mode != "DEC" and self.numbers.word_size is not None and self.value < 0
+
+    def _shown(self, base_mode):
+        # The non negative integer whose digits base_mode shows
+        if self._pattern(base_mode):
+            return self.value & self.numbers.mask
+        return abs(self.value)
+
+    def digits(self, base_mode):
+        """Digits of the value in base_mode, without sign or prefix"""
+        digits = self._digits.get(base_mode)
+        if digits is None:
+            digits = self._digits[base_mode] = format(self._shown(base_mode), FORMAT_CODES[base_mode])
+        return digits
+
+    def text(self, base_mode):
+        """The value as shown on the display in base_mode, e.g. -0x1f"""
+        sign = '-' if self.value < 0 and not self._pattern(base_mode) else ''
+        return sign + PREFIXES[base_mode] + self.digits(base_mode)
+
+    def _value_of(self, base_mode, shown):
+        # The value whose text in base_mode has the digits of shown
+        if base_mode != "DEC" and self.numbers.word_size is not None:
+            return self.numbers.wrap(shown)
+        return -shown if self.value < 0 else shown
+
+    def push_digit(self, base_mode, digit):
+        """
+        Append a digit typed in base_mode, as if typed after the shown text.
+
+        Raises:
+            NumberError: If the digit is not valid in the base or the value
+                would no longer fit the word size (in DEC: its signed or
+                unsigned range, so the display never shows a number that
+                evaluates to a wrapped one)
+        """
+        base = BASES[base_mode]
+        if not 0 <= digit < base:
+            raise NumberError(f"{digit:X} is not a {base_mode} digit")
+        shown = self._shown(base_mode) * base + digit
+        value = self._value_of(base_mode, shown)
+        if not self.numbers.fits(shown) or self.numbers.wrap(value) != value:
+            raise NumberError(f"Value does not fit in {self.numbers.word_size} bits")
+
+        updated = {}
+        typed = self._digits.get(base_mode)
+        if typed is not None:
+            updated[base_mode] = format(digit, 'x') if typed == '0' else typed + format(digit, 'x')
+        binary = self._digits.get("BIN")
+        if base_mode in ("HEX", "OCT") and binary is not None:
+            bits = DIGIT_BITS[base_mode]
+            updated["BIN"] = format(digit, 'b') if binary == '0' else binary + format(digit, f'0{bits}b')
+
+        self.value = value
+        self._digits = updated
+
+    def pop_digit(self, base_mode):
+        """Remove the last digit of the text shown in base_mode"""
+        shown = self._shown(base_mode) // BASES[base_mode]
+
+        updated = {}
+        typed = self._digits.get(base_mode)
+        if typed is not None:
+            updated[base_mode] = typed[:-1] or '0'
+        binary = self._digits.get("BIN")
+        if base_mode in ("HEX", "OCT") and binary is not None:
+            updated["BIN"] = binary[:-DIGIT_BITS[base_mode]] or '0'
+
+        self.value = self._value_of(base_mode, shown)
+        self._digits = updated
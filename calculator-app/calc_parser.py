@@ -0,0 +1,227 @@
+import functools
+import re
+from fractions import Fraction
+
+from calc_numbers import BASES, DEFAULT_NUMBERS
+
+# Hex digits stop before AND, so "FFAND0F" reads as FF AND 0F rather than
+# the hex digits FFA followed by garbage
+_HEX_DIGITS = r'(?:(?!(?i:and))[0-9a-fA-F])+'
+
+# Digits a bare number may use in each mode
+_DIGITS = {
+    "DEC": r'(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?',
+    "HEX": _HEX_DIGITS,
+    "BIN": r'[01]+',
+    "OCT": r'[0-7]+',
+}
+
+# Python style prefixes (what hex/bin/oct produce) work in every mode.
+# Lowercase only, so "0B1" in HEX mode stays the hex number 0B1.
+_PREFIXED = rf'0x{_HEX_DIGITS}|0b[01]+|0o[0-7]+'
+
+# Names stand for values passed to CompiledExpression.evaluate, like the
+# pasted column of array mode
+NAMES = ('VALUES',)
+
+_TOKEN_PATTERNS = {
+    mode: re.compile(
+        rf'\s*(?:(?P<name>{"|".join(NAMES)})|(?P<number>{_PREFIXED}|{digits})'
+        rf'|(?P<op>(?i:xor|and|or)|[-+*/%&|^()]))')
+    for mode, digits in _DIGITS.items()
+}
+
+# Symbols the keyboard can type instead of the button names
+_ALIASES = {'&': 'AND', '|': 'OR', '^': 'XOR'}
+
+
+class ExpressionError(ValueError):
+    """Raised for text that is not a valid calculator expression"""
+
+
+# Binary operator precedence, all left associative.
+# Same order as Python: OR < XOR < AND < + - < * / %
+BINARY_PRECEDENCE = {
+    'OR': 1,
+    'XOR': 2,
+    'AND': 3,
+    '+': 4,
+    '-': 4,
+    '*': 5,
+    '/': 5,
+    '%': 5,
+}
+UNARY_PRECEDENCE = 6
+
+
+def _number(text, mode):
+    # Exact: whole numbers as int, decimals such as 0.1 as Fraction. The
+    # NumberSystem turns them into the mode's type when compiling.
+    if text[:2] in ('0x', '0b', '0o'):
+        return int(text, 0)
+    if mode == "DEC" and not text.isdigit():
+        return Fraction(text)
+    return int(text, BASES[mode])
+
+
+def tokenize(text, mode="DEC"):
+    """
+    Split an expression into numbers and operator symbols.
+
+    Args:
+        text (str): Expression as shown on the display
+        mode (str): DEC, HEX, BIN or OCT, the base of numbers without a prefix
+
+    Returns:
+        list: (kind, value) pairs, kind is 'number', 'name' or 'op'
+    """
+    if mode not in BASES:
+        raise ExpressionError(f"Unknown base mode {mode!r}")
+    pattern = _TOKEN_PATTERNS[mode]
+    tokens = []
+    position = 0
+    end = len(text.rstrip())
+    while position < end:
+        match = pattern.match(text, position)
+        if match is None:
+            raise ExpressionError(f"Unexpected {text[position:].strip()[:10]!r} in {mode} mode")
+        if match.group('name') is not None:
+            tokens.append(('name', match.group('name')))
+        elif match.group('number') is not None:
+            tokens.append(('number', _number(match.group('number'), mode)))
+        else:
+            symbol = match.group('op').upper()
+            tokens.append(('op', _ALIASES.get(symbol, symbol)))
+        position = match.end()
+    return tokens
+
+
+class _Parser:
+    """Precedence climbing over a token list, emitting postfix code"""
+
+    def __init__(self, tokens, numbers):
+        self.tokens = tokens
+        self.position = 0
+        self.code = []
+        self.numbers = numbers
+
+    def peek(self):
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return (None, None)
+
+    def expression(self, min_precedence=1):
+        self.operand()
+        while True:
+            kind, symbol = self.peek()
+            if kind != 'op' or symbol not in BINARY_PRECEDENCE:
+                return
+            precedence = BINARY_PRECEDENCE[symbol]
+            if precedence < min_precedence:
+                return
+            self.position += 1
+            # Left associative: the right side only takes tighter operators
+            self.expression(precedence + 1)
+            self.code.append((self.numbers.operations[symbol], 2))
+
+    def operand(self):
+        kind, value = self.peek()
+        self.position += 1
+        if kind == 'number':
+            self.code.append((None, self.numbers.literal(value)))
+        elif kind == 'name':
+            self.code.append((value, 0))
+        elif kind == 'op' and value in ('-', '+'):
+            self.expression(UNARY_PRECEDENCE)
+            self.code.append((self.numbers.unary_operations[value], 1))
+        elif kind == 'op' and value == '(':
+            self.expression()
+            if self.peek() != ('op', ')'):
+                raise ExpressionError("Missing )")
+            self.position += 1
+        elif kind is None:
+            raise ExpressionError("Expression ends too early")
+        else:
+            raise ExpressionError(f"Unexpected {value}")
+
+
+class CompiledExpression:
+    """
+    An expression compiled to postfix code.
+
+    Each instruction is (function, arity), (None, number) to push a
+    number or (name, 0) to push a variable, so evaluating is one pass over
+    a tuple without any parsing.
+    """
+
+    __slots__ = ('text', 'mode', 'numbers', 'code')
+
+    def __init__(self, text, mode, numbers, code):
+        self.text = text
+        self.mode = mode
+        self.numbers = numbers
+        self.code = code
+
+    def evaluate(self, variables=None):
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        for function, argument in self.code:
+            if function is None:
+                push(argument)
+            elif argument == 0:
+                if not variables or function not in variables:
+                    raise ExpressionError(f"{function} has no value here")
+                push(variables[function])
+            elif argument == 1:
+                stack[-1] = function(stack[-1])
+            else:
+                right = pop()
+                stack[-1] = function(stack[-1], right)
+        return stack[0]
+
+    def __repr__(self):
+        return f'CompiledExpression({self.text!r}, {self.mode!r})'
+
+
+@functools.lru_cache(maxsize=4096)
+def compile_expression(text, mode="DEC", numbers=DEFAULT_NUMBERS):
+    """
+    Parse an expression once into a CompiledExpression.
+
+    Results are cached per (text, mode, numbers), so pressing = again or
+    converting the same display text between bases does not parse it again.
+
+    Args:
+        text (str): Expression as shown on the display
+        mode (str): DEC, HEX, BIN or OCT
+        numbers (NumberSystem): Number mode and word size to compile for
+
+    Raises:
+        ExpressionError: If the text is not a valid expression
+        NumberError: If a number has no meaning in the number mode
+    """
+    tokens = tokenize(text, mode)
+    if not tokens:
+        raise ExpressionError("Empty expression")
+    parser = _Parser(tokens, numbers)
+    parser.expression()
+    if parser.position != len(tokens):
+        raise ExpressionError(f"Unexpected {parser.peek()[1]}")
+    return CompiledExpression(text, mode, numbers, tuple(parser.code))
+
+
+def evaluate(text, mode="DEC", numbers=DEFAULT_NUMBERS):
+    """
+    Evaluate display text in a base mode.
+
+    Returns:
+        int, float, Fraction or Decimal: The value, whole numbers are ints
+            except in float mode
+
+    Raises:
+        ExpressionError: For invalid text
+        ArithmeticError: For division by zero, or NumberError for values
+            the number mode cannot represent
+    """
+    return compile_expression(text, mode, numbers).evaluate()
@@ -1,5 +1,29 @@
 import tkinter as tk
-import math
+
+from calc_engine import CalculatorEngine, preview
+from calc_numbers import NUMBER_MODES, WORD_SIZES, NumberSystem
+
+# Word size menu entries, unbounded first
+WORD_SIZE_LABELS = {'∞': None, **{f'{bits}-bit': bits for bits in WORD_SIZES if bits}}
+
+# Pause in typing after which the expression is evaluated live
+LIVE_EVALUATION_MS = 150
+
+# How often a live evaluation in progress is checked for its result
+RESULT_POLL_MS = 20
+
+# Keys that press a button, by keysym
+KEY_BUTTONS = {
+    'Return': '=', 'KP_Enter': '=', 'equal': '=',
+    'BackSpace': 'CE', 'Escape': 'C', 'Delete': 'C',
+    'plus': '+', 'KP_Add': '+', 'minus': '-', 'KP_Subtract': '-',
+    'asterisk': '*', 'KP_Multiply': '*', 'slash': '/', 'KP_Divide': '/',
+    'percent': '%', 'ampersand': 'AND', 'bar': 'OR', 'asciicircum': 'XOR',
+    'parenleft': '(', 'parenright': ')', 'r': '√',
+}
+
+# Function keys switch base, as in other programmer calculators
+KEY_BASES = {'F5': 'HEX', 'F6': 'DEC', 'F7': 'OCT', 'F8': 'BIN'}
 
 class Calculator:
     def __init__(self, root):
@@ -8,16 +32,44 @@ class Calculator:
         self.root.geometry("400x500")
         self.root.resizable(False, False)
         
-        self.expression = ""
-        self.base_mode = "DEC"  # DEC, HEX, BIN, OCT
+        # Expression, base mode (DEC, HEX, BIN, OCT) and number system; float
+        # arithmetic with unbounded integers to start with
+        self.engine = CalculatorEngine()
         
-        # Mode display
+        # Mode display, and the live result of the expression being typed
         self.mode_label = tk.Label(root, text="DEC", font=('Arial', 12), bg='lightgray')
-        self.mode_label.grid(row=0, column=0, columnspan=4, sticky='ew', padx=5, pady=2)
+        self.mode_label.grid(row=0, column=0, columnspan=2, sticky='ew', padx=5, pady=2)
+        self.live_label = tk.Label(root, text='', font=('Arial', 12), fg='gray', anchor='e')
+        self.live_label.grid(row=0, column=2, columnspan=2, sticky='ew', padx=5, pady=2)
         
-        # Display
-        self.display = tk.Entry(root, font=('Arial', 20), justify='right', bd=10)
+        # Display, edited only where the text changes (see show). It is
+        # read-only, so Tk's own editing keys (Control-d, Meta-BackSpace, ...)
+        # cannot change it behind the engine's back; selecting and copying
+        # still work.
+        self.display_text = tk.StringVar()
+        self.display = tk.Entry(root, textvariable=self.display_text, font=('Arial', 20), justify='right', bd=10)
+        self.display.config(state='readonly', readonlybackground=self.display.cget('background'))
         self.display.grid(row=1, column=0, columnspan=4, sticky='nsew', padx=5, pady=5)
+        # Pasting a column of values switches to array mode
+        self.display.bind('<<Paste>>', self.on_paste)
+        # Cut would still copy, and a middle click paste goes nowhere
+        self.display.bind('<<Cut>>', lambda event: 'break')
+        self.display.bind('<<PasteSelection>>', lambda event: 'break')
+
+        # Keyboard input, whether the display or a button has the focus
+        self.display.bind('<Key>', self.on_key)
+        self.root.bind('<Key>', self.on_key)
+        self.display.focus_set()
+
+        # Live evaluation runs on a worker thread once typing pauses, the
+        # executor is created with the first one
+        self._live_executor = None
+        self._live_after = None
+        self._live_generation = 0
+        self.root.bind('<Destroy>', self.on_destroy, add='+')
+
+        # Position in engine.history while browsing it with Up/Down
+        self._history_position = None
         
         # Mode buttons
         mode_frame = tk.Frame(root)
@@ -28,6 +80,14 @@ class Calculator:
             btn = tk.Button(mode_frame, text=mode, font=('Arial', 10),
                           command=lambda m=mode: self.change_base(m))
             btn.pack(side='left', expand=True, fill='both', padx=1)
+
+        # Number mode and word size
+        self.number_mode = tk.StringVar(value=self.engine.numbers.mode)
+        tk.OptionMenu(mode_frame, self.number_mode, *NUMBER_MODES,
+                      command=lambda _: self.change_number_system()).pack(side='left', padx=1)
+        self.word_size = tk.StringVar(value='∞')
+        tk.OptionMenu(mode_frame, self.word_size, *WORD_SIZE_LABELS,
+                      command=lambda _: self.change_number_system()).pack(side='left', padx=1)
         
         # Button layout
         buttons = [
@@ -59,118 +119,162 @@ class Calculator:
         for i in range(4):
             root.grid_columnconfigure(i, weight=1)
     
+    @property
+    def expression(self):
+        return self.engine.expression
+
+    @property
+    def base_mode(self):
+        return self.engine.base_mode
+
     def change_base(self, mode):
         """Change the number base mode"""
-        try:
-            # Convert current value to decimal first
-            if self.expression and self.expression not in ['+', '-', '*', '/', '%']:
-                current_val = self.get_decimal_value()
-                self.base_mode = mode
-                self.mode_label.config(text=mode)
-                
-                # Convert and display in new base
-                if current_val is not None:
-                    self.expression = self.convert_from_decimal(int(current_val))
-                    self.display.delete(0, tk.END)
-                    self.display.insert(0, self.expression)
-            else:
-                self.base_mode = mode
-                self.mode_label.config(text=mode)
-        except:
-            pass
+        self.engine.change_base(mode)
+        self.refresh()
+        if self.engine.values is not None:
+            self.copy_values()
+
+    def change_number_system(self):
+        """Apply the number mode and word size menus"""
+        self.engine.set_numbers(NumberSystem(self.number_mode.get(), WORD_SIZE_LABELS[self.word_size.get()]))
+        self.refresh()
     
     def get_decimal_value(self):
         """Convert current expression value to decimal"""
-        try:
-            if self.base_mode == "DEC":
-                return eval(self.expression)
-            elif self.base_mode == "HEX":
-                return int(self.expression.replace('0x', ''), 16)
-            elif self.base_mode == "BIN":
-                return int(self.expression.replace('0b', ''), 2)
-            elif self.base_mode == "OCT":
-                return int(self.expression.replace('0o', ''), 8)
-        except:
-            return None
+        return self.engine.value()
     
     def convert_from_decimal(self, value):
         """Convert decimal value to current base"""
-        if self.base_mode == "DEC":
-            return str(value)
-        elif self.base_mode == "HEX":
-            return hex(value)
-        elif self.base_mode == "BIN":
-            return bin(value)
-        elif self.base_mode == "OCT":
-            return oct(value)
+        return self.engine.format(value)
+
+    def show(self, text):
+        """
+        Put text on the display, editing only the end that changed.
+
+        Typing or deleting a character inserts or deletes one character,
+        so the cost of a key press does not grow with the expression.
+        """
+        shown = self.display_text.get()
+        if text == shown:
+            return
+        # A read-only Entry ignores insert and delete
+        self.display.config(state='normal')
+        if text.startswith(shown):
+            self.display.insert(tk.END, text[len(shown):])
+        elif shown.startswith(text):
+            self.display.delete(len(text), tk.END)
+        else:
+            self.display_text.set(text)
+        self.display.config(state='readonly')
+        self.display.icursor(tk.END)
+        self.display.xview_moveto(1)
+
+    def refresh(self):
+        """Show the engine's display text and status"""
+        self.show(self.engine.display)
+        self.mode_label.config(text=self.engine.status)
+        self.schedule_live_evaluation()
     
     def on_button_click(self, button):
-        if button == 'C':
-            self.expression = ""
-            self.display.delete(0, tk.END)
-        elif button == 'CE':
-            self.expression = self.expression[:-1]
-            self.display.delete(0, tk.END)
-            self.display.insert(0, self.expression)
-        elif button == '=':
-            try:
-                # Handle bitwise operations
-                expr = self.expression
-                if 'AND' in expr:
-                    parts = expr.split('AND')
-                    result = int(self.get_decimal_value_from_part(parts[0])) & int(self.get_decimal_value_from_part(parts[1]))
-                elif 'OR' in expr:
-                    parts = expr.split('OR')
-                    result = int(self.get_decimal_value_from_part(parts[0])) | int(self.get_decimal_value_from_part(parts[1]))
-                elif 'XOR' in expr:
-                    parts = expr.split('XOR')
-                    result = int(self.get_decimal_value_from_part(parts[0])) ^ int(self.get_decimal_value_from_part(parts[1]))
-                else:
-                    result = eval(self.expression)
-                
-                # Convert result to current base
-                if isinstance(result, float):
-                    self.expression = str(result)
-                else:
-                    self.expression = self.convert_from_decimal(int(result))
-                
-                self.display.delete(0, tk.END)
-                self.display.insert(0, self.expression)
-            except:
-                self.display.delete(0, tk.END)
-                self.display.insert(0, "Error")
-                self.expression = ""
-        elif button == '√':
-            try:
-                result = math.sqrt(float(self.get_decimal_value()))
-                self.display.delete(0, tk.END)
-                self.display.insert(0, str(result))
-                self.expression = str(result)
-            except:
-                self.display.delete(0, tk.END)
-                self.display.insert(0, "Error")
-                self.expression = ""
-        elif button in ['AND', 'OR', 'XOR']:
-            self.expression += button
-            self.display.delete(0, tk.END)
-            self.display.insert(0, self.expression)
-        elif button in ['A', 'B', 'C', 'D', 'E', 'F']:
-            # Hex digits only available in HEX mode
-            if self.base_mode == 'HEX':
-                self.expression += button
-                self.display.delete(0, tk.END)
-                self.display.insert(0, self.expression)
-        elif button != '':
-            self.expression += button
-            self.display.delete(0, tk.END)
-            self.display.insert(0, self.expression)
-    
-    def get_decimal_value_from_part(self, part):
-        """Helper to get decimal value from a part of expression"""
+        self._history_position = None
+        self.engine.press(button)
+        self.refresh()
+        if button == '=' and self.engine.values is not None:
+            self.copy_values()
+
+    def on_key(self, event):
+        """Keyboard input, handled like the buttons"""
+        if event.state & 0x4:
+            return None  # Control shortcuts, e.g. copy and paste
+        keysym = event.keysym
+        char = event.char
+        if keysym in KEY_BASES:
+            self.change_base(KEY_BASES[keysym])
+        elif keysym in ('Up', 'Down'):
+            self.recall(-1 if keysym == 'Up' else 1)
+        elif keysym in KEY_BUTTONS:
+            self.on_button_click(KEY_BUTTONS[keysym])
+        elif char and char in '0123456789':
+            self.on_button_click(char)
+        elif char and char in 'abcdefABCDEF':
+            # Not through press: the C button clears
+            self._history_position = None
+            self.engine.press_digit(char.upper())
+            self.refresh()
+        elif not char or not char.isprintable():
+            return None  # Navigation and modifier keys
+        return 'break'
+
+    def recall(self, step):
+        """Browse the evaluation history, step -1 for older and 1 for newer"""
+        history = self.engine.history
+        if not history or (self._history_position is None and step > 0):
+            return
+        if self._history_position is None:
+            position = len(history) - 1
+        else:
+            position = max(self._history_position + step, 0)
+
+        if position >= len(history):
+            self._history_position = None
+            self.engine.load("")
+        else:
+            self._history_position = position
+            self.engine.load(history[position][0])
+        self.refresh()
+
+    def schedule_live_evaluation(self):
+        """Evaluate the expression on a worker thread once typing pauses"""
+        if self._live_after is not None:
+            self.root.after_cancel(self._live_after)
+            self._live_after = None
+        # Results of earlier expressions are dropped when they arrive
+        self._live_generation += 1
+        self.live_label.config(text='')
+        if self.engine.expression and self.engine.values is None:
+            self._live_after = self.root.after(LIVE_EVALUATION_MS, self._start_live_evaluation)
+
+    def _start_live_evaluation(self):
+        self._live_after = None
+        if self._live_executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._live_executor = ThreadPoolExecutor(max_workers=1)
+        engine = self.engine
+        future = self._live_executor.submit(preview, engine.expression, engine.base_mode, engine.numbers)
+        self._poll_live_evaluation(future, self._live_generation)
+
+    def _poll_live_evaluation(self, future, generation):
+        if generation != self._live_generation:
+            return
+        if not future.done():
+            self.root.after(RESULT_POLL_MS, self._poll_live_evaluation, future, generation)
+            return
+        text = future.result()
+        # Nothing to add when the display already shows the value
+        if text is not None and text != self.engine.display:
+            self.live_label.config(text=f"= {text}")
+
+    def on_destroy(self, event):
+        if event.widget is self.root:
+            self._live_generation += 1
+            if self._live_executor is not None:
+                self._live_executor.shutdown(wait=False, cancel_futures=True)
+
+    def on_paste(self, event=None):
+        """Paste from the clipboard, a column of values switches to array mode"""
         try:
-            return eval(part.strip())
-        except:
-            return 0
+            text = self.root.clipboard_get()
+        except tk.TclError:
+            return 'break'
+        self.engine.paste(text)
+        self.refresh()
+        return 'break'
+
+    def copy_values(self):
+        """Put the array mode values on the clipboard, one per line"""
+        self.root.clipboard_clear()
+        self.root.clipboard_append(self.engine.values_text())
+        self.mode_label.config(text=f"{self.engine.status}, copied")
 
 if __name__ == "__main__":
     root = tk.Tk()
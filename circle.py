@@ -1,25 +1,29 @@
 import matplotlib.pyplot as plt
-import matplotlib.patches as patches
+from matplotlib.lines import Line2D
 
-def main():
-    # Ask user for inputs
-    size = float(input("Enter the size for the axes: "))
-    increment = float(input("Enter the increment (radius): "))
-    
-    # Create figure and axis
-    fig, ax = plt.subplots(1, 1, figsize=(8, 8))
-    
+from circle_geometry import circle_colors, four_circle_layout
+from circle_render import draw_circles
+from render_cache import RenderCache, pattern_key
+
+def plot_circles(ax, size, increment):
+    """
+    Draw the four circles and their centers on an axes and set up limits,
+    grid, title and legend.
+
+    Args:
+        ax: Matplotlib axes to draw on
+        size (float): Length of the axes
+        increment (float): Radius of every circle
+    """
     # Draw 4 circles: first at (3, 4), then increase x by 1 each time
-    colors = ['blue', 'red', 'green', 'orange']
-    for i in range(4):
-        x_coord = 3 + i
-        circle = patches.Circle((x_coord, 4), increment, fill=False, 
-                               edgecolor=colors[i], linewidth=2)
-        ax.add_patch(circle)
-        
-        # Mark the center point
-        ax.plot(x_coord, 4, 'o', color=colors[i], markersize=8, 
-                label=f'Center ({x_coord}, 4)')
+    centers, radii = four_circle_layout(increment)
+    colors = circle_colors(len(centers))
+    draw_circles(ax, centers, radii, colors)
+    
+    # One legend entry per center
+    handles = [Line2D([], [], linestyle='', marker='o', color=color, markersize=8,
+                      label=f'Center ({x:g}, {y:g})')
+               for (x, y), color in zip(centers, colors)]
     
     # Set axis limits to the size provided
     ax.set_xlim(0, size)
@@ -31,13 +35,24 @@ def main():
     ax.set_xlabel('X Axis', fontsize=12)
     ax.set_ylabel('Y Axis', fontsize=12)
     ax.set_title(f'4 Circles with radius {increment}', fontsize=14, fontweight='bold')
-    ax.legend()
+    ax.legend(handles=handles)
+
+def main():
+    # Ask user for inputs
+    size = float(input("Enter the size for the axes: "))
+    increment = float(input("Enter the increment (radius): "))
     
-    # Save as PNG
-    filename = 'circle_output.png'
+    # Create figure and axis
+    fig, ax = plt.subplots(1, 1, figsize=(8, 8))
+    plot_circles(ax, size, increment)
     plt.tight_layout()
-    plt.savefig(filename, dpi=150, bbox_inches='tight')
-    print(f"\nCircle visualization saved to {filename}")
+    
+    # Save as PNG, or copy the one saved for the same inputs before
+    filename = 'circle_output.png'
+    cached, _ = RenderCache().get_or_render(
+        pattern_key('circle', size, increment, dpi=150), filename,
+        lambda path: plt.savefig(path, dpi=150, bbox_inches='tight'))
+    print(f"\nCircle visualization saved to {filename}" + (" (from the render cache)" if cached else ""))
     
     # Display on screen
     plt.show()
@@ -0,0 +1,59 @@
+import numpy as np
+
+# Colors circle.py gives its circles, repeated for longer layouts
+CIRCLE_COLORS = ['blue', 'red', 'green', 'orange']
+
+
+def four_circle_layout(radius):
+    """
+    The circle.py layout: four circles of the same radius, the first
+    centered at (3, 4) and each next one 1 further along x.
+
+    Returns:
+        tuple: (centers (4, 2) array, radii (4,) array)
+    """
+    centers = np.column_stack([3 + np.arange(4, dtype=np.float64), np.full(4, 4.0)])
+    return centers, np.full(4, float(radius))
+
+
+def grid_layout(rows, columns, spacing, radius, origin=(0, 0)):
+    """
+    Circles on a regular grid, row by row.
+
+    Args:
+        rows (int): Number of rows
+        columns (int): Number of columns
+        spacing (float): Distance between neighbouring centers
+        radius (float or numpy.ndarray): Radius of every circle, or one per circle
+        origin (tuple): Center of the first circle
+
+    Returns:
+        tuple: (centers (N, 2) array, radii (N,) array)
+    """
+    y, x = np.mgrid[0:rows, 0:columns].astype(np.float64)
+    centers = np.column_stack([x.ravel(), y.ravel()]) * spacing + np.asarray(origin, dtype=np.float64)
+    radii = np.broadcast_to(np.asarray(radius, dtype=np.float64), len(centers)).copy()
+    return centers, radii
+
+
+def load_layout(path):
+    """
+    Read circles from a file with one x, y, radius triple per circle.
+
+    .npy files hold an (N, 3) array, anything else is read as comma
+    separated text (a header line starting with '#' is skipped).
+
+    Returns:
+        tuple: (centers (N, 2) array, radii (N,) array)
+    """
+    if path.endswith('.npy'):
+        data = np.load(path)
+    else:
+        data = np.loadtxt(path, delimiter=',', ndmin=2)
+    data = np.asarray(data, dtype=np.float64).reshape(-1, 3)
+    return data[:, :2].copy(), data[:, 2].copy()
+
+
+def circle_colors(count, palette=CIRCLE_COLORS):
+    """Color names for count circles, cycling through the palette"""
+    return [palette[i % len(palette)] for i in range(count)]
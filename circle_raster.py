@@ -0,0 +1,133 @@
+import argparse
+
+import numpy as np
+
+from circle_geometry import circle_colors, grid_layout, load_layout
+from line_raster import COLOR_RGB, EnvelopeCanvas, accumulate_discs, accumulate_segments, composite, write_png
+
+
+def circle_outline_segments(centers, radii, max_side=2.0, min_sides=8):
+    """
+    Approximate pixel-space circles by polygons whose sides are at most
+    max_side pixels long, all circles in one vectorized pass.
+
+    Returns:
+        numpy.ndarray: (M, 2, 2) polygon sides, the sides of each circle
+            stored one after another
+    """
+    if len(centers) == 0:
+        return np.empty((0, 2, 2))
+    sides = np.maximum(min_sides, np.ceil(2 * np.pi * radii / max_side)).astype(np.int64)
+    owner = np.repeat(np.arange(len(centers)), sides)
+    step = np.arange(owner.size) - np.repeat(np.cumsum(sides) - sides, sides)
+
+    angle_step = 2 * np.pi / sides[owner]
+    angles = np.stack([step * angle_step, (step + 1) * angle_step], axis=1)
+    return centers[owner, None, :] + radii[owner, None, None] * np.stack([np.cos(angles), np.sin(angles)], axis=2)
+
+
+def render_circles_rgba(centers, radii, size, colors=None, pixels=1200, margin=None, line_width=4.0,
+                        marker_radius=None, show_centers=True):
+    """
+    Rasterize circle outlines and center markers straight into an RGBA array.
+
+    The work grows with the number of outline pixels, there is no per
+    circle artist. Circles of one color are drawn together.
+
+    Args:
+        centers (numpy.ndarray): (N, 2) centers in data coordinates
+        radii (numpy.ndarray): (N,) radii in data coordinates
+        size (float): Length of the axes
+        colors (list): Color name (a COLOR_RGB key) per circle, defaults to
+            cycling CIRCLE_COLORS
+        pixels (int): Width and height of the image
+        margin (int): White border in pixels, defaults to 5% of the image
+        line_width (float): Outline width in pixels (2 pt at 150 dpi is about 4)
+        marker_radius (float): Center marker radius in pixels, defaults to
+            8 pt markers at 150 dpi scaled with the image
+        show_centers (bool): Mark the centers
+
+    Returns:
+        numpy.ndarray: (pixels, pixels, 4) uint8 RGBA image
+    """
+    if margin is None:
+        margin = round(pixels / 20)
+    if marker_radius is None:
+        marker_radius = 8.3 * pixels / 1200
+    if colors is None:
+        colors = circle_colors(len(centers))
+
+    canvas = EnvelopeCanvas(size, pixels, margin)
+    scale = (canvas.plot_pixels - 1) / canvas.size if canvas.size > 0 else 0
+    pixel_centers = canvas.to_pixels(centers)
+    pixel_radii = np.asarray(radii, dtype=np.float64) * scale
+
+    # A wide outline is drawn as concentric 1px rings
+    ring_offsets = np.linspace(-(line_width - 1) / 2, (line_width - 1) / 2, max(1, round(line_width)))
+
+    rgb = np.full((pixels, pixels, 3), 255, dtype=np.float32)
+    coverage = np.zeros((pixels, pixels), dtype=np.float32)
+
+    accumulate_segments(coverage, canvas.grid_segments())
+    composite(rgb, coverage, COLOR_RGB['grid'], alpha=0.3)
+
+    names, color_index = np.unique(np.asarray(colors), return_inverse=True)
+    groups = [np.flatnonzero(color_index == index) for index in range(len(names))]
+
+    for name, group in zip(names, groups):
+        coverage.fill(0)
+        for offset in ring_offsets:
+            ring_radii = np.maximum(pixel_radii[group] + offset, 0)
+            accumulate_segments(coverage, circle_outline_segments(pixel_centers[group], ring_radii))
+        composite(rgb, coverage, COLOR_RGB[name])
+
+    coverage.fill(0)
+    accumulate_segments(coverage, canvas.frame_segments())
+    composite(rgb, coverage, COLOR_RGB['black'])
+
+    if show_centers:
+        for name, group in zip(names, groups):
+            coverage.fill(0)
+            accumulate_discs(coverage, pixel_centers[group], marker_radius)
+            composite(rgb, coverage, COLOR_RGB[name])
+
+    rgba = np.empty((pixels, pixels, 4), dtype=np.uint8)
+    rgba[..., :3] = np.rint(rgb).astype(np.uint8)
+    rgba[..., 3] = 255
+    return rgba
+
+
+def render_circles_png(centers, radii, size, filename='circle_output.png', **options):
+    """Rasterize circles to a PNG without matplotlib, see render_circles_rgba"""
+    write_png(filename, render_circles_rgba(centers, radii, size, **options))
+    return len(centers)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Rasterize many circles to a PNG without matplotlib.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--layout', help="x,y,radius file (.csv or .npy)")
+    source.add_argument('--grid', nargs=4, type=float, metavar=('ROWS', 'COLUMNS', 'SPACING', 'RADIUS'),
+                        help="Regular grid of equal circles starting at (0, 0)")
+    parser.add_argument('--size', type=float, required=True, help="Length of the axes")
+    parser.add_argument('--pixels', type=int, default=1200)
+    parser.add_argument('--no-centers', action='store_true', help="Do not mark the centers")
+    parser.add_argument('-o', '--output', default='circle_output.png')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.layout:
+        centers, radii = load_layout(args.layout)
+    else:
+        rows, columns, spacing, radius = args.grid
+        centers, radii = grid_layout(int(rows), int(columns), spacing, radius)
+
+    count = render_circles_png(centers, radii, args.size, args.output, pixels=args.pixels,
+                               show_centers=not args.no_centers)
+    print(f"Drew {count} circles")
+    print(f"\nCircle visualization saved to {args.output}")
+
+if __name__ == "__main__":
+    main()
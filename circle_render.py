@@ -0,0 +1,40 @@
+from matplotlib.collections import EllipseCollection
+
+from circle_geometry import circle_colors
+
+
+def draw_circles(ax, centers, radii, colors=None, linewidth=2, markersize=8, show_centers=True):
+    """
+    Add circle outlines and their center markers to an axes.
+
+    All circles go into one EllipseCollection and all centers into one
+    scatter, so the artist count stays at two however many circles there
+    are.
+
+    Args:
+        ax: Matplotlib axes to draw on
+        centers (numpy.ndarray): (N, 2) circle centers in data coordinates
+        radii (numpy.ndarray): (N,) radii in data coordinates
+        colors (list): One color per circle, defaults to cycling CIRCLE_COLORS
+        linewidth (float): Outline width in points
+        markersize (float): Center marker diameter in points, as in ax.plot
+        show_centers (bool): Mark the centers
+
+    Returns:
+        int: Number of circles drawn
+    """
+    if colors is None:
+        colors = circle_colors(len(centers))
+    if len(centers) == 0:
+        return 0
+
+    diameters = 2 * radii
+    ax.add_collection(EllipseCollection(
+        diameters, diameters, 0, units='xy', offsets=centers, offset_transform=ax.transData,
+        facecolors='none', edgecolors=colors, linewidths=linewidth))
+
+    if show_centers:
+        # scatter sizes are areas in points^2
+        ax.scatter(centers[:, 0], centers[:, 1], s=markersize ** 2, c=colors, zorder=3)
+
+    return len(centers)
@@ -1,9 +1,9 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox
 import os
-from cryptography.fernet import Fernet
 import base64
 import hashlib
+from lazy_imports import preload
 from secret_key_generator import get_key_by_index, get_all_keys, get_key_info
 
 class FileEncryptorDecryptor:
@@ -18,6 +18,9 @@ class FileEncryptorDecryptor:
         
         self.setup_ui()
         self.load_available_keys()
+        
+        # cryptography is slow to import, load it while the window paints
+        preload('cryptography.fernet')
     
     def setup_ui(self):
         # Title
@@ -116,6 +119,11 @@ class FileEncryptorDecryptor:
         # Base64 encode for Fernet
         return base64.urlsafe_b64encode(key_hash)
     
+    def create_fernet(self, secret_key):
+        """Fernet for a secret key, cryptography is only imported here"""
+        from cryptography.fernet import Fernet
+        return Fernet(self.key_to_fernet_key(secret_key))
+    
     def encrypt_file(self):
         """Encrypt the selected file"""
         if not self.selected_file:
@@ -136,8 +144,7 @@ class FileEncryptorDecryptor:
                 return
             
             # Convert to Fernet key
-            fernet_key = self.key_to_fernet_key(secret_key)
-            fernet = Fernet(fernet_key)
+            fernet = self.create_fernet(secret_key)
             
             # Read the file
             with open(self.selected_file, 'rb') as f:
@@ -223,8 +230,7 @@ class FileEncryptorDecryptor:
                 return
             
             # Convert to Fernet key
-            fernet_key = self.key_to_fernet_key(secret_key)
-            fernet = Fernet(fernet_key)
+            fernet = self.create_fernet(secret_key)
             
             # Read the encrypted file
             with open(self.selected_file, 'rb') as f:
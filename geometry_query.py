@@ -0,0 +1,318 @@
+import numpy as np
+
+from circle_geometry import four_circle_layout
+from line_geometry import FAMILY_NAMES, envelope_segments, lines_per_family
+
+# Upper bound on candidate pairs tested per batch, keeps temporary arrays small
+MAX_PAIRS_PER_BATCH = 2_000_000
+
+
+def _cross(origin, a, b):
+    """z component of (a - origin) x (b - origin), row by row"""
+    return (a[:, 0] - origin[:, 0]) * (b[:, 1] - origin[:, 1]) - (a[:, 1] - origin[:, 1]) * (b[:, 0] - origin[:, 0])
+
+
+def _within_box(start, end, point):
+    """Whether point lies in the bounding box of start..end, row by row"""
+    return ((np.minimum(start[:, 0], end[:, 0]) <= point[:, 0]) & (point[:, 0] <= np.maximum(start[:, 0], end[:, 0]))
+            & (np.minimum(start[:, 1], end[:, 1]) <= point[:, 1]) & (point[:, 1] <= np.maximum(start[:, 1], end[:, 1])))
+
+
+def segments_intersect(first, second):
+    """
+    Exact test whether segments first[i] and second[i] share a point.
+
+    Touching end points and collinear overlaps count as intersections.
+
+    Args:
+        first (numpy.ndarray): (N, 2, 2) segments
+        second (numpy.ndarray): (N, 2, 2) segments
+
+    Returns:
+        numpy.ndarray: (N,) boolean
+    """
+    p, p_end = first[:, 0], first[:, 1]
+    q, q_end = second[:, 0], second[:, 1]
+    d1 = _cross(q, q_end, p)
+    d2 = _cross(q, q_end, p_end)
+    d3 = _cross(p, p_end, q)
+    d4 = _cross(p, p_end, q_end)
+
+    proper = (np.sign(d1) * np.sign(d2) < 0) & (np.sign(d3) * np.sign(d4) < 0)
+    touching = (((d1 == 0) & _within_box(q, q_end, p)) | ((d2 == 0) & _within_box(q, q_end, p_end))
+                | ((d3 == 0) & _within_box(p, p_end, q)) | ((d4 == 0) & _within_box(p, p_end, q_end)))
+    return proper | touching
+
+
+def point_segment_distance(point, segments):
+    """
+    Distance from a point to every segment.
+
+    Args:
+        point (tuple): (x, y)
+        segments (numpy.ndarray): (N, 2, 2) segments
+
+    Returns:
+        numpy.ndarray: (N,) distances
+    """
+    point = np.asarray(point, dtype=np.float64)
+    start = segments[:, 0]
+    direction = segments[:, 1] - start
+    length_squared = np.einsum('ij,ij->i', direction, direction)
+    projection = np.einsum('ij,ij->i', point - start, direction)
+    t = np.divide(projection, length_squared, out=np.zeros_like(projection), where=length_squared > 0)
+    closest = start + np.clip(t, 0, 1)[:, None] * direction
+    return np.hypot(*(point - closest).T)
+
+
+class UniformGrid:
+    """
+    Items binned into the square cells of a uniform grid.
+
+    Memberships are kept sorted by cell (CSR style), so the items of a cell
+    are one contiguous slice and no Python objects are created per item.
+    """
+
+    def __init__(self, items, cells_x, cells_y, origin, cell_size):
+        self.origin = np.asarray(origin, dtype=np.float64)
+        self.cell_size = float(cell_size)
+
+        cell_ids = cells_y.astype(np.int64) * (1 << 32) + cells_x.astype(np.int64)
+        order = np.lexsort((items, cell_ids))
+        self.cell_ids = cell_ids[order]
+        self.items = items[order]
+
+        self.starts = np.flatnonzero(np.r_[True, self.cell_ids[1:] != self.cell_ids[:-1]])[:len(order)]
+        self.unique_cells = self.cell_ids[self.starts]
+        self.counts = np.diff(np.r_[self.starts, len(order)])
+        # Corners of the occupied cells, queries never look beyond them
+        if len(order):
+            self.first_cell = np.array([cells_x.min(), cells_y.min()])
+            self.last_cell = np.array([cells_x.max(), cells_y.max()])
+
+    def cell_of(self, points):
+        """Integer (x, y) cell coordinates of (N, 2) points"""
+        return np.floor((np.asarray(points, dtype=np.float64) - self.origin) / self.cell_size).astype(np.int64)
+
+    def items_in_box(self, low, high):
+        """Sorted unique items binned into any cell overlapping the box low..high"""
+        if len(self.items) == 0:
+            return np.empty(0, dtype=np.int64)
+        # Clipped while still floats, so a huge box cannot overflow or
+        # enumerate empty cells
+        cells = np.floor((np.asarray([low, high], dtype=np.float64) - self.origin) / self.cell_size)
+        (x0, y0), (x1, y1) = np.clip(cells, self.first_cell, self.last_cell).astype(np.int64)
+        y, x = np.mgrid[y0:y1 + 1, x0:x1 + 1]
+        wanted = (y.astype(np.int64) * (1 << 32) + x).ravel()
+        found = np.searchsorted(self.unique_cells, wanted)
+        found = found[(found < len(self.unique_cells))]
+        found = found[np.isin(self.unique_cells[found], wanted)]
+        if len(found) == 0:
+            return np.empty(0, dtype=np.int64)
+        slices = [self.items[start:start + count] for start, count in zip(self.starts[found], self.counts[found])]
+        return np.unique(np.concatenate(slices))
+
+    def candidate_pairs(self, budget=MAX_PAIRS_PER_BATCH):
+        """
+        Yield (i, j) arrays, i < j, of items sharing at least one cell, in
+        batches of about budget pairs. A pair sharing several cells is
+        yielded once per batch it shows up in; callers de-duplicate.
+        """
+        total = np.cumsum(self.counts * (self.counts - 1) // 2)
+        cell = 0
+        while cell < len(self.counts):
+            # Take cells until the batch is full, always at least one
+            done = total[cell - 1] if cell else 0
+            stop = max(cell + 1, int(np.searchsorted(total, done + budget, side='right')))
+            yield self._pairs_of_cells(cell, stop)
+            cell = stop
+
+    def _pairs_of_cells(self, first_cell, stop_cell):
+        counts = self.counts[first_cell:stop_cell]
+        starts = self.starts[first_cell:stop_cell]
+
+        # Every membership position p pairs with the later positions of its cell
+        positions = np.arange(starts[0], starts[-1] + counts[-1])
+        cell_end = np.repeat(starts + counts, counts)
+        later = cell_end - positions - 1
+        left = np.repeat(positions, later)
+        offset = np.arange(len(left)) - np.repeat(np.cumsum(later) - later, later)
+        right = left + 1 + offset
+
+        i, j = self.items[left], self.items[right]
+        return np.minimum(i, j), np.maximum(i, j)
+
+
+def _unique_pairs(i, j, count):
+    """Sorted unique (i, j) rows with i != j, for item indices below count"""
+    keys = np.unique(i * count + j)
+    pairs = np.stack([keys // count, keys % count], axis=1)
+    return pairs[pairs[:, 0] != pairs[:, 1]]
+
+
+def _merge_pairs(batches, count):
+    """Sorted unique pairs of several batches, pairs may repeat across batches"""
+    if not batches:
+        return np.empty((0, 2), dtype=np.int64)
+    pairs = np.concatenate(batches)
+    return _unique_pairs(pairs[:, 0], pairs[:, 1], count)
+
+
+class SegmentIndex:
+    """
+    Uniform grid over line segments, e.g. the envelope_segments array.
+
+    Every segment is registered in the cells it passes through (sampled
+    at half a cell and widened to the cells between samples, which is a
+    superset of the exact traversal), so long lines do not fill their whole
+    bounding box.
+    """
+
+    def __init__(self, segments, cell_size=None):
+        self.segments = np.asarray(segments, dtype=np.float64).reshape(-1, 2, 2)
+        count = len(self.segments)
+        points = self.segments.reshape(-1, 2)
+        origin = points.min(axis=0) if count else np.zeros(2)
+        extent = float(np.ptp(points, axis=0).max()) if count else 1.0
+
+        if cell_size is None:
+            # About sqrt(n) cells per side, never smaller than a typical segment
+            lengths = np.hypot(*(self.segments[:, 1] - self.segments[:, 0]).T) if count else np.ones(1)
+            cell_size = max(extent / max(np.sqrt(count), 1), float(np.median(lengths)) / 4, 1e-12)
+        self.cell_size = cell_size
+
+        items, cells_x, cells_y = self._memberships(origin, cell_size)
+        self.grid = UniformGrid(items, cells_x, cells_y, origin, cell_size)
+
+    def _memberships(self, origin, cell_size):
+        if len(self.segments) == 0:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, empty
+
+        start = self.segments[:, 0]
+        direction = self.segments[:, 1] - start
+        samples = np.ceil(np.hypot(*direction.T) / (cell_size / 2)).astype(np.int64) + 1
+
+        owner = np.repeat(np.arange(len(self.segments)), samples)
+        step = np.arange(owner.size) - np.repeat(np.cumsum(samples) - samples, samples)
+        t = np.minimum(step / np.maximum(samples[owner] - 1, 1), 1.0)
+        cells = np.floor((start[owner] + t[:, None] * direction[owner] - origin) / cell_size).astype(np.int64)
+
+        # Cells between consecutive samples: the 2 x 2 block they span
+        following = np.r_[cells[1:], cells[-1:]]
+        last_sample = np.r_[owner[1:] != owner[:-1], True]
+        following[last_sample] = cells[last_sample]
+        items = np.concatenate([owner] * 4)
+        cells_x = np.concatenate([cells[:, 0], following[:, 0], cells[:, 0], following[:, 0]])
+        cells_y = np.concatenate([cells[:, 1], following[:, 1], following[:, 1], cells[:, 1]])
+
+        # Drop repeated (segment, cell) memberships
+        low = np.minimum(cells_x.min(), cells_y.min())
+        span = np.maximum(cells_x.max(), cells_y.max()) - low + 1
+        keys = np.unique((items * span + (cells_x - low)) * span + (cells_y - low))
+        return keys // (span * span), (keys // span) % span + low, keys % span + low
+
+    def intersecting_pairs(self):
+        """
+        All pairs of segments that share a point.
+
+        Returns:
+            numpy.ndarray: (M, 2) segment indices, i < j, sorted
+        """
+        found = []
+        for i, j in self.grid.candidate_pairs():
+            pairs = _unique_pairs(i, j, len(self.segments))
+            hit = segments_intersect(self.segments[pairs[:, 0]], self.segments[pairs[:, 1]])
+            found.append(pairs[hit])
+        return _merge_pairs(found, len(self.segments))
+
+    def within(self, point, radius):
+        """
+        Segments passing within radius of a point.
+
+        Returns:
+            numpy.ndarray: Sorted segment indices
+        """
+        point = np.asarray(point, dtype=np.float64)
+        candidates = self.grid.items_in_box(point - radius, point + radius)
+        if len(candidates) == 0:
+            return candidates
+        return candidates[point_segment_distance(point, self.segments[candidates]) <= radius]
+
+
+class CircleIndex:
+    """Uniform grid over circles given as center and radius arrays"""
+
+    def __init__(self, centers, radii, cell_size=None):
+        self.centers = np.asarray(centers, dtype=np.float64).reshape(-1, 2)
+        self.radii = np.broadcast_to(np.asarray(radii, dtype=np.float64), len(self.centers))
+        count = len(self.centers)
+
+        low = self.centers - self.radii[:, None]
+        high = self.centers + self.radii[:, None]
+        origin = low.min(axis=0) if count else np.zeros(2)
+        extent = float(np.ptp(np.r_[low, high], axis=0).max()) if count else 1.0
+        if cell_size is None:
+            # About sqrt(n) cells per side, never smaller than a typical circle
+            median_diameter = 2 * float(np.median(self.radii)) if count else 1.0
+            cell_size = max(extent / max(np.sqrt(count), 1), median_diameter, 1e-12)
+        self.cell_size = cell_size
+
+        # Register every circle in all cells its bounding box covers
+        first = np.floor((low - origin) / cell_size).astype(np.int64)
+        last = np.floor((high - origin) / cell_size).astype(np.int64)
+        span = last - first + 1
+        per_circle = span[:, 0] * span[:, 1]
+        items = np.repeat(np.arange(count), per_circle)
+        local = np.arange(items.size) - np.repeat(np.cumsum(per_circle) - per_circle, per_circle)
+        cells_x = first[items, 0] + local % span[items, 0]
+        cells_y = first[items, 1] + local // span[items, 0]
+        self.grid = UniformGrid(items, cells_x, cells_y, origin, cell_size)
+
+    def overlapping_pairs(self, outlines_only=False):
+        """
+        All pairs of circles whose discs overlap (closer than the sum of
+        their radii). With outlines_only a circle lying completely inside
+        another one does not count, only crossing outlines do.
+
+        Returns:
+            numpy.ndarray: (M, 2) circle indices, i < j, sorted
+        """
+        found = []
+        for i, j in self.grid.candidate_pairs():
+            pairs = _unique_pairs(i, j, len(self.centers))
+            a, b = pairs[:, 0], pairs[:, 1]
+            distance = np.hypot(*(self.centers[a] - self.centers[b]).T)
+            hit = distance < self.radii[a] + self.radii[b]
+            if outlines_only:
+                hit &= distance >= np.abs(self.radii[a] - self.radii[b])
+            found.append(pairs[hit])
+        return _merge_pairs(found, len(self.centers))
+
+    def within(self, point, radius):
+        """Circles whose outline passes within radius of a point"""
+        point = np.asarray(point, dtype=np.float64)
+        candidates = self.grid.items_in_box(point - radius, point + radius)
+        distance = np.abs(np.hypot(*(self.centers[candidates] - point).T) - self.radii[candidates])
+        return candidates[distance <= radius]
+
+
+def main():
+    # Ask user for inputs
+    size = float(input("Enter the size for the axes: "))
+    increment = float(input("Enter the increment: "))
+
+    n = lines_per_family(size, increment)
+    pairs = SegmentIndex(envelope_segments(size, increment)).intersecting_pairs()
+    families = pairs // max(n, 1)
+    print(f"{len(pairs)} crossing line pairs")
+    for first in range(4):
+        for second in range(first, 4):
+            count = np.count_nonzero((families[:, 0] == first) & (families[:, 1] == second))
+            print(f"  {FAMILY_NAMES[first]} x {FAMILY_NAMES[second]}: {count}")
+
+    overlaps = CircleIndex(*four_circle_layout(increment)).overlapping_pairs()
+    print(f"\n{len(overlaps)} overlapping circle pairs with radius {increment}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+import importlib
+import threading
+
+
+def _import_quietly(names):
+    for name in names:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            # The code that needs the module reports the problem when it runs
+            pass
+
+
+def preload(*names):
+    """
+    Import modules on a background thread.
+
+    Tools call this right after building their first window, so heavy
+    modules load while the window paints instead of before it appears.
+    Code that uses them still imports them normally at the point of use;
+    Python's import lock makes that wait for a preload in progress rather
+    than import twice.
+
+    Args:
+        *names (str): Module names, e.g. 'cryptography.fernet'
+
+    Returns:
+        threading.Thread: The started daemon thread
+    """
+    thread = threading.Thread(target=_import_quietly, args=(names,), name='preload', daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,219 @@
+import argparse
+import os
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+
+from line_geometry import FAMILY_COLORS, family_segments, marker_points, parse_values
+from line_raster import write_png
+
+try:
+    from PIL import GifImagePlugin, Image
+except ImportError:
+    GifImagePlugin = None
+    Image = None
+
+
+class PngSequenceWriter:
+    """Writes every frame to its own numbered PNG file in a directory"""
+
+    def __init__(self, directory, prefix='frame'):
+        self.directory = directory
+        self.prefix = prefix
+        self.frames_written = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def write(self, rgba):
+        path = os.path.join(self.directory, f'{self.prefix}_{self.frames_written:05d}.png')
+        write_png(path, rgba)
+        self.frames_written += 1
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class GifWriter:
+    """
+    Streams frames into an animated GIF.
+
+    Each frame is quantized and encoded as soon as it arrives, with its own
+    color table, so no frames are kept in memory. Needs Pillow.
+    """
+
+    def __init__(self, filename, duration_ms=100, loop=0):
+        if Image is None:
+            raise RuntimeError("Pillow is required to write GIF files (pip install pillow)")
+        self.duration_ms = duration_ms
+        self.loop = loop
+        self.frames_written = 0
+        self._file = open(filename, 'wb')
+
+    def write(self, rgba):
+        frame = Image.fromarray(np.ascontiguousarray(rgba[..., :3])).quantize(
+            256, method=Image.Quantize.FASTOCTREE, dither=Image.Dither.NONE)
+
+        if self.frames_written == 0:
+            # loop adds the NETSCAPE2.0 repeat extension (0 = forever)
+            header, _ = GifImagePlugin.getheader(frame, info={'loop': self.loop, 'duration': self.duration_ms})
+            for chunk in header:
+                self._file.write(chunk)
+
+        for chunk in GifImagePlugin.getdata(frame, duration=self.duration_ms, include_color_table=True):
+            self._file.write(chunk)
+        self.frames_written += 1
+
+    def close(self):
+        if not self._file.closed:
+            self._file.write(b';')
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def open_frame_writer(output, fps=10):
+    """GifWriter for a .gif path, PngSequenceWriter for anything else"""
+    if output.lower().endswith('.gif'):
+        return GifWriter(output, duration_ms=round(1000 / fps))
+    return PngSequenceWriter(output)
+
+
+class EnvelopeAnimator:
+    """
+    One figure for a whole animation of the line.py pattern.
+
+    Axes, grid and labels are drawn once and kept as a background; every
+    frame only swaps the segments of the four LineCollections, the marker
+    offsets and the title, and blits them onto the background. A family
+    whose (size, increment) did not change keeps its segments.
+    """
+
+    def __init__(self, size, figsize=(8, 8), dpi=100, linewidth=0.5, markersize=5):
+        self.size = float(size)
+        self.figure = Figure(figsize=figsize, dpi=dpi)
+        self.canvas = FigureCanvasAgg(self.figure)
+        ax = self.ax = self.figure.add_subplot(1, 1, 1)
+
+        ax.set_xlim(0, size)
+        ax.set_ylim(0, size)
+        ax.set_aspect('equal')
+        ax.grid(True, alpha=0.3)
+        ax.set_xlabel('X Axis', fontsize=12)
+        ax.set_ylabel('Y Axis', fontsize=12)
+        self.title = ax.set_title(f'Multiple Lines (size={size}, increment=0)', fontsize=14, fontweight='bold')
+
+        self.collections = [
+            ax.add_collection(LineCollection([], colors=color, linewidths=linewidth, zorder=2))
+            for color in FAMILY_COLORS
+        ]
+        # scatter sizes are areas in points^2
+        self.markers = ax.scatter(np.empty(0), np.empty(0), s=markersize ** 2, zorder=3)
+
+        self._animated = [*self.collections, self.markers, self.title]
+        for artist in self._animated:
+            artist.set_animated(True)
+
+        self.figure.tight_layout()
+        self.canvas.draw()
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+
+        self._increments = [None] * 4
+        self._marker_points = [np.empty((0, 2))] * 4
+        self.line_counts = [0] * 4
+
+    def update(self, increment):
+        """
+        Move to the next frame's parameters.
+
+        Args:
+            increment (float or sequence): One increment for all families, or
+                one per family in FAMILY_COLORS order
+
+        Returns:
+            list: Indices of the families that had to be recomputed
+        """
+        increments = list(increment) if np.ndim(increment) else [increment] * 4
+        changed = [family for family in range(4) if increments[family] != self._increments[family]]
+
+        for family in changed:
+            segments = family_segments(self.size, increments[family], family)
+            self.collections[family].set_segments(segments)
+            self._marker_points[family] = marker_points(segments)
+            self.line_counts[family] = len(segments)
+            self._increments[family] = increments[family]
+
+        if changed:
+            self.markers.set_offsets(np.concatenate(self._marker_points))
+            self.markers.set_color([color for points, color in zip(self._marker_points, FAMILY_COLORS)
+                                    for _ in range(len(points))])
+            shown = increments[0] if len(set(increments)) == 1 else ', '.join(f'{value:g}' for value in increments)
+            self.title.set_text(f'Multiple Lines (size={self.size:g}, increment={shown})')
+        return changed
+
+    def render(self):
+        """
+        Blit the animated artists onto the static background.
+
+        Returns:
+            numpy.ndarray: (height, width, 4) uint8 view of the canvas; it is
+                overwritten by the next render, copy it to keep it
+        """
+        self.canvas.restore_region(self.background)
+        for artist in self._animated:
+            self.figure.draw_artist(artist)
+        return np.asarray(self.canvas.buffer_rgba())
+
+
+def animate_increments(size, frames, writer, **style):
+    """
+    Render one frame per entry of frames into a frame writer.
+
+    Args:
+        size (float): Length of the axes
+        frames (iterable): Increments, or per-family increment tuples
+        writer: PngSequenceWriter, GifWriter or anything with write(rgba)
+        **style: Passed to EnvelopeAnimator (figsize, dpi, linewidth, markersize)
+
+    Returns:
+        int: Number of frames written
+    """
+    animator = EnvelopeAnimator(size, **style)
+    count = 0
+    for increment in frames:
+        animator.update(increment)
+        writer.write(animator.render())
+        count += 1
+    return count
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Animate the line pattern across a range of increments.")
+    parser.add_argument('--size', type=float, required=True, help="Length of the axes")
+    parser.add_argument('--increments', required=True, type=parse_values,
+                        help="One frame per value, e.g. 0.1:1:0.05 (inclusive range)")
+    parser.add_argument('-o', '--output', default='line_frames',
+                        help="A .gif file, or a directory for a PNG sequence")
+    parser.add_argument('--fps', type=float, default=10)
+    parser.add_argument('--dpi', type=int, default=100)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    with open_frame_writer(args.output, args.fps) as writer:
+        count = animate_increments(args.size, args.increments, writer, dpi=args.dpi)
+    print(f"Wrote {count} frames to {args.output}")
+
+if __name__ == "__main__":
+    main()
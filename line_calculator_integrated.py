@@ -1,33 +1,167 @@
-import matplotlib.pyplot as plt
 import tkinter as tk
-import math
 import sys
 import os
+import threading
 
 # Import the calculator from calculator-app
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'calculator-app'))
 from calculator import Calculator
+from lazy_imports import preload
 
-def run_calculator_with_instructions(size, increment):
-    """Run the calculator with instructions for the user"""
-    root = tk.Tk()
-    root.title("Step 1: Use Calculator")
-    root.geometry("500x250")
-    
-    instructions = f"""
+# numpy and matplotlib are imported where they are used, on the worker
+# thread, so the first window shows without waiting for them
+
+# How often the drawing step checks whether the background work is done
+RESULT_POLL_MS = 50
+
+# The steps of the workflow, in order
+STAGES = ('calculator', 'prediction', 'drawing')
+
+def build_line_figure(size, increment, filename='line_output.png', cancel=None):
+    """
+    Compute the lines and build the finished figure, without any GUI.
+
+    Uses a plain Figure (no pyplot), so it can run on a background thread
+    while the user is still busy with the calculator.
+
+    Args:
+        cancel (threading.Event): Checked between the steps, once it is set
+            the build stops and nothing is saved
+
+    Returns:
+        dict: lines_per_set, expected, line_counts, total_drawn and figure,
+            None when cancelled
+    """
+    def cancelled():
+        return cancel is not None and cancel.is_set()
+
+    from matplotlib.figure import Figure
+    from line_geometry import envelope_segments, lines_per_family
+    from line_render import draw_envelope
+
+    lines_per_set = lines_per_family(size, increment)
+
+    fig = Figure(figsize=(16, 8))
+    ax = fig.add_subplot(1, 1, 1)
+
+    # Compute every line of the four families at once
+    segments = envelope_segments(size, increment)
+    if cancelled():
+        return None
+    line_counts = draw_envelope(ax, segments)
+    total_drawn = sum(line_counts)
+
+    # Set axis limits
+    ax.set_xlim(0, size)
+    ax.set_ylim(0, size)
+    ax.set_aspect('equal')
+
+    # Add grid and labels
+    ax.grid(True, alpha=0.3)
+    ax.set_xlabel('X Axis', fontsize=12)
+    ax.set_ylabel('Y Axis', fontsize=12)
+    ax.set_title(f'Lines Pattern (size={size}, increment={increment}, total={total_drawn})',
+                 fontsize=14, fontweight='bold')
+
+    # Save as PNG, the slowest step
+    if cancelled():
+        return None
+    fig.tight_layout()
+    fig.savefig(filename, dpi=150, bbox_inches='tight')
+
+    return {
+        'lines_per_set': lines_per_set,
+        'expected': lines_per_set * 4,
+        'line_counts': line_counts,
+        'total_drawn': total_drawn,
+        'figure': fig,
+        'filename': filename,
+    }
+
+def print_step(title):
+    print("\n" + "="*50)
+    print(title)
+    print("="*50)
+
+class LineWorkflow:
+    """
+    The calculator, prediction and drawing steps as stages of one Tk window.
+
+    The prediction and the figure are computed on a background thread as
+    soon as the window opens, so each "Continue" only swaps the content of
+    the window.
+
+    Args:
+        stages (tuple): Steps to show, a subset of STAGES; the window closes
+            after the last one
+    """
+
+    def __init__(self, root, size, increment, stages=STAGES):
+        self.root = root
+        self.size = size
+        self.increment = increment
+        self.stages = [name for name in STAGES if name in stages]
+        self.root.protocol("WM_DELETE_WINDOW", self.finish)
+
+        # Set when the drawing stage shows its figure
+        self.total_drawn = None
+        self.status = None
+
+        from concurrent.futures import ThreadPoolExecutor
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._cancel = threading.Event()
+        self.result = None
+        if 'drawing' in self.stages:
+            self.result = self._executor.submit(build_line_figure, size, increment, cancel=self._cancel)
+            # Needed by the drawing stage only
+            preload('matplotlib.backends.backend_tkagg')
+
+        self.stage = None
+        self._stage_index = -1
+        self.next_stage()
+
+    def next_stage(self):
+        """Show the next step, or close the window after the last one"""
+        self._stage_index += 1
+        if self._stage_index >= len(self.stages):
+            self.finish()
+            return
+        show = {
+            'calculator': self.show_calculator_stage,
+            'prediction': self.show_prediction_stage,
+            'drawing': self.show_drawing_stage,
+        }[self.stages[self._stage_index]]
+        show()
+
+    def _new_stage(self, title, geometry):
+        if self.stage is not None:
+            self.stage.destroy()
+        self.root.title(title)
+        self.root.geometry(geometry)
+        self.stage = tk.Frame(self.root)
+        self.stage.pack(fill='both', expand=True)
+        return self.stage
+
+    def show_calculator_stage(self):
+        """Step 1: instructions and the calculator"""
+        print_step("STEP 1: USE YOUR CALCULATOR")
+        stage = self._new_stage("Step 1: Use Calculator", "500x250")
+        size, increment = self.size, self.increment
+
+        instructions = f"""
     CALCULATE LINES PER SET USING THE CALCULATOR
     =============================================
-    
+
     Size: {size}
     Increment: {increment}
-    
+
     When you click "Open Calculator", use it to compute:
-    
-        {size} ÷ {increment} = ?
-    
+
+        ({size} - 1) ÷ {increment} = ?
+
     Steps:
     1. Click "Open Calculator" button below
-    2. Enter {size}
+    2. Enter {size - 1:g} (the size minus 1)
     3. Click / (division)
     4. Enter {increment}
     5. Click =
@@ -35,223 +169,151 @@ def run_calculator_with_instructions(size, increment):
     7. Close the calculator window
     8. Click "Continue" below
     """
-    
-    label = tk.Label(root, text=instructions, font=('Courier', 10), 
-                    justify='left', bg='lightyellow', padx=15, pady=15)
-    label.pack(pady=10, fill='both', expand=True)
-    
-    # Function to open calculator
-    def open_calculator():
-        calc_window = tk.Toplevel(root)
+
+        label = tk.Label(stage, text=instructions, font=('Courier', 10),
+                        justify='left', bg='lightyellow', padx=15, pady=15)
+        label.pack(pady=10, fill='both', expand=True)
+
+        button_frame = tk.Frame(stage)
+        button_frame.pack(pady=10)
+
+        calc_button = tk.Button(button_frame, text="Open Calculator",
+                               command=self.open_calculator, font=('Arial', 11),
+                               bg='blue', fg='white', padx=15, pady=8)
+        calc_button.pack(side='left', padx=5)
+
+        continue_button = tk.Button(button_frame, text="Continue to Results",
+                                   command=self.next_stage, font=('Arial', 11),
+                                   bg='green', fg='white', padx=15, pady=8)
+        continue_button.pack(side='left', padx=5)
+
+    def open_calculator(self):
+        calc_window = tk.Toplevel(self.root)
         calc_window.title("Programmer Calculator")
-        calculator = Calculator(calc_window)
-    
-    # Function to continue
-    def continue_program():
-        root.quit()
-        root.destroy()
-    
-    button_frame = tk.Frame(root)
-    button_frame.pack(pady=10)
-    
-    calc_button = tk.Button(button_frame, text="Open Calculator", 
-                           command=open_calculator, font=('Arial', 11), 
-                           bg='blue', fg='white', padx=15, pady=8)
-    calc_button.pack(side='left', padx=5)
-    
-    continue_button = tk.Button(button_frame, text="Continue to Results", 
-                               command=continue_program, font=('Arial', 11), 
-                               bg='green', fg='white', padx=15, pady=8)
-    continue_button.pack(side='left', padx=5)
-    
-    root.mainloop()
+        Calculator(calc_window)
 
-def show_prediction_window(size, increment):
-    """Show final prediction"""
-    # Calculate expected lines using math
-    lines_per_set = math.floor(size / increment) + 1
-    total_lines = lines_per_set * 4
-    
-    root = tk.Tk()
-    root.title("Step 2: Line Prediction Results")
-    root.geometry("450x300")
-    
-    info_text = f"""
+    def show_prediction_stage(self):
+        """Step 2: the predicted line count"""
+        print_step("STEP 2: VIEW PREDICTION")
+        stage = self._new_stage("Step 2: Line Prediction Results", "450x300")
+        size, increment = self.size, self.increment
+
+        # Closed form, no need to wait for the background work
+        from line_geometry import lines_per_family
+        lines_per_set = lines_per_family(size, increment)
+        total_lines = lines_per_set * 4
+
+        info_text = f"""
     LINE CALCULATION RESULTS
     ========================
-    
+
     Size: {size}
     Increment: {increment}
-    
+
     Mathematical calculation:
-    Lines per set = floor({size}/{increment}) + 1 = {lines_per_set}
+    Lines per set = floor(({size} - 1)/{increment}) + 1 = {lines_per_set}
     Number of sets: 4
-    
+
     TOTAL EXPECTED LINES: {total_lines}
-    
+
     Formula: {lines_per_set} × 4 = {total_lines}
-    
-    (Did your calculator give you {size}/{increment} = {size/increment:.2f}?)
+
+    (Did your calculator give you ({size} - 1)/{increment} = {(size - 1)/increment:.2f}?)
     """
-    
-    label = tk.Label(root, text=info_text, font=('Courier', 10), justify='left', 
-                    padx=20, pady=20, bg='lightblue')
-    label.pack(fill='both', expand=True)
-    
-    def proceed():
-        root.quit()
-        root.destroy()
-    
-    button = tk.Button(root, text="Proceed to Draw Lines", command=proceed, 
-                      font=('Arial', 12), bg='darkgreen', fg='white', padx=20, pady=10)
-    button.pack(pady=15)
-    
+
+        label = tk.Label(stage, text=info_text, font=('Courier', 10), justify='left',
+                        padx=20, pady=20, bg='lightblue')
+        label.pack(fill='both', expand=True)
+
+        button = tk.Button(stage, text="Proceed to Draw Lines", command=self.next_stage,
+                          font=('Arial', 12), bg='darkgreen', fg='white', padx=20, pady=10)
+        button.pack(pady=15)
+
+        print(f"\nExpected lines: {total_lines}")
+
+    def show_drawing_stage(self):
+        """Step 3: the figure, embedded once the background work is done"""
+        print_step("STEP 3: DRAWING LINES")
+        stage = self._new_stage("Step 3: Lines", "1200x700")
+        self.status = tk.Label(stage, text="Drawing lines...", font=('Arial', 12))
+        self.status.pack(pady=20)
+        self._wait_for_result()
+
+    def _wait_for_result(self):
+        if not self.result.done():
+            self.root.after(RESULT_POLL_MS, self._wait_for_result)
+            return
+
+        try:
+            result = self.result.result()
+        except Exception as e:
+            self.status.config(text=f"Drawing failed: {e}", fg='red')
+            return
+        if result is None:
+            return  # Cancelled by finish
+        self.status.destroy()
+        self.total_drawn = result['total_drawn']
+
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+        from line_geometry import FAMILY_COLORS, FAMILY_NAMES
+
+        for index, count in enumerate(result['line_counts']):
+            print(f"Drew {count} lines in {FAMILY_NAMES[index]} set ({FAMILY_COLORS[index]})")
+        print(f"\nACTUAL TOTAL: {result['total_drawn']} lines")
+        print(f"EXPECTED TOTAL: {result['expected']} lines")
+        print(f"Difference: {abs(result['total_drawn'] - result['expected'])}")
+        print(f"\nVisualization saved to {result['filename']}")
+
+        canvas = FigureCanvasTkAgg(result['figure'], master=self.stage)
+        NavigationToolbar2Tk(canvas, self.stage).update()
+        canvas.get_tk_widget().pack(fill='both', expand=True)
+        canvas.draw()
+
+        button = tk.Button(self.stage, text="Finish", command=self.finish,
+                          font=('Arial', 12), bg='darkgreen', fg='white', padx=20, pady=5)
+        button.pack(pady=5)
+
+    def finish(self):
+        # A build in progress stops at its next step instead of keeping
+        # the process alive until the figure is saved
+        self._cancel.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.root.quit()
+        self.root.destroy()
+
+def run_calculator_with_instructions(size, increment):
+    """Run the calculator with instructions for the user"""
+    root = tk.Tk()
+    LineWorkflow(root, size, increment, stages=('calculator',))
     root.mainloop()
-    
-    return total_lines
+
+def show_prediction_window(size, increment):
+    """Show final prediction"""
+    from line_geometry import predict_line_count
+
+    root = tk.Tk()
+    LineWorkflow(root, size, increment, stages=('prediction',))
+    root.mainloop()
+
+    return predict_line_count(size, increment)
 
 def draw_lines(size, increment):
-    """Original line drawing logic"""
-    fig, ax = plt.subplots(1, 1, figsize=(16, 8))
-    
-    # First set of lines
-    line_count = 0
-    y1 = size
-    x2 = 1
-    
-    while y1 >= 0 and x2 <= size:
-        P1 = (0, y1)
-        P2 = (x2, 0)
-        ax.plot([P1[0], P2[0]], [P1[1], P2[1]], color='teal', linewidth=0.5)
-        
-        if line_count == 0 or y1 - increment < 0 or x2 + increment > size:
-            ax.plot(P1[0], P1[1], 'o', color='teal', markersize=5)
-            ax.plot(P2[0], P2[1], 'o', color='teal', markersize=5)
-        
-        y1 -= increment
-        x2 += increment
-        line_count += 1
-    
-    print(f"Drew {line_count} lines in first set (teal)")
-    
-    # Second set of lines
-    line_count2 = 0
-    y3 = 0
-    x4 = size - 1
-    
-    while y3 <= size and x4 >= 0:
-        P3 = (size, y3)
-        P4 = (x4, size)
-        ax.plot([P3[0], P4[0]], [P3[1], P4[1]], color='coral', linewidth=0.5)
-        
-        if line_count2 == 0 or y3 + increment > size or x4 - increment < 0:
-            ax.plot(P3[0], P3[1], 'o', color='coral', markersize=5)
-            ax.plot(P4[0], P4[1], 'o', color='coral', markersize=5)
-        
-        y3 += increment
-        x4 -= increment
-        line_count2 += 1
-    
-    print(f"Drew {line_count2} lines in second set (coral)")
-    
-    # Third set of lines
-    line_count3 = 0
-    y5 = 0
-    x6 = 1
-    
-    while y5 <= size and x6 <= size:
-        P5 = (0, y5)
-        P6 = (x6, size)
-        ax.plot([P5[0], P6[0]], [P5[1], P6[1]], color='purple', linewidth=0.5)
-        
-        if line_count3 == 0 or y5 + increment > size or x6 + increment > size:
-            ax.plot(P5[0], P5[1], 'o', color='purple', markersize=5)
-            ax.plot(P6[0], P6[1], 'o', color='purple', markersize=5)
-        
-        y5 += increment
-        x6 += increment
-        line_count3 += 1
-    
-    print(f"Drew {line_count3} lines in third set (purple)")
-    
-    # Fourth set of lines
-    line_count4 = 0
-    y7 = size - 1
-    x8 = size - 1
-    
-    while y7 >= 0 and x8 >= 0:
-        P7 = (size, y7)
-        P8 = (x8, 0)
-        ax.plot([P7[0], P8[0]], [P7[1], P8[1]], color='gold', linewidth=0.5)
-        
-        if line_count4 == 0 or y7 - increment < 0 or x8 - increment < 0:
-            ax.plot(P7[0], P7[1], 'o', color='gold', markersize=5)
-            ax.plot(P8[0], P8[1], 'o', color='gold', markersize=5)
-        
-        y7 -= increment
-        x8 -= increment
-        line_count4 += 1
-    
-    print(f"Drew {line_count4} lines in fourth set (gold)")
-    
-    total_drawn = line_count + line_count2 + line_count3 + line_count4
-    print(f"\nACTUAL TOTAL: {total_drawn} lines")
-    
-    # Compare with prediction
-    expected = (math.floor(size / increment) + 1) * 4
-    print(f"EXPECTED TOTAL: {expected} lines")
-    print(f"Difference: {abs(total_drawn - expected)}")
-    
-    # Set axis limits
-    ax.set_xlim(0, size)
-    ax.set_ylim(0, size)
-    ax.set_aspect('equal')
-    
-    # Add grid and labels
-    ax.grid(True, alpha=0.3)
-    ax.set_xlabel('X Axis', fontsize=12)
-    ax.set_ylabel('Y Axis', fontsize=12)
-    ax.set_title(f'Lines Pattern (size={size}, increment={increment}, total={total_drawn})', 
-                 fontsize=14, fontweight='bold')
-    
-    # Save as PNG
-    filename = 'line_output.png'
-    plt.tight_layout()
-    plt.savefig(filename, dpi=150, bbox_inches='tight')
-    print(f"\nVisualization saved to {filename}")
-    
-    # Display
-    plt.show()
-    
-    return total_drawn
+    """Draw the lines in a window, returns the number drawn (None if closed before)"""
+    root = tk.Tk()
+    workflow = LineWorkflow(root, size, increment, stages=('drawing',))
+    root.mainloop()
+
+    return workflow.total_drawn
 
 def main():
     # Ask user for inputs
     size = float(input("Enter the size for the axes: "))
     increment = float(input("Enter the increment: "))
-    
-    print("\n" + "="*50)
-    print("STEP 1: USE YOUR CALCULATOR")
-    print("="*50)
-    
-    # Step 1: Instructions and calculator
-    run_calculator_with_instructions(size, increment)
-    
-    print("\n" + "="*50)
-    print("STEP 2: VIEW PREDICTION")
-    print("="*50)
-    
-    # Step 2: Show prediction
-    expected = show_prediction_window(size, increment)
-    
-    print(f"\nExpected lines: {expected}")
-    print("\n" + "="*50)
-    print("STEP 3: DRAWING LINES")
-    print("="*50 + "\n")
-    
-    # Step 3: Draw the lines
-    actual_lines = draw_lines(size, increment)
-    
+
+    root = tk.Tk()
+    LineWorkflow(root, size, increment)
+    root.mainloop()
+
     print("\n" + "="*50)
     print("✓ PROCESS COMPLETE!")
     print("="*50)
@@ -0,0 +1,242 @@
+import random
+from decimal import Decimal
+
+import numpy as np
+
+# The four envelope line families drawn by line.py, in drawing order
+FAMILY_COLORS = ['teal', 'coral', 'purple', 'gold']
+FAMILY_NAMES = ['first', 'second', 'third', 'fourth']
+
+
+def _exact(value):
+    """Decimal of the number as the user typed it (0.1 stays 0.1)"""
+    return Decimal(repr(float(value)))
+
+
+def lines_per_family(size, increment):
+    """
+    Number of lines in each of the four families.
+
+    Every family steps an offset of k * increment from a corner and stops
+    once the moving end passes 1 or size - 1, so all four families draw
+    floor((size - 1) / increment) + 1 lines. The division is done in decimal
+    so that e.g. size=10, increment=0.1 gives 91 lines, not 90 or 92.
+
+    Args:
+        size (float): Length of the axes
+        increment (float): Step between consecutive lines (must be > 0)
+
+    Returns:
+        int: Lines per family (0 when size < 1)
+    """
+    if increment <= 0:
+        raise ValueError("increment must be greater than 0")
+    span = _exact(size) - 1
+    if span < 0:
+        return 0
+    return int(span // _exact(increment)) + 1
+
+
+def predict_line_count(size, increment):
+    """Total number of lines in all four families, without drawing anything"""
+    return 4 * lines_per_family(size, increment)
+
+
+def parse_values(spec):
+    """
+    Parse a list of grid values.
+
+    Accepts comma separated numbers ("10,20,50") and inclusive ranges
+    written start:stop:step ("0.1:0.5:0.1"). Ranges are stepped in decimal
+    so they do not pick up float drift.
+
+    Args:
+        spec (str): Value specification
+
+    Returns:
+        list: Float values in the given order
+    """
+    values = []
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if ':' not in part:
+            values.append(float(part))
+            continue
+
+        start, stop, step = (Decimal(piece) for piece in part.split(':'))
+        if step <= 0:
+            raise ValueError(f"Range step must be greater than 0: {part}")
+        value = start
+        while value <= stop:
+            values.append(float(value))
+            value += step
+    return values
+
+
+def count_lines_brute_force(size, increment):
+    """
+    Reference count that walks the original drawing loops of line.py one
+    step at a time, in decimal so the steps do not drift.
+
+    Only meant for checking lines_per_family, it takes O(lines) time.
+
+    Returns:
+        list: Lines drawn per family, in FAMILY_NAMES order
+    """
+    size = _exact(size)
+    increment = _exact(increment)
+    if increment <= 0:
+        raise ValueError("increment must be greater than 0")
+
+    # Loop conditions of the four while loops, as a function of the offset
+    conditions = [
+        lambda t: size - t >= 0 and 1 + t <= size,
+        lambda t: t <= size and size - 1 - t >= 0,
+        lambda t: t <= size and 1 + t <= size,
+        # y7 and x8 both start at size - 1, so their two checks are one
+        lambda t: size - 1 - t >= 0,
+    ]
+
+    counts = []
+    for condition in conditions:
+        count = 0
+        offset = Decimal(0)
+        while condition(offset):
+            count += 1
+            offset += increment
+        counts.append(count)
+    return counts
+
+
+def check_line_counts(samples=2000, seed=None, max_lines=20000):
+    """
+    Compare lines_per_family against count_lines_brute_force on random
+    inputs with up to three decimals. Half of the samples are placed
+    exactly on, or one step next to, a boundary where another line fits.
+
+    Args:
+        samples (int): Number of (size, increment) pairs to try
+        seed (int): Seed for reproducible runs
+        max_lines (int): Skip inputs with more lines than this per family
+
+    Returns:
+        list: (size, increment, brute force counts, predicted) for every mismatch
+    """
+    rng = random.Random(seed)
+    step = Decimal('0.001')
+    mismatches = []
+
+    for sample in range(samples):
+        increment = Decimal(rng.randint(1, 5000)) * step
+        if sample % 2:
+            lines = rng.randint(0, 2000)
+            size = 1 + lines * increment + rng.choice((-step, 0, step))
+        else:
+            size = Decimal(rng.randint(0, 50000)) * step
+        if size < 0 or (size - 1) / increment > max_lines:
+            continue
+
+        size, increment = float(size), float(increment)
+        expected = count_lines_brute_force(size, increment)
+        predicted = lines_per_family(size, increment)
+        if expected != [predicted] * 4:
+            mismatches.append((size, increment, expected, predicted))
+    return mismatches
+
+
+def _fill_family(out, size, offsets, family):
+    """Write the (n, 2, 2) lines of one family into out"""
+    if family == 0:
+        # First set (teal): (0, size - t) -> (1 + t, 0)
+        out[:, 0, 0] = 0
+        out[:, 0, 1] = size - offsets
+        out[:, 1, 0] = 1 + offsets
+        out[:, 1, 1] = 0
+    elif family == 1:
+        # Second set (coral): (size, t) -> (size - 1 - t, size)
+        out[:, 0, 0] = size
+        out[:, 0, 1] = offsets
+        out[:, 1, 0] = size - 1 - offsets
+        out[:, 1, 1] = size
+    elif family == 2:
+        # Third set (purple): (0, t) -> (1 + t, size)
+        out[:, 0, 0] = 0
+        out[:, 0, 1] = offsets
+        out[:, 1, 0] = 1 + offsets
+        out[:, 1, 1] = size
+    else:
+        # Fourth set (gold): (size, size - 1 - t) -> (size - 1 - t, 0)
+        out[:, 0, 0] = size
+        out[:, 0, 1] = size - 1 - offsets
+        out[:, 1, 0] = size - 1 - offsets
+        out[:, 1, 1] = 0
+
+
+def family_segments(size, increment, family):
+    """
+    Compute the lines of a single family.
+
+    Args:
+        size (float): Length of the axes
+        increment (float): Step between consecutive lines
+        family (int): Index into FAMILY_COLORS
+
+    Returns:
+        numpy.ndarray: Float array of shape (n, 2, 2)
+    """
+    n = lines_per_family(size, increment)
+    offsets = np.arange(n, dtype=np.float64) * float(increment)
+    segments = np.empty((n, 2, 2), dtype=np.float64)
+    _fill_family(segments, float(size), offsets, family)
+    return segments
+
+
+def envelope_segments(size, increment):
+    """
+    Compute every line of the four families in one shot.
+
+    Args:
+        size (float): Length of the axes
+        increment (float): Step between consecutive lines
+
+    Returns:
+        numpy.ndarray: Float array of shape (4 * n, 2, 2) holding
+            [[x_start, y_start], [x_end, y_end]] per line, families stored
+            one after another in FAMILY_COLORS order.
+    """
+    n = lines_per_family(size, increment)
+    offsets = np.arange(n, dtype=np.float64) * float(increment)
+
+    segments = np.empty((4, n, 2, 2), dtype=np.float64)
+    for family in range(4):
+        _fill_family(segments[family], float(size), offsets, family)
+
+    return segments.reshape(4 * n, 2, 2)
+
+
+def split_families(segments):
+    """Split an envelope segment array into its four (n, 2, 2) families"""
+    return np.split(segments, 4)
+
+
+def marker_points(family):
+    """
+    End points of the first and last line of a family, which the drawings
+    mark with dots.
+
+    Returns:
+        numpy.ndarray: Array of shape (M, 2), empty when the family is empty
+    """
+    if len(family) == 0:
+        return np.empty((0, 2))
+    ends = family[[0, -1]] if len(family) > 1 else family[:1]
+    return ends.reshape(-1, 2)
+
+
+if __name__ == "__main__":
+    mismatches = check_line_counts(seed=0)
+    for size, increment, expected, predicted in mismatches:
+        print(f"size={size} increment={increment}: loops draw {expected}, predicted {predicted}")
+    print(f"{len(mismatches)} mismatches")
@@ -0,0 +1,523 @@
+import os
+import struct
+import zlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from line_geometry import (FAMILY_COLORS, FAMILY_NAMES, envelope_segments, lines_per_family, marker_points,
+                           split_families)
+from render_cache import RenderCache, pattern_key
+
+# RGB values of the matplotlib named colors used by the line and circle drawings
+COLOR_RGB = {
+    'teal': (0, 128, 128),
+    'coral': (255, 127, 80),
+    'purple': (128, 0, 128),
+    'gold': (255, 215, 0),
+    'blue': (0, 0, 255),
+    'red': (255, 0, 0),
+    'green': (0, 128, 0),
+    'orange': (255, 165, 0),
+    'black': (0, 0, 0),
+    'grid': (176, 176, 176),
+    'white': (255, 255, 255),
+}
+
+# Upper bound on line samples rasterized per batch, keeps temporary arrays small
+MAX_SAMPLES_PER_BATCH = 4_000_000
+
+# Pixels rendered per band when streaming a PNG, sets the band height
+TILE_PIXELS = 4_000_000
+
+# Segment end points are snapped to 1/SUBPIXEL_STEPS of a pixel before
+# identical segments are merged
+SUBPIXEL_STEPS = 4
+
+
+class PngWriter:
+    """
+    Minimal streaming PNG encoder (8-bit RGBA, no interlacing).
+
+    Rows can be written in any number of bands, so an image never has to
+    exist in memory as a whole. Only the standard library is used.
+    """
+
+    def __init__(self, filename, width, height, compression=6):
+        self.width = width
+        self.height = height
+        self.rows_written = 0
+        self._file = open(filename, 'wb')
+        self._compressor = zlib.compressobj(compression)
+
+        self._file.write(b'\x89PNG\r\n\x1a\n')
+        self._write_chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0))
+
+    def _write_chunk(self, chunk_type, data):
+        self._file.write(struct.pack('>I', len(data)))
+        self._file.write(chunk_type)
+        self._file.write(data)
+        self._file.write(struct.pack('>I', zlib.crc32(chunk_type + data) & 0xFFFFFFFF))
+
+    def write_rows(self, rows):
+        """Append a band of rows, a uint8 array of shape (rows, width, 4)"""
+        rows = np.ascontiguousarray(rows, dtype=np.uint8)
+        if rows.shape[1:] != (self.width, 4):
+            raise ValueError(f"Expected rows of shape (*, {self.width}, 4), got {rows.shape}")
+
+        # Every scanline starts with filter type 0 (None)
+        scanlines = np.zeros((rows.shape[0], self.width * 4 + 1), dtype=np.uint8)
+        scanlines[:, 1:] = rows.reshape(rows.shape[0], -1)
+        data = self._compressor.compress(scanlines.tobytes())
+        if data:
+            self._write_chunk(b'IDAT', data)
+        self.rows_written += rows.shape[0]
+
+    def close(self):
+        if self.rows_written != self.height:
+            self._file.close()
+            raise ValueError(f"PNG expects {self.height} rows, {self.rows_written} were written")
+        self._write_chunk(b'IDAT', self._compressor.flush())
+        self._write_chunk(b'IEND', b'')
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self._file.close()
+
+
+def write_png(filename, rgba):
+    """Write a (height, width, 4) uint8 array as a PNG file"""
+    height, width = rgba.shape[:2]
+    with PngWriter(filename, width, height) as writer:
+        writer.write_rows(rgba)
+
+
+def _segment_groups(counts, budget):
+    """
+    Split segment indices, sorted by sample count, into groups whose padded
+    size (group length x longest count) stays within the budget and whose
+    counts are similar, so little work is spent on padding.
+    """
+    order = np.argsort(counts, kind='stable')
+    sorted_counts = counts[order]
+    if len(order) == 0:
+        return
+
+    # Count classes grow geometrically: each spans lowest .. lowest * 1.25 + 8
+    bounds = [1]
+    while bounds[-1] <= sorted_counts[-1]:
+        bounds.append(bounds[-1] * 1.25 + 8)
+    classes = np.searchsorted(bounds, sorted_counts, side='right')
+    edges = np.flatnonzero(np.diff(classes)) + 1
+
+    for start, stop in zip([0, *edges], [*edges, len(order)]):
+        rows = max(1, budget // max(int(sorted_counts[stop - 1]), 1))
+        for chunk_start in range(start, stop, rows):
+            yield order[chunk_start:min(chunk_start + rows, stop)]
+
+
+def merge_segments(segments, intensity=1.0):
+    """
+    Snap pixel-space segments to 1/SUBPIXEL_STEPS of a pixel and merge the
+    ones that coincide, which keeps very dense patterns cheap.
+
+    Returns:
+        tuple: (unique segments, float32 weight per segment, i.e. the
+            multiplicity times intensity)
+    """
+    if len(segments) == 0:
+        return np.empty((0, 2, 2)), np.empty(0, dtype=np.float32)
+    quantized = np.rint(np.asarray(segments, dtype=np.float64).reshape(-1, 4) * SUBPIXEL_STEPS).astype(np.int64)
+    unique, multiplicity = np.unique(quantized, axis=0, return_counts=True)
+    return unique.reshape(-1, 2, 2) / SUBPIXEL_STEPS, (multiplicity * intensity).astype(np.float32)
+
+
+def accumulate_segments(coverage, segments, intensity=1.0, weights=None):
+    """
+    Add anti-aliased coverage of pixel-space segments to a 2D float buffer.
+
+    Each segment is sampled once per pixel along its major axis and every
+    sample is split between the two nearest pixels across the line
+    (Xiaolin Wu style). Segments of similar length are processed together as
+    one padded 2D array, so the work is plain broadcasting.
+
+    Args:
+        coverage (numpy.ndarray): (height, width) float32 buffer, updated in place
+        segments (numpy.ndarray): (N, 2, 2) segments in pixel coordinates
+        intensity (float): Coverage a one pixel wide line contributes
+        weights (numpy.ndarray): Per segment coverage from merge_segments.
+            When omitted the segments are merged here.
+    """
+    height, width = coverage.shape
+    if len(segments) == 0:
+        return
+
+    if weights is None:
+        segments, weights = merge_segments(segments, intensity)
+
+    extent = np.abs(segments[:, 1, :] - segments[:, 0, :])
+    steep = extent[:, 1] > extent[:, 0]
+
+    flat = coverage.reshape(-1)
+    for is_steep in (False, True):
+        chosen = np.flatnonzero(steep == is_steep)
+        if len(chosen) == 0:
+            continue
+
+        # Walk along the major axis: x for shallow segments, y for steep ones
+        oriented = segments[chosen][:, :, ::-1] if is_steep else segments[chosen]
+        major_limit, minor_limit = (height, width) if is_steep else (width, height)
+        major_stride, minor_stride = (width, 1) if is_steep else (1, width)
+
+        # Orient every segment so the major coordinate increases
+        flip = oriented[:, 1, 0] < oriented[:, 0, 0]
+        start = np.where(flip[:, None], oriented[:, 1], oriented[:, 0])
+        end = np.where(flip[:, None], oriented[:, 0], oriented[:, 1])
+
+        first_major = np.ceil(start[:, 0] - 0.5)
+        counts = np.maximum(np.floor(end[:, 0] + 0.5) - first_major + 1, 0).astype(np.int64)
+        run = end[:, 0] - start[:, 0]
+        slope = np.divide(end[:, 1] - start[:, 1], run, out=np.zeros_like(run), where=run > 0)
+        first_minor = start[:, 1] + (first_major - start[:, 0]) * slope
+        group_weights = weights[chosen]
+
+        for group in _segment_groups(counts, MAX_SAMPLES_PER_BATCH):
+            steps = np.arange(counts[group].max(), dtype=np.float32)
+            major = first_major[group, None].astype(np.int64) + steps.astype(np.int64)
+            minor = first_minor[group, None].astype(np.float32) + steps * slope[group, None].astype(np.float32)
+
+            minor_floor = np.floor(minor)
+            fraction = minor - minor_floor
+            minor_floor = minor_floor.astype(np.int64)
+
+            valid = (steps < counts[group, None]) & (major >= 0) & (major < major_limit)
+            index = minor_floor * minor_stride + major * major_stride
+            sample_weight = group_weights[group, None]
+
+            near = valid & (minor_floor >= 0) & (minor_floor < minor_limit)
+            far = valid & (minor_floor >= -1) & (minor_floor < minor_limit - 1)
+            index = np.concatenate([index[near], index[far] + minor_stride])
+            if index.size == 0:
+                continue
+            # Only bin the index range this group touches, not the whole buffer
+            lowest = index.min()
+            sums = np.bincount(
+                index - lowest,
+                weights=np.concatenate([
+                    ((1 - fraction) * sample_weight)[near],
+                    (fraction * sample_weight)[far],
+                ]),
+            )
+            flat[lowest:lowest + sums.size] += sums.astype(flat.dtype)
+
+
+def clip_segments_to_rows(segments, top, bottom):
+    """
+    Clip pixel-space segments to the strip top <= y <= bottom.
+
+    Clipped end points stay on the original line, so a segment rasterized
+    strip by strip gives the same pixels as the whole segment.
+
+    Returns:
+        tuple: ((M, 2, 2) clipped segments, boolean mask of the input
+            segments that cross the strip)
+    """
+    if len(segments) == 0:
+        return segments, np.zeros(0, dtype=bool)
+    start = segments[:, 0]
+    delta = segments[:, 1] - start
+    y0, dy = start[:, 1], delta[:, 1]
+
+    # Parameter interval along each segment where y lies inside the strip
+    sloped = dy != 0
+    t_top = np.divide(top - y0, dy, out=np.zeros_like(dy), where=sloped)
+    t_bottom = np.divide(bottom - y0, dy, out=np.zeros_like(dy), where=sloped)
+    level_inside = (y0 >= top) & (y0 <= bottom)
+    t_low = np.where(sloped, np.minimum(t_top, t_bottom), np.where(level_inside, 0, np.inf))
+    t_high = np.where(sloped, np.maximum(t_top, t_bottom), np.where(level_inside, 1, -np.inf))
+    t_low = np.maximum(t_low, 0)
+    t_high = np.minimum(t_high, 1)
+
+    keep = t_low <= t_high
+    start, delta = start[keep], delta[keep]
+    clipped = np.empty((len(start), 2, 2), dtype=np.float64)
+    clipped[:, 0] = start + t_low[keep, None] * delta
+    clipped[:, 1] = start + t_high[keep, None] * delta
+    return clipped, keep
+
+
+def accumulate_discs(coverage, centers, radius):
+    """Add anti-aliased filled discs (pixel-space centers, radius in pixels)"""
+    height, width = coverage.shape
+    if len(centers) == 0:
+        return
+
+    reach = int(np.ceil(radius)) + 1
+    offsets = np.arange(-reach, reach + 1)
+    dy, dx = np.meshgrid(offsets, offsets, indexing='ij')
+
+    base = np.rint(centers).astype(np.int64)
+    rows = base[:, 1, None, None] + dy
+    columns = base[:, 0, None, None] + dx
+    distance = np.hypot(columns - centers[:, 0, None, None], rows - centers[:, 1, None, None])
+    weight = np.clip(radius + 0.5 - distance, 0, 1)
+
+    inside = (columns >= 0) & (columns < width) & (rows >= 0) & (rows < height) & (weight > 0)
+    flat = coverage.reshape(-1)
+    np.maximum.at(flat, rows[inside] * width + columns[inside], weight[inside].astype(flat.dtype))
+
+
+def composite(rgb, coverage, color, alpha=1.0):
+    """Blend a solid color into an (height, width, 3) float image by coverage"""
+    touched = np.flatnonzero(coverage)
+    if touched.size == 0:
+        return
+    weight = np.minimum(coverage.reshape(-1)[touched], 1)[:, None] * alpha
+    pixels = rgb.reshape(-1, 3)
+    pixels[touched] = pixels[touched] * (1 - weight) + weight * np.asarray(color, dtype=np.float32)
+
+
+def nice_ticks(size, target=8):
+    """Tick positions from 0 to size on a 1/2/2.5/5 x 10^k step"""
+    if size <= 0:
+        return np.array([0.0])
+    raw = size / target
+    magnitude = 10 ** np.floor(np.log10(raw))
+    step = min((m * magnitude for m in (1, 2, 2.5, 5, 10) if m * magnitude >= raw), default=raw)
+    return np.arange(0, size + step * 1e-9, step)
+
+
+class EnvelopeCanvas:
+    """
+    Maps the square data area 0..size onto an image of pixels x pixels.
+
+    The plot area sits inside a white margin with a black frame and a light
+    grid, like the matplotlib version. Axis labels and the title are left
+    out, there is no font rasterizer in the standard library.
+    """
+
+    def __init__(self, size, pixels=1200, margin=60):
+        self.size = float(size)
+        self.pixels = pixels
+        self.margin = margin
+        self.plot_pixels = pixels - 2 * margin
+
+    def to_pixels(self, points):
+        """Data coordinates (..., 2) to pixel coordinates, y pointing down"""
+        points = np.asarray(points, dtype=np.float64)
+        scale = (self.plot_pixels - 1) / self.size if self.size > 0 else 0
+        result = np.empty_like(points)
+        result[..., 0] = self.margin + points[..., 0] * scale
+        result[..., 1] = self.margin + (self.size - points[..., 1]) * scale
+        return result
+
+    def frame_segments(self):
+        corners = self.to_pixels([[0, 0], [self.size, 0], [self.size, self.size], [0, self.size]])
+        return np.stack([corners, np.roll(corners, -1, axis=0)], axis=1)
+
+    def grid_segments(self):
+        ticks = nice_ticks(self.size)
+        vertical = [[[tick, 0], [tick, self.size]] for tick in ticks]
+        horizontal = [[[0, tick], [self.size, tick]] for tick in ticks]
+        return self.to_pixels(np.array(vertical + horizontal, dtype=np.float64).reshape(-1, 2, 2))
+
+
+class EnvelopeScene:
+    """
+    The line.py pattern in pixel coordinates, ready to be rasterized in
+    horizontal bands.
+
+    Each band only rasterizes the segments that cross it, so the memory a
+    band needs depends on its size, not on the size of the whole image.
+    """
+
+    def __init__(self, size, increment, pixels=1200, margin=None, line_intensity=1.0, marker_radius=None,
+                 segments=None):
+        if margin is None:
+            margin = round(pixels / 20)
+        if marker_radius is None:
+            # 5 pt markers at 150 dpi, scaled with the image
+            marker_radius = 5.2 * pixels / 1200
+        if segments is None:
+            segments = envelope_segments(size, increment)
+
+        self.pixels = pixels
+        self.marker_radius = marker_radius
+
+        canvas = EnvelopeCanvas(size, pixels, margin)
+        families = split_families(segments)
+        self.line_counts = [len(family) for family in families]
+        # Snapped and merged once, clipping then keeps bands seamless
+        self.families = [merge_segments(canvas.to_pixels(family), line_intensity) for family in families]
+        self.markers = [canvas.to_pixels(marker_points(family)) for family in families]
+        self.grid = merge_segments(canvas.grid_segments())
+        self.frame = merge_segments(canvas.frame_segments())
+
+    def render_rows(self, row_start, row_stop):
+        """
+        Rasterize image rows [row_start, row_stop).
+
+        Returns:
+            numpy.ndarray: (row_stop - row_start, pixels, 4) uint8 RGBA band
+        """
+        height = row_stop - row_start
+        shift = np.array([0, row_start], dtype=np.float64)
+
+        rgb = np.full((height, self.pixels, 3), 255, dtype=np.float32)
+        coverage = np.zeros((height, self.pixels), dtype=np.float32)
+
+        def draw(merged, color, alpha=1.0):
+            segments, weights = merged
+            # A line still covers pixels up to one row away from its center
+            clipped, keep = clip_segments_to_rows(segments, row_start - 2, row_stop + 1)
+            coverage.fill(0)
+            accumulate_segments(coverage, clipped - shift, weights=weights[keep])
+            composite(rgb, coverage, COLOR_RGB[color], alpha)
+
+        draw(self.grid, 'grid', alpha=0.3)
+        for merged, color in zip(self.families, FAMILY_COLORS):
+            draw(merged, color)
+        draw(self.frame, 'black')
+
+        for centers, color in zip(self.markers, FAMILY_COLORS):
+            coverage.fill(0)
+            accumulate_discs(coverage, centers - shift, self.marker_radius)
+            composite(rgb, coverage, COLOR_RGB[color])
+
+        rgba = np.empty((height, self.pixels, 4), dtype=np.uint8)
+        rgba[..., :3] = np.rint(rgb).astype(np.uint8)
+        rgba[..., 3] = 255
+        return rgba
+
+    def bands(self, tile_rows=None):
+        """
+        Yield the image top to bottom as RGBA bands of up to tile_rows rows
+        (by default as many rows as fit in TILE_PIXELS).
+        """
+        for row_range in band_ranges(self.pixels, tile_rows):
+            yield self.render_rows(*row_range)
+
+
+def band_ranges(pixels, tile_rows=None):
+    """Row ranges [start, stop) of the bands of a pixels high image"""
+    tile_rows = tile_rows or max(1, TILE_PIXELS // pixels)
+    return [(start, min(start + tile_rows, pixels)) for start in range(0, pixels, tile_rows)]
+
+
+def render_bands(scene_args, tile_rows=None, workers=1):
+    """
+    Yield the bands of EnvelopeScene(*scene_args), top to bottom.
+
+    With workers > 1 the bands are rendered in a process pool. Only
+    scene_args are sent: every worker builds the scene itself, so the
+    segment arrays never exist in this process, and only a few bands are
+    in flight at a time, so memory stays bounded.
+    """
+    pixels = scene_args[2]
+    ranges = band_ranges(pixels, tile_rows)
+    if workers <= 1 or len(ranges) == 1:
+        yield from EnvelopeScene(*scene_args).bands(tile_rows)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_band_worker,
+                             initargs=(scene_args,)) as pool:
+        pending = deque()
+        for row_range in ranges:
+            pending.append(pool.submit(_render_band, row_range))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+# Scene of a band rendering worker process
+_WORKER_SCENE = None
+
+
+def _init_band_worker(scene_args):
+    global _WORKER_SCENE
+    _WORKER_SCENE = EnvelopeScene(*scene_args)
+
+
+def _render_band(row_range):
+    return _WORKER_SCENE.render_rows(*row_range)
+
+
+def render_envelope_rgba(size, increment, pixels=1200, margin=None, line_intensity=1.0, marker_radius=None,
+                         segments=None, row_range=None):
+    """
+    Rasterize the four line families straight into an RGBA array.
+
+    Args:
+        size (float): Length of the axes
+        increment (float): Step between consecutive lines
+        pixels (int): Width and height of the image
+        margin (int): White border around the plot area in pixels, defaults to 5% of the image
+        line_intensity (float): Coverage of a line (1.0 is a crisp 1px line)
+        marker_radius (float): Radius of the first/last line markers in pixels,
+            defaults to 5.2 scaled with the image size
+        segments (numpy.ndarray): Precomputed envelope_segments, optional
+        row_range (tuple): Only render image rows [start, stop), optional
+
+    Returns:
+        tuple: (rgba uint8 array, list of lines per family)
+    """
+    scene = EnvelopeScene(size, increment, pixels, margin, line_intensity, marker_radius, segments)
+    rgba = scene.render_rows(*(row_range or (0, pixels)))
+    return rgba, scene.line_counts
+
+
+def render_envelope_png(size, increment, filename='line_output.png', pixels=1200, margin=None,
+                        tile_rows=None, workers=1):
+    """
+    Render the line.py pattern to a PNG without matplotlib or a display.
+
+    The image is rendered and written in bands of tile_rows rows, so even
+    poster sized outputs (20000 x 20000 pixels) only ever hold one band per
+    worker in memory.
+
+    Args:
+        size (float): Length of the axes
+        increment (float): Step between consecutive lines
+        filename (str): Output PNG path
+        pixels (int): Width and height of the image
+        margin (int): White border in pixels, defaults to 5% of the image
+        tile_rows (int): Rows per band, defaults to TILE_PIXELS worth of rows
+        workers (int): Processes rendering bands in parallel
+
+    Returns:
+        list: Number of lines drawn per family
+    """
+    with PngWriter(filename, pixels, pixels) as writer:
+        for band in render_bands((size, increment, pixels, margin), tile_rows, workers):
+            writer.write_rows(band)
+    return [lines_per_family(size, increment)] * len(FAMILY_NAMES)
+
+
+def main():
+    # Ask user for inputs
+    size = float(input("Enter the size for the axes: "))
+    increment = float(input("Enter the increment: "))
+    pixels = input("Enter the image size in pixels (default 1200): ").strip()
+    pixels = int(pixels) if pixels else 1200
+
+    filename = 'line_output.png'
+    key = pattern_key('line-raster', size, increment, pixels=pixels)
+    cached, _ = RenderCache().get_or_render(
+        key, filename, lambda path: render_envelope_png(size, increment, path, pixels=pixels,
+                                                        workers=os.cpu_count() or 1))
+    line_counts = [lines_per_family(size, increment)] * len(FAMILY_NAMES)
+    for name, count in zip(FAMILY_NAMES, line_counts):
+        print(f"Drew {count} lines in {name} set")
+    print(f"Total: {sum(line_counts)} lines")
+    print(f"\nLine visualization saved to {filename}" + (" (from the render cache)" if cached else ""))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+import numpy as np
+from matplotlib.collections import LineCollection
+
+from line_geometry import FAMILY_COLORS, marker_points, split_families
+
+
+def draw_envelope(ax, segments, linewidth=0.5, markersize=5):
+    """
+    Add the four envelope line families to an axes.
+
+    Each family becomes a single LineCollection and all first/last line
+    markers share one scatter, so the artist count stays at five no matter
+    how many lines there are.
+
+    Args:
+        ax: Matplotlib axes to draw on
+        segments (numpy.ndarray): (4 * n, 2, 2) array from envelope_segments
+        linewidth (float): Line width in points
+        markersize (float): Marker diameter in points, as in ax.plot
+
+    Returns:
+        list: Number of lines drawn per family
+    """
+    line_counts = []
+    marker_xy = []
+    marker_colors = []
+
+    for family, color in zip(split_families(segments), FAMILY_COLORS):
+        ax.add_collection(LineCollection(family, colors=color, linewidths=linewidth, zorder=2))
+
+        points = marker_points(family)
+        marker_xy.append(points)
+        marker_colors.extend([color] * len(points))
+        line_counts.append(len(family))
+
+    marker_xy = np.concatenate(marker_xy)
+    if len(marker_xy):
+        # scatter sizes are areas in points^2
+        ax.scatter(marker_xy[:, 0], marker_xy[:, 1], s=markersize ** 2, c=marker_colors, zorder=3)
+
+    return line_counts
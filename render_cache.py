@@ -0,0 +1,200 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+
+# Bump a pattern's version whenever its drawing code changes, so images
+# rendered by the old code are no longer served from the cache
+RENDERER_VERSIONS = {
+    'line': '2',
+    'circle': '2',
+    'line-raster': '2',
+    'circle-raster': '1',
+}
+
+# Patterns rasterized to a fixed pixel size rather than saved by matplotlib
+RASTER_PATTERNS = ('line-raster', 'circle-raster')
+
+# Width and height in inches of a figure; raster patterns render the same
+# number of pixels as matplotlib would at the requested dpi
+FIGURE_INCHES = 8
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'line_renders')
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# Eviction trims the cache to this share of max_bytes, so a full cache is
+# not scanned again on every store
+EVICT_TO = 0.9
+
+
+def render_key(pattern, size, increment, **options):
+    """
+    Content address of a render: a SHA-256 over the pattern, its renderer
+    version, the parameters and any style options (dpi, pixels, ...).
+    """
+    description = {
+        'pattern': pattern,
+        'version': RENDERER_VERSIONS.get(pattern, '0'),
+        'size': repr(float(size)),
+        'increment': repr(float(increment)),
+        'options': options,
+    }
+    encoded = json.dumps(description, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def pattern_key(pattern, size, increment, dpi=150, pixels=None):
+    """
+    render_key of one image as the tools render it, so every entry point
+    shares cache entries: matplotlib patterns are keyed by dpi, raster
+    patterns by their pixel size (FIGURE_INCHES * dpi unless given).
+    """
+    if pattern in RASTER_PATTERNS:
+        return render_key(pattern, size, increment, pixels=pixels or FIGURE_INCHES * dpi)
+    return render_key(pattern, size, increment, dpi=dpi)
+
+
+class RenderCache:
+    """
+    Size-bounded on-disk cache of rendered PNG files.
+
+    Entries are named after their render_key. A hit refreshes the file's
+    modification time, and when the cache grows past max_bytes the least
+    recently used files are removed, so several processes can share one
+    cache directory without a separate index.
+
+    Each instance keeps a running total of the cache size. The directory is
+    only scanned on the first store and when the total passes max_bytes, so
+    files added by other processes are counted at the next eviction.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        # Bytes on disk as of the last scan plus what this instance stored
+        self._total = None
+        os.makedirs(directory, exist_ok=True)
+
+    def path_for(self, key):
+        return os.path.join(self.directory, key + '.png')
+
+    def lookup(self, key):
+        """Path of the cached PNG, or None. Counts a hit or a miss."""
+        path = self.path_for(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return path
+
+    def store(self, key, source):
+        """Copy a rendered PNG into the cache and evict if over budget"""
+        path = self.path_for(key)
+        temp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        shutil.copyfile(source, temp_path)
+        added = os.path.getsize(temp_path)
+        try:
+            added -= os.path.getsize(path)
+        except FileNotFoundError:
+            pass
+        os.replace(temp_path, path)
+        with self._lock:
+            if self._total is not None:
+                self._total += added
+            over = self._total is None or self._total > self.max_bytes
+        if over:
+            self.evict()
+        return path
+
+    def get_or_render(self, key, output_path, render):
+        """
+        Write the image for key to output_path, from the cache when possible.
+
+        Args:
+            key (str): render_key of the image
+            output_path (str): Where the PNG should end up
+            render (callable): Called with output_path on a miss, must
+                write the PNG there and may return a value
+
+        Returns:
+            tuple: (hit, value returned by render or None on a hit)
+        """
+        cached = self.lookup(key)
+        if cached:
+            try:
+                shutil.copyfile(cached, output_path)
+                return True, None
+            except FileNotFoundError:
+                # Evicted by another process after the lookup
+                with self._lock:
+                    self.hits -= 1
+                    self.misses += 1
+
+        value = render(output_path)
+        self.store(key, output_path)
+        return False, value
+
+    def entries(self):
+        """(mtime, size, path) of every cached file, oldest first"""
+        found = []
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                if not entry.name.endswith('.png'):
+                    continue
+                try:
+                    info = entry.stat()
+                except FileNotFoundError:
+                    continue
+                found.append((info.st_mtime, info.st_size, entry.path))
+        found.sort()
+        return found
+
+    def evict(self):
+        """
+        Remove least recently used files once the cache is over max_bytes,
+        until it is down to EVICT_TO of it
+        """
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        limit = self.max_bytes * EVICT_TO if total > self.max_bytes else self.max_bytes
+        for _, size, path in entries:
+            if total <= limit:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            with self._lock:
+                self.evictions += 1
+        with self._lock:
+            self._total = total
+
+    def clear(self):
+        for _, _, path in self.entries():
+            os.remove(path)
+        with self._lock:
+            self._total = 0
+
+    def stats(self):
+        """Hit/miss counters of this instance plus the current disk usage"""
+        entries = self.entries()
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'entries': len(entries),
+            'bytes': sum(size for _, size, _ in entries),
+            'max_bytes': self.max_bytes,
+        }
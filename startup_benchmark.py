@@ -0,0 +1,204 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Module each GUI tool starts from, and code that opens its first window
+TOOLS = {
+    'line_calculator_integrated': (
+        "import tkinter as tk, line_calculator_integrated as tool\n"
+        "root = tk.Tk()\n"
+        "tool.LineWorkflow(root, 10, 0.1, stages=('calculator',))\n"
+        "root.update()"
+    ),
+    'file_encryptor': (
+        "import file_encryptor as tool\n"
+        "tool.FileEncryptorDecryptor().root.update()"
+    ),
+    'secret_key_generator': (
+        "import secret_key_generator as tool\n"
+        "tool.SecretKeyGenerator().root.update()"
+    ),
+    'calculator': (
+        "import tkinter as tk, calculator as tool\n"
+        "root = tk.Tk()\n"
+        "tool.Calculator(root)\n"
+        "root.update()"
+    ),
+}
+
+# Marker the first-window snippet prints once the window has painted
+READY = 'STARTUP-READY'
+
+
+def _environment():
+    env = dict(os.environ)
+    paths = [ROOT, os.path.join(ROOT, 'calculator-app')]
+    if env.get('PYTHONPATH'):
+        paths.append(env['PYTHONPATH'])
+    env['PYTHONPATH'] = os.pathsep.join(paths)
+    return env
+
+
+def parse_importtime(stderr):
+    """
+    Parse the report of python -X importtime.
+
+    Each line looks like "import time:   self |   cumulative | name", with
+    the name indented by two spaces per nesting level.
+
+    Returns:
+        list: dicts with module, self_us, cumulative_us and depth, in report order
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # the header line
+        name = fields[2].rstrip()
+        stripped = name.lstrip()
+        entries.append({
+            'module': stripped,
+            'self_us': int(fields[0]),
+            'cumulative_us': int(fields[1]),
+            'depth': (len(name) - len(stripped) - 1) // 2,
+        })
+    return entries
+
+
+def measure_imports(module):
+    """
+    Import a module in a fresh interpreter under -X importtime.
+
+    Returns:
+        dict: total_ms (the module's cumulative import time) and entries
+    """
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT, env=_environment(), capture_output=True, text=True)
+    if completed.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{completed.stderr.strip().splitlines()[-1]}")
+
+    entries = parse_importtime(completed.stderr)
+    top = [entry for entry in entries if entry['module'] == module]
+    total_us = top[-1]['cumulative_us'] if top else 0
+    return {'total_ms': total_us / 1000, 'entries': entries}
+
+
+def measure_first_window(snippet, timeout=60):
+    """
+    Wall clock seconds from launching a fresh interpreter until the tool's
+    first window has been painted. Needs a display.
+    """
+    code = f"{snippet}\nprint({READY!r}, flush=True)\nimport os\nos._exit(0)"
+    started = time.perf_counter()
+    process = subprocess.Popen([sys.executable, '-c', code], cwd=ROOT, env=_environment(),
+                               stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    try:
+        for line in process.stdout:
+            if line.strip() == READY:
+                return time.perf_counter() - started
+        error = process.stderr.read().strip().splitlines()
+        raise RuntimeError(error[-1] if error else "Tool exited before showing a window")
+    finally:
+        process.kill()
+        process.wait(timeout)
+
+
+def slowest_imports(entries, count):
+    """Modules with the largest self time, i.e. the imports worth deferring"""
+    return sorted(entries, key=lambda entry: entry['self_us'], reverse=True)[:count]
+
+
+def run_benchmark(tools, repeat=3, first_window=False):
+    """
+    Measure every tool, keeping the best of repeat runs.
+
+    Returns:
+        dict: Per tool import_ms, slowest imports and optionally first_window_s
+    """
+    results = {}
+    for tool in tools:
+        runs = [measure_imports(tool) for _ in range(repeat)]
+        best = min(runs, key=lambda run: run['total_ms'])
+        result = {
+            'import_ms': round(best['total_ms'], 1),
+            'slowest': [(entry['module'], round(entry['self_us'] / 1000, 1))
+                        for entry in slowest_imports(best['entries'], 5)],
+        }
+        if first_window:
+            result['first_window_s'] = round(min(measure_first_window(TOOLS[tool]) for _ in range(repeat)), 3)
+        results[tool] = result
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """
+    Regressions against a baseline: measurements more than tolerance
+    (a fraction) slower than the recorded value.
+
+    Returns:
+        list: Messages, empty when nothing regressed
+    """
+    regressions = []
+    for tool, result in results.items():
+        for metric in ('import_ms', 'first_window_s'):
+            before = baseline.get(tool, {}).get(metric)
+            now = result.get(metric)
+            if before and now is not None and now > before * (1 + tolerance):
+                regressions.append(f"{tool} {metric}: {before} -> {now} (+{(now / before - 1) * 100:.0f}%)")
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Measure startup time of the GUI tools.")
+    parser.add_argument('tools', nargs='*', metavar='TOOL',
+                        help=f"Tools to measure: {', '.join(TOOLS)} (default: all)")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per tool, the best one counts")
+    parser.add_argument('--first-window', action='store_true',
+                        help="Also time until the first window is painted (needs a display)")
+    parser.add_argument('--save', metavar='JSON', help="Write the results to a baseline file")
+    parser.add_argument('--baseline', metavar='JSON', help="Fail when slower than this baseline")
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help="Allowed slowdown against the baseline (default: 0.2 = 20%%)")
+    args = parser.parse_args(argv)
+    unknown = [tool for tool in args.tools if tool not in TOOLS]
+    if unknown:
+        parser.error(f"unknown tool: {', '.join(unknown)}")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    results = run_benchmark(args.tools or list(TOOLS), args.repeat, args.first_window)
+
+    for tool, result in results.items():
+        window = f", first window {result['first_window_s']:.3f}s" if 'first_window_s' in result else ''
+        print(f"{tool}: imports {result['import_ms']:.1f} ms{window}")
+        for module, milliseconds in result['slowest']:
+            print(f"    {milliseconds:8.1f} ms  {module}")
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults saved to {args.save}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print("\nStartup regressions:")
+            for message in regressions:
+                print(f"  {message}")
+            return 1
+        print("\nNo startup regressions")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "SQ_Chip_CFG"))
+
+import Burn_SQ_CT_Series as burn
+
+
+class FakeControl:
+    """Stand-in for a pywinauto UIA wrapper"""
+
+    def __init__(self, control_type, left, top, right, bottom, text="", children=()):
+        self.element_info = SimpleNamespace(control_type=control_type)
+        self.text = text
+        self.rect = SimpleNamespace(left=left, top=top, right=right, bottom=bottom)
+        self.children = list(children)
+
+    def window_text(self):
+        return self.text
+
+    def rectangle(self):
+        return self.rect
+
+    def descendants(self, control_type=None):
+        return [child for child in self.children
+                if control_type is None or child.element_info.control_type == control_type]
+
+
+class FakeWindow:
+    """BurnScc-like form, optionally moved on screen by (dx, dy)"""
+
+    def __init__(self, dx=0, dy=0):
+        def at(control_type, left, top, right, bottom, text="", children=()):
+            return FakeControl(control_type, left + dx, top + dy, right + dx, bottom + dy, text, children)
+
+        self.ip_edit = at("Edit", 120, 10, 300, 30)
+        self.file_edit = at("Edit", 120, 50, 300, 70)
+        self.log_edit = at("Edit", 120, 90, 300, 110)
+        self.combo_edit = FakeControl("Edit", 122 + dx, 132 + dy, 280 + dx, 148 + dy)
+        self.combo = at("ComboBox", 120, 130, 300, 150, children=[self.combo_edit])
+        self.controls = [
+            at("Text", 10, 10, 100, 30, "IP Address:"),
+            self.ip_edit,
+            at("Text", 10, 50, 100, 70, "Full path for the file name"),
+            self.file_edit,
+            at("Text", 10, 90, 100, 110, "Log file name"),
+            self.log_edit,
+            at("Text", 10, 130, 100, 150, "Chip  Type:"),
+            self.combo,
+            at("Button", 10, 200, 100, 220, "Burn"),
+        ]
+        self.walks = 0
+
+    def descendants(self):
+        self.walks += 1
+        return list(self.controls)
+
+
+def _fresh_caches():
+    burn._CONTROL_MAPS.clear()
+    burn._LAYOUT_RESOLUTIONS.clear()
+
+
+def test_snapshot_resolves_labels():
+    _fresh_caches()
+    window = FakeWindow()
+    control_map = burn.BurnControlMap.from_window(window)
+
+    assert len(control_map.labels) == 4
+    assert len(control_map.edits) == 3
+    assert len(control_map.combos) == 1
+    assert control_map.find_edit_for_label(r"IP Address") is window.ip_edit
+    assert control_map.find_edit_for_file_name_field() is window.file_edit
+    assert control_map.find_edit_candidates_for_exact_label("chip type")[0] is window.combo_edit
+    assert control_map.find_edit_for_label(r"Serial") is None
+
+
+def test_window_walked_once():
+    _fresh_caches()
+    window = FakeWindow()
+    assert burn._find_edit_for_label(window, r"IP Address") is window.ip_edit
+    assert burn._find_edit_for_file_name_field(window) is window.file_edit
+    assert burn._find_edit_for_exact_label(window, "Chip Type") is window.combo_edit
+    assert window.walks == 1
+
+    burn._get_control_map(window, refresh=True)
+    assert window.walks == 2
+    burn._release_control_map(window)
+    assert id(window) not in burn._CONTROL_MAPS
+
+
+def test_layout_cache_shared_by_moved_window():
+    _fresh_caches()
+    first = burn.BurnControlMap.from_window(FakeWindow())
+    assert first.find_edit_for_label(r"IP Address") is not None
+
+    moved_window = FakeWindow(dx=400, dy=250)
+    moved = burn.BurnControlMap.from_window(moved_window)
+    assert moved.layout_key == first.layout_key
+
+    def no_geometry(label):
+        raise AssertionError("resolved again instead of from the layout cache")
+
+    moved._nearest_edit_slot = no_geometry
+    # Same slot, but the control of the moved window
+    assert moved.find_edit_for_label(r"IP Address") is moved_window.ip_edit
+
+
+def test_layout_cache_keyed_by_layout():
+    _fresh_caches()
+    first = burn.BurnControlMap.from_window(FakeWindow())
+    first.find_edit_for_label(r"IP Address")
+
+    other_window = FakeWindow()
+    other_window.controls[0].text = "Station IP Address:"
+    other = burn.BurnControlMap.from_window(other_window)
+    assert other.layout_key != first.layout_key
+    assert other.find_edit_for_label(r"IP Address") is other_window.ip_edit
+    assert len(burn._LAYOUT_RESOLUTIONS) == 2
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name}: OK")
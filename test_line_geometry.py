@@ -0,0 +1,62 @@
+import pytest
+
+from line_geometry import (
+    check_line_counts,
+    count_lines_brute_force,
+    envelope_segments,
+    lines_per_family,
+    predict_line_count,
+)
+
+
+def _assert_matches_loops(size, increment, expected):
+    assert lines_per_family(size, increment) == expected
+    assert count_lines_brute_force(size, increment) == [expected] * 4
+    assert predict_line_count(size, increment) == 4 * expected
+
+
+def test_random_inputs_match_brute_force():
+    assert check_line_counts(samples=1000, seed=38) == []
+
+
+def test_size_one_draws_one_line_per_family():
+    _assert_matches_loops(1, 0.1, 1)
+    _assert_matches_loops(1, 5, 1)
+
+
+def test_size_below_one_draws_nothing():
+    _assert_matches_loops(0.5, 0.1, 0)
+    _assert_matches_loops(0, 1, 0)
+
+
+def test_increment_larger_than_span():
+    _assert_matches_loops(5, 4.5, 1)
+    _assert_matches_loops(5, 10, 1)
+    _assert_matches_loops(5, 4, 2)
+
+
+def test_tenth_steps_do_not_drift():
+    # Summing 0.1 in floats overshoots or undershoots these boundaries
+    _assert_matches_loops(10, 0.1, 91)
+    _assert_matches_loops(1.3, 0.1, 4)
+    _assert_matches_loops(1.7, 0.1, 8)
+    _assert_matches_loops(2, 0.1, 11)
+    _assert_matches_loops(4, 0.3, 11)
+
+
+def test_segments_follow_the_count():
+    assert len(envelope_segments(10, 0.1)) == predict_line_count(10, 0.1)
+    assert len(envelope_segments(0.5, 0.1)) == 0
+
+
+def test_non_positive_increment_rejected():
+    with pytest.raises(ValueError):
+        lines_per_family(10, 0)
+    with pytest.raises(ValueError):
+        count_lines_brute_force(10, -0.1)
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name}: OK")